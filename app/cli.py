@@ -0,0 +1,465 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Modo de linha de comando (não interativo) da aplicação, para execução por
+scripts, cron e benchmarks. Cada subcomando carrega o grafo, executa uma
+operação e escreve o resultado em JSON na saída padrão, sem pausas e sem
+exibir a matriz de adjacência. Os logs vão para a saída de erro e, por
+padrão, apenas avisos e erros são exibidos.
+
+Exemplos:
+    python -m app.cli load app/data/grafo.txt
+    python -m app.cli convert app/data/grafo.txt app/data/grafo.bin
+    python -m app.cli components app/data/grafo.txt
+    python -m app.cli shortest-path app/data/grafo.txt "1984" "The Hobbit"
+    python -m app.cli recommend app/data/grafo.txt "Pride and Prejudice" -k 5
+    python -m app.cli centrality app/data/grafo.txt --medida proximidade -k 5
+    python -m app.cli sparsify app/data/grafo.txt grafo_top5.txt --metodo topk -k 5
+    python -m app.cli reduce app/data/grafo.txt --limiar 10 --ponderado soma
+    python -m app.cli communities app/data/grafo.txt --metodo propagacao
+    python -m app.cli reduce app/data/grafo.txt --agrupamento louvain --ponderado soma
+    python -m app.cli batch operacoes.txt --grafo app/data/grafo.txt
+
+No modo batch, cada linha do arquivo de operações é um subcomando (sem o
+caminho do grafo, que fica carregado em memória entre as operações), e há
+também operações de alteração e gravação:
+
+    load app/data/grafo.txt
+    insert-vertex "Dom Casmurro"
+    insert-edge 3 50 2
+    remove-edge 3 7
+    remove-vertex 12
+    undo
+    components
+    save app/data/grafo_novo.txt
+    save-delta
+
+`undo`/`redo` desfazem e refazem alterações; `save-delta` grava apenas as
+alterações feitas desde a última gravação, ao lado do último arquivo lido
+ou gravado (ex.: grafo_novo.txt.delta). Consultas repetidas entre duas
+alterações são respondidas pelo cache do grafo; `cache-stats` mostra os
+acertos e falhas do cache.
+
+Linhas vazias e iniciadas por # são ignoradas. O resultado de cada operação
+é uma linha JSON.
+"""
+
+import argparse
+import json
+import shlex
+import sys
+
+from pathlib import Path
+from time import perf_counter
+
+from loguru import logger
+
+try:
+    from app.utils.classes.armazenamento import ARMAZENAMENTOS, TIPO_PESO_PADRAO, TIPOS_PESO
+    from app.utils.classes.caminhos import INFINITO
+    from app.utils.classes.centralidade import mais_centrais
+    from app.utils.classes.grafo_nd import TGrafoND
+    from app.utils.classes.instrumentacao import METRICAS, define_silencioso
+except ModuleNotFoundError:
+    from utils.classes.armazenamento import ARMAZENAMENTOS, TIPO_PESO_PADRAO, TIPOS_PESO
+    from utils.classes.caminhos import INFINITO
+    from utils.classes.centralidade import mais_centrais
+    from utils.classes.grafo_nd import TGrafoND
+    from utils.classes.instrumentacao import METRICAS, define_silencioso
+
+# PRIMEIROS BYTES DE UM ARQUIVO NO FORMATO BINÁRIO
+ASSINATURA_BINARIO = b"BKGR"
+
+
+def carrega_grafo(arquivo: str, armazenamento: str = "esparso", tipo_peso: str = TIPO_PESO_PADRAO) -> TGrafoND:
+    """
+    CARREGA O GRAFO DE UM ARQUIVO TXT OU BINÁRIO (DETECTADO PELA ASSINATURA).
+    O TIPO DOS PESOS VALE PARA O TXT (O BINÁRIO GUARDA O SEU PRÓPRIO TIPO).
+
+    Raises:
+        FileNotFoundError: SE O ARQUIVO NÃO EXISTE.
+        ValueError: SE O ARQUIVO NÃO PÔDE SER CARREGADO (O MOTIVO VAI PARA O LOG).
+    """
+    if not Path(arquivo).is_file():
+        raise FileNotFoundError(f"O arquivo {arquivo} não foi encontrado.")
+
+    grafo = TGrafoND(armazenamento=armazenamento, tipo_peso=tipo_peso)
+    with open(arquivo, "rb") as f:
+        binario = f.read(len(ASSINATURA_BINARIO)) == ASSINATURA_BINARIO
+    carregado = grafo.abreBinario(arquivo) if binario else grafo.leArquivo(arquivo, imprimir=False)
+    if not carregado:
+        raise ValueError(f"ERRO AO CARREGAR O GRAFO DO ARQUIVO {arquivo}.")
+    return grafo
+
+
+def grava_grafo(grafo: TGrafoND, arquivo: str):
+    """
+    GRAVA EM TXT SE A EXTENSÃO FOR .txt; CASO CONTRÁRIO, NO FORMATO BINÁRIO.
+
+    Raises:
+        ValueError: SE O ARQUIVO NÃO PÔDE SER GRAVADO (O MOTIVO VAI PARA O LOG).
+    """
+    gravado = grafo.gravarGrafo(arquivo) if arquivo.endswith(".txt") else grafo.gravarBinario(arquivo)
+    if not gravado:
+        raise ValueError(f"ERRO AO GRAVAR O GRAFO NO ARQUIVO {arquivo}.")
+
+
+def descreve(grafo: TGrafoND, vertice: int) -> dict:
+    return {"vertice": vertice, "titulo": grafo.livros.get(vertice, "")}
+
+
+# OPERAÇÕES: CADA UMA RECEBE O GRAFO E OS ARGUMENTOS E RETORNA UM DICIONÁRIO SERIALIZÁVEL
+
+
+def op_load(grafo, args):
+    return grafo.estatisticasGraus()
+
+
+def op_convert(grafo, args):
+    inicio = perf_counter()
+    grava_grafo(grafo, args.saida)
+    return {"saida": args.saida, "segundos": perf_counter() - inicio}
+
+
+def op_components(grafo, args):
+    componentes = sorted(grafo.componentesConectadas(), key=len, reverse=True)
+    resultado = {
+        "conexo": len(componentes) <= 1,
+        "componentes": len(componentes),
+        "tamanhos": [len(c) for c in componentes],
+    }
+    if args.listar:
+        resultado["vertices"] = [sorted(c) for c in componentes]
+    return resultado
+
+
+def op_communities(grafo, args):
+    comunidades = grafo.comunidades(args.metodo, resolucao=args.resolucao, semente=args.semente)
+    resultado = {
+        "metodo": args.metodo,
+        "comunidades": len(comunidades),
+        "tamanhos": [len(c) for c in comunidades],
+    }
+    if args.listar:
+        resultado["vertices"] = [sorted(c) for c in comunidades]
+    return resultado
+
+
+def op_reduce(grafo, args):
+    componentes, reduzido = grafo.calculaGrafoReduzido(args.ponderado, args.limiar, args.agrupamento)
+    return {
+        "vertices": len(reduzido),
+        "tamanhos": [len(componente) for componente in componentes],
+        "arestas": [
+            [i, j, peso] if args.ponderado else [i, j]
+            for i, linha in enumerate(reduzido)
+            for j, peso in enumerate(linha)
+            if i < j and peso
+        ],
+    }
+
+
+def op_sparsify(grafo, args):
+    arestas = sum(1 for _ in grafo.grafo.arestas())
+    esparso = grafo.esparsifica(args.metodo, limiar=args.limiar, k=args.k)
+    grava_grafo(esparso, args.saida)
+    return {
+        "metodo": args.metodo,
+        "arestas_antes": arestas,
+        "arestas_depois": sum(1 for _ in esparso.grafo.arestas()),
+        "saida": args.saida,
+    }
+
+
+def op_shortest_path(grafo, args):
+    origem, destino = grafo.localizaLivro(args.origem), grafo.localizaLivro(args.destino)
+    distancia, caminho = grafo.menorCaminho(origem, destino, transformacao=args.transformacao)
+    return {
+        "origem": origem,
+        "destino": destino,
+        "distancia": None if distancia == INFINITO else distancia,
+        "caminho": [descreve(grafo, v) for v in caminho],
+    }
+
+
+def op_recommend(grafo, args):
+    vertice = grafo.localizaLivro(args.livro)
+    recomendados = grafo.recomenda(vertice, k=args.k, dois_saltos=args.dois_saltos)
+    return {
+        "livro": descreve(grafo, vertice),
+        "recomendacoes": [{**descreve(grafo, v), "peso": peso} for v, peso in recomendados],
+    }
+
+
+def op_centrality(grafo, args):
+    centralidades = grafo.centralidade(
+        args.medida, transformacao=args.transformacao, amostras=args.amostras, processos=args.processos
+    )
+    return {
+        "medida": args.medida,
+        "amostras": args.amostras,
+        "mais_centrais": [{**descreve(grafo, v), "centralidade": c} for v, c in mais_centrais(centralidades, args.k)],
+    }
+
+
+def op_search(grafo, args):
+    return {"resultados": [descreve(grafo, v) for v, _ in grafo.buscaLivro(args.consulta, args.limite)]}
+
+
+def op_insert_vertex(grafo, args):
+    return {"vertice": grafo.insereVertice(args.titulo)}
+
+
+def op_insert_edge(grafo, args):
+    origem = grafo.localizaLivro(args.origem, estrito=True)
+    destino = grafo.localizaLivro(args.destino, estrito=True)
+    if not grafo.insereAresta(origem, destino, args.peso):
+        raise ValueError(f"ERRO AO INSERIR A ARESTA ENTRE OS VÉRTICES {origem} E {destino}.")
+    return {"origem": origem, "destino": destino, "peso": args.peso}
+
+
+def op_remove_vertex(grafo, args):
+    vertice = grafo.localizaLivro(args.livro, estrito=True)
+    grafo.removeVertice(vertice)
+    return {"vertice": vertice}
+
+
+def op_remove_edge(grafo, args):
+    origem = grafo.localizaLivro(args.origem, estrito=True)
+    destino = grafo.localizaLivro(args.destino, estrito=True)
+    if not grafo.removeAresta(origem, destino):
+        raise ValueError(f"NÃO HÁ ARESTA ENTRE OS VÉRTICES {origem} E {destino}.")
+    return {"origem": origem, "destino": destino}
+
+
+def op_save(grafo, args):
+    grava_grafo(grafo, args.arquivo)
+    return {"arquivo": args.arquivo}
+
+
+def op_save_delta(grafo, args):
+    grafo.gravarDelta(args.arquivo)
+    return {"arquivo": args.arquivo or grafo.arquivo_base}
+
+
+def op_cache_stats(grafo, args):
+    return grafo.estatisticasCache()
+
+
+def op_undo(grafo, args):
+    return {"desfeita": grafo.desfazer(), "versao": grafo.snapshot()}
+
+
+def op_redo(grafo, args):
+    return {"refeita": grafo.refazer(), "versao": grafo.snapshot()}
+
+
+def adiciona_operacoes(subparsers, com_grafo: bool):
+    """
+    REGISTRA AS OPERAÇÕES DE CONSULTA. NA LINHA DE COMANDO (com_grafo=True) CADA
+    UMA RECEBE O ARQUIVO DO GRAFO; NO MODO BATCH O GRAFO JÁ ESTÁ CARREGADO.
+    """
+
+    def operacao(nome, funcao, ajuda):
+        parser = subparsers.add_parser(nome, help=ajuda)
+        if com_grafo:
+            parser.add_argument("grafo", help="arquivo do grafo (TXT ou binário)")
+        parser.set_defaults(funcao=funcao)
+        return parser
+
+    parser = operacao("load", op_load, "carrega o grafo e mostra estatísticas")
+    if not com_grafo:
+        parser.add_argument("arquivo", help="arquivo do grafo (TXT ou binário)")
+    parser = operacao("convert", op_convert, "converte o grafo (saída .txt = TXT, outra = binário)")
+    parser.add_argument("saida")
+    parser = operacao("components", op_components, "componentes conectadas")
+    parser.add_argument("--listar", action="store_true", help="inclui os vértices de cada componente")
+    parser = operacao("communities", op_communities, "comunidades (agrupamentos de gêneros)")
+    parser.add_argument("--metodo", default="louvain", choices=["louvain", "propagacao"])
+    parser.add_argument("--resolucao", type=float, default=1.0, help="maior = comunidades menores (louvain)")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--listar", action="store_true", help="inclui os vértices de cada comunidade")
+    parser = operacao("reduce", op_reduce, "grafo reduzido (uma componente por vértice)")
+    parser.add_argument("--ponderado", choices=["soma", "maximo"], help="agrega os pesos entre componentes")
+    parser.add_argument("--limiar", type=int, help="componentes considerando apenas arestas com peso >= limiar")
+    parser.add_argument(
+        "--agrupamento", choices=["louvain", "propagacao"], help="uma comunidade por vértice em vez de componente"
+    )
+    parser = operacao("sparsify", op_sparsify, "grava uma versão esparsa do grafo")
+    parser.add_argument("saida", help="arquivo de saída (.txt = TXT, outra = binário)")
+    parser.add_argument("--metodo", default="limiar", choices=["limiar", "topk", "floresta"])
+    parser.add_argument("--limiar", type=int, default=2)
+    parser.add_argument("-k", type=int, default=10)
+    parser = operacao("shortest-path", op_shortest_path, "menor caminho entre dois livros")
+    parser.add_argument("origem", help="número do vértice ou título")
+    parser.add_argument("destino", help="número do vértice ou título")
+    parser.add_argument(
+        "--transformacao", default="inverso", choices=["inverso", "complemento", "log", "saltos"]
+    )
+    parser = operacao("recommend", op_recommend, "livros mais similares")
+    parser.add_argument("livro", help="número do vértice ou título")
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--dois-saltos", action="store_true")
+    parser = operacao("centrality", op_centrality, "livros mais centrais (hubs)")
+    parser.add_argument(
+        "--medida", default="intermediacao", choices=["grau", "forca", "proximidade", "intermediacao"]
+    )
+    parser.add_argument(
+        "--transformacao", default="inverso", choices=["inverso", "complemento", "log", "saltos"]
+    )
+    parser.add_argument("--amostras", type=int, help="origens sorteadas (aproximação para grafos grandes)")
+    parser.add_argument("--processos", type=int, help="padrão: número de CPUs")
+    parser.add_argument("-k", type=int, default=10)
+    parser = operacao("search", op_search, "busca livros pelo título")
+    parser.add_argument("consulta")
+    parser.add_argument("--limite", type=int, default=10)
+
+
+def parser_operacoes_batch() -> argparse.ArgumentParser:
+    """PARSER DE UMA LINHA DO ARQUIVO DE OPERAÇÕES DO MODO BATCH."""
+    parser = argparse.ArgumentParser(prog="operação", add_help=False, exit_on_error=False)
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+    adiciona_operacoes(subparsers, com_grafo=False)
+
+    # OPERAÇÕES QUE ALTERAM OU GRAVAM O GRAFO (APENAS NO MODO BATCH)
+    parser_op = subparsers.add_parser("save")
+    parser_op.add_argument("arquivo")
+    parser_op.set_defaults(funcao=op_save)
+
+    parser_op = subparsers.add_parser("save-delta")
+    parser_op.add_argument("arquivo", nargs="?", help="padrão: o último arquivo lido ou gravado")
+    parser_op.set_defaults(funcao=op_save_delta)
+
+    subparsers.add_parser("undo").set_defaults(funcao=op_undo)
+    subparsers.add_parser("redo").set_defaults(funcao=op_redo)
+    subparsers.add_parser("cache-stats").set_defaults(funcao=op_cache_stats)
+
+    parser_op = subparsers.add_parser("insert-vertex")
+    parser_op.add_argument("titulo", nargs="?")
+    parser_op.set_defaults(funcao=op_insert_vertex)
+
+    parser_op = subparsers.add_parser("insert-edge")
+    parser_op.add_argument("origem")
+    parser_op.add_argument("destino")
+    parser_op.add_argument("peso", type=int, nargs="?", default=1)
+    parser_op.set_defaults(funcao=op_insert_edge)
+
+    parser_op = subparsers.add_parser("remove-vertex")
+    parser_op.add_argument("livro")
+    parser_op.set_defaults(funcao=op_remove_vertex)
+
+    parser_op = subparsers.add_parser("remove-edge")
+    parser_op.add_argument("origem")
+    parser_op.add_argument("destino")
+    parser_op.set_defaults(funcao=op_remove_edge)
+    return parser
+
+
+def executa_batch(arquivo_operacoes: str, grafo: TGrafoND, armazenamento: str, parar_no_erro: bool) -> int:
+    """
+    EXECUTA O ARQUIVO DE OPERAÇÕES, ESCREVENDO UMA LINHA JSON POR OPERAÇÃO.
+
+    Returns:
+        int: CÓDIGO DE SAÍDA (0 SE TODAS AS OPERAÇÕES TIVERAM SUCESSO).
+    """
+    parser = parser_operacoes_batch()
+    codigo = 0
+    with open(arquivo_operacoes, "r") as f:
+        for numero, linha in enumerate(f, start=1):
+            linha = linha.strip()
+            if not linha or linha.startswith("#"):
+                continue
+
+            inicio = perf_counter()
+            try:
+                args = parser.parse_args(shlex.split(linha))
+                if args.comando == "load":
+                    grafo = carrega_grafo(args.arquivo, armazenamento, grafo.tipo_peso)
+                resultado = args.funcao(grafo, args)
+                saida = {"linha": numero, "operacao": args.comando, "resultado": resultado}
+            except (Exception, SystemExit) as erro:
+                codigo = 1
+                saida = {"linha": numero, "operacao": linha, "erro": str(erro)}
+
+            saida["segundos"] = perf_counter() - inicio
+            print(json.dumps(saida, ensure_ascii=False), flush=True)
+            if codigo and parar_no_erro:
+                break
+    return codigo
+
+
+def cria_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli",
+        description="Biblioteca Conectada - modo de linha de comando (saída em JSON).",
+    )
+    parser.add_argument("--armazenamento", default="esparso", choices=sorted(ARMAZENAMENTOS))
+    parser.add_argument(
+        "--tipo-peso",
+        default=TIPO_PESO_PADRAO,
+        choices=["auto", *TIPOS_PESO],
+        help="tipo dos pesos das arestas (ex.: uint8 = 1 byte por célula no armazenamento denso)",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="exibe todos os logs na saída de erro")
+    parser.add_argument("--metricas", help="grava as métricas por operação no formato do Prometheus")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+    adiciona_operacoes(subparsers, com_grafo=True)
+
+    parser_batch = subparsers.add_parser("batch", help="executa um arquivo de operações")
+    parser_batch.add_argument("operacoes", help="arquivo com uma operação por linha")
+    parser_batch.add_argument("--grafo", help="arquivo do grafo carregado antes das operações")
+    parser_batch.add_argument("--parar-no-erro", action="store_true")
+    return parser
+
+
+def executa_comando(args) -> int:
+    """EXECUTA O SUBCOMANDO JÁ INTERPRETADO, ESCREVENDO O RESULTADO EM JSON."""
+    try:
+        if args.comando == "batch":
+            grafo = (
+                carrega_grafo(args.grafo, args.armazenamento, args.tipo_peso)
+                if args.grafo
+                else TGrafoND(args.armazenamento, args.tipo_peso)
+            )
+            return executa_batch(args.operacoes, grafo, args.armazenamento, args.parar_no_erro)
+
+        inicio = perf_counter()
+        grafo = carrega_grafo(args.grafo, args.armazenamento, args.tipo_peso)
+        carga = perf_counter() - inicio
+        resultado = args.funcao(grafo, args)
+        saida = {
+            "operacao": args.comando,
+            "resultado": resultado,
+            "segundos_carga": carga,
+            "segundos": perf_counter() - inicio - carga,
+        }
+        print(json.dumps(saida, ensure_ascii=False))
+        return 0
+    except Exception as erro:
+        print(json.dumps({"operacao": args.comando, "erro": str(erro)}, ensure_ascii=False))
+        return 1
+
+
+def executa(argv=None) -> int:
+    """
+    PONTO DE ENTRADA DO MODO DE LINHA DE COMANDO.
+
+    Returns:
+        int: CÓDIGO DE SAÍDA DO PROCESSO.
+    """
+    args = cria_parser().parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if args.verbose else "WARNING")
+    define_silencioso(not args.verbose)
+
+    try:
+        return executa_comando(args)
+    finally:
+        if args.metricas:
+            METRICAS.gravaPrometheus(args.metricas)
+
+
+if __name__ == "__main__":
+    sys.exit(executa())
@@ -17,7 +17,6 @@ além de visualizar o grafo e suas características.
 
 import sys
 
-from time import sleep
 from pathlib import Path
 
 from loguru import logger
@@ -26,11 +25,32 @@ DIR_ROOT = str(Path(__file__).parents[1])
 sys.path.append(DIR_ROOT)
 
 try:
+    from app.cli import executa
     from app.utils.classes.grafo_nd import TGrafoND
 except ModuleNotFoundError:
+    from cli import executa
     from utils.classes.grafo_nd import TGrafoND
 
 
+def le_livro(graph_object: TGrafoND, mensagem: str, estrito: bool = False) -> int:
+    """LÊ UM LIVRO DIGITADO PELO USUÁRIO, PELO NÚMERO DO VÉRTICE OU PELO TÍTULO.
+
+    Args:
+        graph_object (TGrafoND): OBJETO DA CLASSE TGrafoND.
+        mensagem (str): TEXTO EXIBIDO AO PEDIR O LIVRO.
+        estrito (bool): SE True (OPÇÕES QUE ALTERAM O GRAFO), EXIGE UM VÉRTICE
+            EXISTENTE OU O TÍTULO EXATO DE UM ÚNICO LIVRO.
+
+    Returns:
+        int: O NÚMERO DO VÉRTICE DO LIVRO.
+    """
+    try:
+        return graph_object.localizaLivro(input(mensagem), estrito=estrito)
+    except ValueError as erro:
+        logger.info(str(erro))  # EXIBE OS CANDIDATOS ANTES DE VOLTAR AO MENU
+        raise
+
+
 def main(graph_object: TGrafoND):
     """FUNÇÃO PRINCIPAL DA APLICAÇÃO.
 
@@ -58,7 +78,14 @@ Escolha uma das opções abaixo:
 8) Mostrar grafo
 9) Apresentar a conexidade
 10) Apresentar o grafo reduzido
-11) Sair\n"""
+11) Menor caminho entre dois livros
+12) Recomendar livros semelhantes
+13) Buscar livro pelo título
+14) Resumo do grafo
+15) Desfazer última alteração
+16) Refazer alteração desfeita
+17) Gravar apenas as alterações (arquivo delta)
+18) Sair\n"""
         )
 
         # RECEBE A OPÇÃO ESCOLHIDA PELO USUÁRIO
@@ -80,16 +107,14 @@ Escolha uma das opções abaixo:
         elif opcao == "4":
             try:
                 # SOLICITA AO USUÁRIO AS INFORMAÇÕES NECESSÁRIAS PARA A INSERÇÃO DA ARESTA
-                v1 = int(input("INSIRA O VÉRTICE 1: "))
-                v2 = int(input("INSIRA O VÉRTICE 2: "))
+                v1 = le_livro(graph_object, "INSIRA O VÉRTICE OU O TÍTULO DO LIVRO 1: ", estrito=True)
+                v2 = le_livro(graph_object, "INSIRA O VÉRTICE OU O TÍTULO DO LIVRO 2: ", estrito=True)
                 peso = int(input("INSIRA O PESO DA ARESTA: "))
 
                 # CHAMA A FUNÇÃO PARA INSERIR A ARESTA COM OS PARÂMETROS RECEBIDOS
                 graph_object.insereAresta(
                     vertice_destino=v1, vertice_origem=v2, peso=peso
                 )
-                sleep(2)
-                graph_object.imprimeGrafo()  # IMPRIME O GRAFO ATUALIZADO
             except Exception:
                 logger.info(
                     "INPUT FORNECIDO INVÁLIDO, TENTE NOVAMENTE!"
@@ -99,13 +124,12 @@ Escolha uma das opções abaixo:
         # REMOVER UM VÉRTICE
         elif opcao == "5":
             try:
-                graph_object.imprimeRelacaoVertices()  # EXIBE A RELAÇÃO DE VÉRTICES EXISTENTES
-                v = int(input("INSIRA O NÚMERO DO VÉRTICE A SER REMOVIDO: "))
+                v = le_livro(
+                    graph_object, "INSIRA O VÉRTICE OU O TÍTULO DO LIVRO A SER REMOVIDO: ", estrito=True
+                )
 
                 # REMOVE O VÉRTICE SELECIONADO
                 graph_object.removeVertice(vertice=v)
-                sleep(2)
-                graph_object.imprimeGrafo()  # IMPRIME O GRAFO ATUALIZADO
             except Exception:
                 logger.info("INPUT FORNECIDO INVÁLIDO, TENTE NOVAMENTE!")
                 continue  # VOLTA AO MENU PRINCIPAL
@@ -114,21 +138,23 @@ Escolha uma das opções abaixo:
         elif opcao == "6":
             try:
                 # SOLICITA AO USUÁRIO AS INFORMAÇÕES DOS VÉRTICES DA ARESTA A SER REMOVIDA
-                v1 = int(input("INSIRA O VÉRTICE 1: "))
-                v2 = int(input("INSIRA O VÉRTICE 2: "))
+                v1 = le_livro(graph_object, "INSIRA O VÉRTICE OU O TÍTULO DO LIVRO 1: ", estrito=True)
+                v2 = le_livro(graph_object, "INSIRA O VÉRTICE OU O TÍTULO DO LIVRO 2: ", estrito=True)
                 # CHAMA A FUNÇÃO PARA REMOVER A ARESTA
                 graph_object.removeAresta(vertice_destino=v1, vertice_origem=v2)
             except Exception:
                 logger.info("INPUT FORNECIDO INVÁLIDO, TENTE NOVAMENTE!")
                 continue  # VOLTA AO MENU PRINCIPAL
 
-        # MOSTRAR CONTEÚDO DO ARQUIVO GRAFO.TXT
+        # MOSTRAR CONTEÚDO DO ARQUIVO GRAFO.TXT (UMA PÁGINA POR VEZ)
         elif opcao == "7":
-            graph_object.exibirGrafoVisual()
+            pagina = input("INSIRA A PÁGINA (ENTER = 0): ").strip()
+            graph_object.exibirGrafoVisual(pagina=int(pagina) if pagina.isdigit() else 0)
 
-        # MOSTRAR O GRAFO ATUAL
+        # MOSTRAR O GRAFO ATUAL (UMA JANELA DA MATRIZ DE ADJACÊNCIA)
         elif opcao == "8":
-            graph_object.imprimeGrafo()
+            inicio = input("INSIRA A POSIÇÃO INICIAL DA JANELA (ENTER = 0): ").strip()
+            graph_object.imprimeGrafo(linha_inicial=int(inicio) if inicio.isdigit() else 0)
 
         # APRESENTAR A CONEXIDADE DO GRAFO
         elif opcao == "9":
@@ -136,10 +162,75 @@ Escolha uma das opções abaixo:
 
         # APRESENTAR O GRAFO REDUZIDO
         elif opcao == "10":
-            graph_object.grafo_reduzido()
+            # SEM LIMIAR, O GRAFO DE LIVROS (QUASE COMPLETO) TEM UMA ÚNICA COMPONENTE
+            limiar = input("LIMIAR DE PESO DAS ARESTAS DAS COMPONENTES (ENTER = TODAS): ").strip()
+            ponderado = input("PESOS ENTRE COMPONENTES (soma/maximo, ENTER = 0/1): ").strip().lower()
+            agrupamento = input("AGRUPAR POR COMUNIDADES (louvain/propagacao, ENTER = COMPONENTES): ").strip().lower()
+            graph_object.grafo_reduzido(
+                ponderado=ponderado if ponderado in ("soma", "maximo") else None,
+                limiar=int(limiar) if limiar.isdigit() else None,
+                agrupamento=agrupamento if agrupamento in ("louvain", "propagacao") else None,
+            )
+
+        # MENOR CAMINHO ENTRE DOIS LIVROS
+        elif opcao == "11":
+            try:
+                # SOLICITA AO USUÁRIO OS VÉRTICES DE ORIGEM E DESTINO
+                v1 = le_livro(graph_object, "INSIRA O VÉRTICE OU O TÍTULO DO LIVRO DE ORIGEM: ")
+                v2 = le_livro(graph_object, "INSIRA O VÉRTICE OU O TÍTULO DO LIVRO DE DESTINO: ")
+
+                # PESOS MAIORES (MAIS GÊNEROS EM COMUM) VIRAM DISTÂNCIAS MENORES
+                _, caminho = graph_object.menorCaminho(origem=v1, destino=v2)
+                for vertice in caminho:
+                    print(f"{vertice} --> {graph_object.livros.get(vertice, '')}")
+            except Exception:
+                logger.info("INPUT FORNECIDO INVÁLIDO, TENTE NOVAMENTE!")
+                continue  # VOLTA AO MENU PRINCIPAL
+
+        # RECOMENDAR LIVROS SEMELHANTES
+        elif opcao == "12":
+            try:
+                # O LIVRO PODE SER INFORMADO PELO NÚMERO DO VÉRTICE OU PELO TÍTULO
+                livro = le_livro(graph_object, "INSIRA O VÉRTICE OU O TÍTULO DO LIVRO: ")
+                k = int(input("INSIRA O NÚMERO DE RECOMENDAÇÕES: "))
+                dois_saltos = input("INCLUIR APENAS LIVROS A DOIS SALTOS? (s/n): ").lower() == "s"
+
+                recomendados = graph_object.recomenda(livro, k=k, dois_saltos=dois_saltos)
+                if not recomendados:
+                    logger.info("NENHUM LIVRO SEMELHANTE ENCONTRADO.")
+                for vertice, pontuacao in recomendados:
+                    print(f"{vertice} --> {graph_object.livros.get(vertice, '')} (PESO {pontuacao})")
+            except Exception:
+                logger.info("INPUT FORNECIDO INVÁLIDO, TENTE NOVAMENTE!")
+                continue  # VOLTA AO MENU PRINCIPAL
+
+        # BUSCAR LIVRO PELO TÍTULO
+        elif opcao == "13":
+            consulta = input("INSIRA O TÍTULO (OU PARTE DO TÍTULO) DO LIVRO: ")
+            encontrados = graph_object.buscaLivro(consulta)
+            if not encontrados:
+                logger.info("NENHUM LIVRO ENCONTRADO.")
+            for vertice, nome in encontrados:
+                print(f"{vertice} --> {nome}")
+
+        # RESUMO DO GRAFO (GRAUS, PESOS, COMPONENTES E ARESTAS DE MAIOR PESO)
+        elif opcao == "14":
+            graph_object.exibeResumo()
+
+        # DESFAZER A ÚLTIMA ALTERAÇÃO (OPÇÕES 3 A 6)
+        elif opcao == "15":
+            graph_object.desfazer()
+
+        # REFAZER A ÚLTIMA ALTERAÇÃO DESFEITA
+        elif opcao == "16":
+            graph_object.refazer()
+
+        # GRAVAR SOMENTE AS ALTERAÇÕES, AO LADO DO ÚLTIMO ARQUIVO LIDO OU GRAVADO
+        elif opcao == "17":
+            graph_object.gravarDelta()
 
         # SAIR DO PROGRAMA
-        elif opcao == "11":
+        elif opcao == "18":
             logger.info("Saindo...")
             break
 
@@ -150,6 +241,11 @@ Escolha uma das opções abaixo:
 
 if __name__ == "__main__":
 
+    # COM ARGUMENTOS, EXECUTA O MODO DE LINHA DE COMANDO (SEM MENU, SAÍDA EM JSON)
+    # EX.: python app/main.py components app/data/grafo.txt
+    if len(sys.argv) > 1:
+        sys.exit(executa(sys.argv[1:]))
+
     # CRIA UM OBJETO DA CLASSE TGrafoND
     book_graph = TGrafoND()
 
@@ -0,0 +1,183 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Teste de estresse do acesso concorrente à `TGrafoND`. Várias threads fazem
+consultas (recomendações, conexidade, menor caminho e busca por título) sobre
+um grafo sintético enquanto outra thread insere e remove vértices e arestas
+sem parar. Ao final:
+
+    - nenhuma consulta ou alteração pode ter lançado exceção inesperada
+      (consultas a um vértice que acabou de ser removido são esperadas);
+    - os índices incrementais (componentes e k vizinhos mais similares)
+      devem coincidir com os de um grafo reconstruído do zero.
+
+Também é exibida a vazão das consultas para cada número de threads. No
+CPython com GIL, o código Python puro das consultas não roda em paralelo,
+mas as consultas não bloqueiam umas às outras; a vazão total deve se manter
+(e crescer em builds sem GIL). Uma rodada curta, com um escritor e a
+conferência dos índices, faz parte dos testes (tests/test_concorrencia.py).
+
+Uso:
+    python -m app.utils.benchmarks.estresse
+    python -m app.utils.benchmarks.estresse --vertices 20000 --threads 1 2 4 8 --segundos 3
+"""
+
+import argparse
+import random
+import sys
+import threading
+
+from time import perf_counter
+
+from loguru import logger
+
+from app.utils.benchmarks.gerador import gera_arestas
+from app.utils.classes.grafo_nd import TGrafoND
+from app.utils.classes.instrumentacao import define_silencioso
+
+GRAU_MEDIO = 10
+
+
+def cria_grafo(vertices: int, armazenamento: str = "esparso") -> TGrafoND:
+    grafo = TGrafoND(armazenamento=armazenamento)
+    for v in range(vertices):
+        grafo.insereVertice(f"Livro {v}")
+    grafo._insereArestasEmLote(
+        gera_arestas(vertices, min(1.0, GRAU_MEDIO / vertices), "geometrica", 5), registrar=False
+    )
+    return grafo
+
+
+def leitor(grafo: TGrafoND, semente: int, parar: threading.Event, contagem: list, erros: list):
+    """
+    EXECUTA CONSULTAS ALEATÓRIAS ATÉ `parar` SER SINALIZADO.
+    """
+    aleatorio = random.Random(semente)
+    consultas = 0
+    while not parar.is_set():
+        maximo = grafo._alocador.capacidade
+        v, w = aleatorio.randrange(maximo), aleatorio.randrange(maximo)
+        operacao = aleatorio.randrange(4)
+        try:
+            if operacao == 0:
+                grafo.recomenda(v, k=5)
+            elif operacao == 1:
+                grafo.tipo_conexidade()
+            elif operacao == 2:
+                grafo.menorCaminho(v, w)
+            else:
+                grafo.buscaLivro(f"Livro {v}")
+        except ValueError:
+            pass  # VÉRTICE REMOVIDO OU INEXISTENTE
+        except Exception as erro:
+            erros.append(f"CONSULTA {operacao}: {erro!r}")
+        consultas += 1
+    contagem.append(consultas)
+
+
+def escritor(grafo: TGrafoND, parar: threading.Event, contagem: list, erros: list):
+    """
+    INSERE E REMOVE VÉRTICES E ARESTAS ATÉ `parar` SER SINALIZADO.
+    """
+    aleatorio = random.Random(0)
+    novos = []
+    alteracoes = 0
+    while not parar.is_set():
+        try:
+            if novos and aleatorio.random() < 0.5:
+                grafo.removeVertice(novos.pop(aleatorio.randrange(len(novos))))
+            else:
+                vertice = grafo.insereVertice(f"Novo {alteracoes}")
+                novos.append(vertice)
+                for vizinho in aleatorio.sample(range(grafo._alocador.capacidade - 1), 3):
+                    if vizinho in grafo._alocador:
+                        grafo.insereAresta(vertice, vizinho, aleatorio.randint(1, 10))
+            alteracoes += 1
+        except Exception as erro:
+            erros.append(f"ALTERAÇÃO: {erro!r}")
+    contagem.append(alteracoes)
+
+
+def rodada(grafo: TGrafoND, threads: int, segundos: float, com_escritor: bool) -> tuple:
+    """
+    RODA `threads` LEITORES (E, OPCIONALMENTE, UM ESCRITOR) POR `segundos`.
+
+    Returns:
+        tuple: (CONSULTAS POR SEGUNDO, ALTERAÇÕES, ERROS).
+    """
+    parar = threading.Event()
+    consultas, alteracoes, erros = [], [], []
+    trabalhadores = [
+        threading.Thread(target=leitor, args=(grafo, semente, parar, consultas, erros))
+        for semente in range(threads)
+    ]
+    if com_escritor:
+        trabalhadores.append(threading.Thread(target=escritor, args=(grafo, parar, alteracoes, erros)))
+
+    inicio = perf_counter()
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    parar.wait(segundos)
+    parar.set()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+    duracao = perf_counter() - inicio
+    return sum(consultas) / duracao, sum(alteracoes), erros
+
+
+def verifica_indices(grafo: TGrafoND) -> list:
+    """
+    COMPARA OS ÍNDICES INCREMENTAIS DO GRAFO COM OS DE UMA CÓPIA RECONSTRUÍDA DO ZERO.
+    """
+    problemas = []
+    copia = TGrafoND(armazenamento="esparso")
+    ids = list(grafo._alocador.ids())
+    for vertice in ids:
+        copia.insereVertice(grafo.livros.get(vertice), vertice=vertice)
+    id_vertice = grafo._alocador.vertice
+    copia._insereArestasEmLote(
+        ((id_vertice(u), id_vertice(v), peso) for u, v, peso in grafo.grafo.arestas()), registrar=False
+    )
+
+    if grafo.tipo_conexidade() != copia.tipo_conexidade():
+        problemas.append("CONEXIDADE DIFERENTE DA RECONSTRUÍDA.")
+    if sorted(map(sorted, grafo.componentesConectadas())) != sorted(map(sorted, copia.componentesConectadas())):
+        problemas.append("COMPONENTES DIFERENTES DAS RECONSTRUÍDAS.")
+    for vertice in random.Random(1).sample(ids, min(500, len(ids))):
+        # COMPARA OS PESOS (EMPATES PODEM TROCAR A ORDEM DOS VIZINHOS)
+        if [p for _, p in grafo.recomenda(vertice, k=5)] != [p for _, p in copia.recomenda(vertice, k=5)]:
+            problemas.append(f"RECOMENDAÇÕES DE {vertice} DIFERENTES DAS RECONSTRUÍDAS.")
+            break
+    return problemas
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Teste de estresse de consultas concorrentes à TGrafoND.")
+    parser.add_argument("--vertices", type=int, default=5_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--segundos", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    define_silencioso(True)
+
+    falhas = []
+    print(f"{'threads':>7} {'escritor':>8} {'consultas/s':>12} {'alterações':>10}")
+    for threads in args.threads:
+        for com_escritor in (False, True):
+            # GRAFO NOVO A CADA RODADA: AS ALTERAÇÕES MUDAM O CUSTO DAS CONSULTAS
+            grafo = cria_grafo(args.vertices)
+            vazao, alteracoes, erros = rodada(grafo, threads, args.segundos, com_escritor)
+            print(f"{threads:>7} {'sim' if com_escritor else 'não':>8} {vazao:>12,.0f} {alteracoes:>10}")
+            falhas.extend(erros)
+            falhas.extend(verifica_indices(grafo))
+
+    for falha in falhas[:20]:
+        print(f"FALHA: {falha}")
+    print(f"\n{len(falhas)} FALHA(S)." if falhas else "\nNENHUMA FALHA.")
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Gerador de grafos sintéticos para os benchmarks. O grafo é configurado pelo
+número de vértices, pela densidade (fração dos pares possíveis que viram
+arestas), pela distribuição dos pesos e pelo número de componentes
+conectadas. Os vértices são divididos em blocos contíguos, um por
+componente, e cada bloco recebe primeiro uma árvore aleatória (garantindo
+que ele seja conexo) e depois arestas sorteadas até atingir a densidade.
+
+O arquivo gerado segue o formato lido por `TGrafoND.leArquivo`.
+
+Uso:
+    python -m app.utils.benchmarks.gerador saida.txt --vertices 10000 --densidade 0.001 --componentes 5
+"""
+
+import argparse
+import random
+
+# PESO MÁXIMO PADRÃO (MAIOR NÚMERO DE GÊNEROS EM COMUM NO GRAFO REAL)
+PESO_MAXIMO = 37
+
+
+def sorteia_peso(aleatorio: random.Random, distribuicao: str, peso_maximo: int) -> int:
+    """
+    SORTEIA O PESO DE UMA ARESTA.
+
+    Args:
+        distribuicao (str): "uniforme" (1 A peso_maximo), "geometrica" (PESOS BAIXOS
+            MAIS FREQUENTES, COMO NO GRAFO REAL DE GÊNEROS) OU "constante" (SEMPRE 1).
+    """
+    if distribuicao == "uniforme":
+        return aleatorio.randint(1, peso_maximo)
+    if distribuicao == "geometrica":
+        return min(peso_maximo, 1 + int(aleatorio.expovariate(1 / 4)))
+    if distribuicao == "constante":
+        return 1
+    raise ValueError(f"DISTRIBUIÇÃO DE PESOS DESCONHECIDA: {distribuicao}.")
+
+
+def gera_arestas(
+    vertices: int,
+    densidade: float,
+    distribuicao: str = "uniforme",
+    componentes: int = 1,
+    peso_maximo: int = PESO_MAXIMO,
+    semente: int = 42,
+) -> list:
+    """
+    GERA AS ARESTAS (SEM REPETIÇÃO) DE UM GRAFO SINTÉTICO.
+
+    Args:
+        vertices (int): NÚMERO DE VÉRTICES (NUMERADOS DE 0 A vertices-1).
+        densidade (float): FRAÇÃO DOS PARES DE CADA COMPONENTE LIGADOS POR ARESTAS.
+        distribuicao (str): DISTRIBUIÇÃO DOS PESOS (VER `sorteia_peso`).
+        componentes (int): NÚMERO DE COMPONENTES CONECTADAS.
+        peso_maximo (int): MAIOR PESO POSSÍVEL.
+        semente (int): SEMENTE DO GERADOR ALEATÓRIO (MESMA SEMENTE, MESMO GRAFO).
+
+    Returns:
+        list: TRIPLAS (ORIGEM, DESTINO, PESO) COM ORIGEM < DESTINO.
+    """
+    if not 1 <= componentes <= max(vertices, 1):
+        raise ValueError("O NÚMERO DE COMPONENTES DEVE ESTAR ENTRE 1 E O NÚMERO DE VÉRTICES.")
+
+    aleatorio = random.Random(semente)
+    arestas = []
+    tamanho, sobra = divmod(vertices, componentes)
+    inicio = 0
+    for componente in range(componentes):
+        fim = inicio + tamanho + (componente < sobra)
+        bloco = range(inicio, fim)
+        pares = set()
+
+        # ÁRVORE ALEATÓRIA: CADA VÉRTICE SE LIGA A UM VÉRTICE ANTERIOR DO BLOCO
+        for v in bloco[1:]:
+            pares.add((aleatorio.randrange(inicio, v), v))
+
+        possiveis = len(bloco) * (len(bloco) - 1) // 2
+        alvo = max(len(pares), int(densidade * possiveis))
+        if alvo > possiveis // 2:
+            # GRAFO DENSO: SORTEIA DIRETAMENTE ENTRE TODOS OS PARES DO BLOCO
+            restantes = [(u, v) for u in bloco for v in range(u + 1, fim) if (u, v) not in pares]
+            pares.update(aleatorio.sample(restantes, alvo - len(pares)))
+        else:
+            while len(pares) < alvo:
+                u, v = aleatorio.randrange(inicio, fim), aleatorio.randrange(inicio, fim)
+                if u != v:
+                    pares.add((min(u, v), max(u, v)))
+
+        arestas.extend(
+            (u, v, sorteia_peso(aleatorio, distribuicao, peso_maximo)) for u, v in sorted(pares)
+        )
+        inicio = fim
+
+    return arestas
+
+
+def grava_txt(arquivo: str, vertices: int, arestas: list):
+    """
+    GRAVA O GRAFO SINTÉTICO NO FORMATO TXT DA `TGrafoND` (LIVROS "Livro N").
+    """
+    with open(arquivo, "w") as f:
+        f.write("2\n")
+        f.write(f"{vertices}\n")
+        f.writelines(f'{v} "Livro {v}"\n' for v in range(vertices))
+        f.write(f"{len(arestas)}\n")
+        f.writelines(f"{u} {v} {peso}\n" for u, v, peso in arestas)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera um grafo sintético no formato TXT.")
+    parser.add_argument("saida")
+    parser.add_argument("--vertices", type=int, default=1000)
+    parser.add_argument("--densidade", type=float, default=0.01)
+    parser.add_argument("--distribuicao", default="uniforme", choices=["uniforme", "geometrica", "constante"])
+    parser.add_argument("--componentes", type=int, default=1)
+    parser.add_argument("--peso-maximo", type=int, default=PESO_MAXIMO)
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    grava_txt(
+        args.saida,
+        args.vertices,
+        gera_arestas(
+            args.vertices, args.densidade, args.distribuicao, args.componentes, args.peso_maximo, args.semente
+        ),
+    )
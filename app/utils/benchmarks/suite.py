@@ -0,0 +1,245 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Suíte de benchmarks da `TGrafoND`. Para cada cenário (armazenamento, número
+de vértices, densidade, número de componentes e distribuição dos pesos)
+gera um grafo sintético (ver `gerador.py`) e mede o menor tempo de algumas
+repetições (menos sensível a interferências da máquina que a média):
+
+    - leArquivo, gravarGrafo;
+    - uma sequência de insereVertice/insereAresta/removeVertice;
+    - componentesConectadas, tipo_conexidade e grafo_reduzido, cada uma sem
+      aproveitar o cache de consultas nem o índice de componentes montado pela
+      anterior (o custo da primeira consulta após carregar o grafo);
+    - dijkstra (TGrafoND) a partir de algumas origens e, em grafos pequenos,
+      o `Graph.dijkstra` de dijkstra.py.
+
+Os resultados são gravados em JSON e comparados com uma linha de base
+(baseline.json): uma operação é considerada regressão se ficar mais lenta
+que `limite` vezes o tempo da linha de base e a diferença passar de `piso`
+segundos (para ignorar ruído em operações muito rápidas). Com regressões, o
+processo termina com código 1.
+
+A linha de base depende da máquina: atualize-a com --atualizar-baseline na
+máquina usada para comparar.
+
+Uso:
+    python -m app.utils.benchmarks.suite
+    python -m app.utils.benchmarks.suite --tamanhos 100 1000 --repeticoes 5 --saida resultados.json
+    python -m app.utils.benchmarks.suite --atualizar-baseline
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+from loguru import logger
+
+from app.utils.benchmarks.gerador import gera_arestas, grava_txt
+from app.utils.classes.dijkstra import Graph
+from app.utils.classes.grafo_nd import TGrafoND
+
+BASELINE = Path(__file__).with_name("baseline.json")
+TAMANHOS = (100, 1_000, 10_000, 100_000)
+# GRAU MÉDIO DOS GRAFOS GERADOS (A DENSIDADE DE CADA CENÁRIO É DERIVADA DELE)
+GRAU_MEDIO = 10
+COMPONENTES = 5
+DISTRIBUICAO = "geometrica"
+# ARMAZENAMENTOS EM MATRIZ SÓ SÃO MEDIDOS ATÉ ESTE NÚMERO DE VÉRTICES (MEMÓRIA O(V²))
+MAXIMO_MATRIZ = 5_000
+# dijkstra.py USA MATRIZ DE ADJACÊNCIA EM LISTAS; SÓ É MEDIDO EM GRAFOS PEQUENOS
+MAXIMO_DIJKSTRA_MATRIZ = 1_000
+ORIGENS_DIJKSTRA = 5
+OPERACOES_INSERE_REMOVE = 1_000
+LIMITE = 1.5
+PISO = 0.005
+
+
+def cronometra(funcao) -> float:
+    # COMO NO timeit, O COLETOR DE LIXO FICA DESLIGADO DURANTE A MEDIÇÃO
+    gc.collect()
+    gc.disable()
+    try:
+        inicio = perf_counter()
+        with redirect_stdout(io.StringIO()):  # DESCARTA O QUE A OPERAÇÃO IMPRIME
+            funcao()
+        return perf_counter() - inicio
+    finally:
+        gc.enable()
+
+
+def cronometra_consulta(grafo: TGrafoND, consulta) -> float:
+    """
+    CRONOMETRA UMA CONSULTA A PARTIR DO ÍNDICE DE COMPONENTES DESCARTADO (O CACHE DE
+    CONSULTAS DO GRAFO FICA DESATIVADO NA SUÍTE), PARA QUE ELA NÃO MEÇA APENAS O
+    RESULTADO JÁ CALCULADO POR UMA CONSULTA ANTERIOR.
+    """
+    grafo._componentes = None
+    return cronometra(consulta)
+
+
+def insere_remove(grafo: TGrafoND, operacoes: int, aleatorio: random.Random):
+    """
+    SEQUÊNCIA DE ALTERAÇÕES: INSERE VÉRTICES LIGADOS A TRÊS VÉRTICES EXISTENTES
+    E DEPOIS REMOVE O MESMO NÚMERO DE VÉRTICES ALEATÓRIOS.
+    """
+    existentes = list(grafo._alocador.ids())
+    for numero in range(operacoes):
+        vertice = grafo.insereVertice(f"Novo {numero}")
+        for vizinho in aleatorio.sample(existentes, 3):
+            grafo.insereAresta(vertice, vizinho, aleatorio.randint(1, 10))
+        existentes.append(vertice)
+    for vertice in aleatorio.sample(existentes, operacoes):
+        grafo.removeVertice(vertice)
+
+
+def mede_cenario(armazenamento: str, vertices: int, repeticoes: int, diretorio: str) -> dict:
+    """
+    EXECUTA AS OPERAÇÕES DE UM CENÁRIO E RETORNA O MENOR E O MEDIANO TEMPO DE CADA UMA.
+    """
+    densidade = min(1.0, GRAU_MEDIO * COMPONENTES / vertices)
+    arestas = gera_arestas(vertices, densidade, DISTRIBUICAO, COMPONENTES)
+    entrada = f"{diretorio}/entrada_{vertices}.txt"
+    saida = f"{diretorio}/saida_{vertices}.txt"
+    grava_txt(entrada, vertices, arestas)
+
+    tempos = {}
+    for repeticao in range(repeticoes):
+        aleatorio = random.Random(repeticao)
+        origens = aleatorio.sample(range(vertices), min(ORIGENS_DIJKSTRA, vertices))
+        grafo = TGrafoND(armazenamento=armazenamento)
+        grafo.configuraCache(0)
+
+        medicoes = {
+            "leArquivo": cronometra(lambda: grafo.leArquivo(entrada, imprimir=False)),
+            "componentesConectadas": cronometra_consulta(grafo, grafo.componentesConectadas),
+            "tipo_conexidade": cronometra_consulta(grafo, grafo.tipo_conexidade),
+            "grafo_reduzido": cronometra_consulta(grafo, grafo.grafo_reduzido),
+            "dijkstra": cronometra(
+                lambda: [grafo.dijkstra(origem, transformacao="inverso") for origem in origens]
+            ),
+            "gravarGrafo": cronometra(lambda: grafo.gravarGrafo(saida)),
+            "insereVertice_removeVertice": cronometra(
+                lambda: insere_remove(grafo, min(OPERACOES_INSERE_REMOVE, vertices), aleatorio)
+            ),
+        }
+
+        if vertices <= MAXIMO_DIJKSTRA_MATRIZ:
+            matriz = Graph(vertices)
+            for u, v, peso in arestas:
+                matriz.graph[u][v] = matriz.graph[v][u] = peso
+            medicoes["dijkstra_matriz"] = cronometra(
+                lambda: [matriz.dijkstra(origem) for origem in origens]
+            )
+
+        for operacao, segundos in medicoes.items():
+            tempos.setdefault(operacao, []).append(segundos)
+
+    return {
+        "vertices": vertices,
+        "arestas": len(arestas),
+        "densidade": densidade,
+        "componentes": COMPONENTES,
+        "distribuicao": DISTRIBUICAO,
+        "armazenamento": armazenamento,
+        "tempos": {operacao: min(valores) for operacao, valores in tempos.items()},
+        "medianas": {operacao: statistics.median(valores) for operacao, valores in tempos.items()},
+    }
+
+
+def executa_suite(tamanhos, armazenamentos, repeticoes: int) -> dict:
+    logger.remove()
+    resultados = {}
+    with tempfile.TemporaryDirectory() as diretorio:
+        for armazenamento in armazenamentos:
+            for vertices in tamanhos:
+                if armazenamento != "esparso" and vertices > MAXIMO_MATRIZ:
+                    print(f"IGNORANDO {armazenamento} COM {vertices} VÉRTICES (MATRIZ GRANDE DEMAIS).")
+                    continue
+                cenario = f"{armazenamento}-V{vertices}"
+                print(f"MEDINDO {cenario}...", flush=True)
+                resultados[cenario] = mede_cenario(armazenamento, vertices, repeticoes, diretorio)
+
+    return {
+        "metadados": {
+            "data": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "repeticoes": repeticoes,
+        },
+        "resultados": resultados,
+    }
+
+
+def compara(atual: dict, base: dict, limite: float = LIMITE, piso: float = PISO) -> list:
+    """
+    COMPARA OS TEMPOS COM A LINHA DE BASE (APENAS CENÁRIOS E OPERAÇÕES PRESENTES NAS DUAS).
+
+    Returns:
+        list: REGRESSÕES, COMO TUPLAS (CENÁRIO, OPERAÇÃO, TEMPO BASE, TEMPO ATUAL).
+    """
+    regressoes = []
+    print(f"\n{'cenário':<16} {'operação':<28} {'base (s)':>10} {'atual (s)':>10} {'razão':>7}")
+    for cenario, resultado in atual["resultados"].items():
+        tempos_base = base["resultados"].get(cenario, {}).get("tempos", {})
+        for operacao, segundos in resultado["tempos"].items():
+            if operacao not in tempos_base:
+                continue
+            referencia = tempos_base[operacao]
+            razao = segundos / referencia if referencia else float("inf")
+            regressao = razao > limite and segundos - referencia > piso
+            marca = "  <-- REGRESSÃO" if regressao else ""
+            print(f"{cenario:<16} {operacao:<28} {referencia:>10.4f} {segundos:>10.4f} {razao:>7.2f}{marca}")
+            if regressao:
+                regressoes.append((cenario, operacao, referencia, segundos))
+    return regressoes
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks da TGrafoND.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS))
+    parser.add_argument("--armazenamentos", nargs="+", default=["esparso"])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--saida", help="arquivo JSON com os resultados")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--atualizar-baseline", action="store_true")
+    parser.add_argument("--limite", type=float, default=LIMITE, help="razão máxima atual/base")
+    parser.add_argument("--piso", type=float, default=PISO, help="diferença mínima (s) para regressão")
+    args = parser.parse_args(argv)
+
+    atual = executa_suite(args.tamanhos, args.armazenamentos, args.repeticoes)
+
+    if args.saida:
+        Path(args.saida).write_text(json.dumps(atual, indent=2, ensure_ascii=False))
+
+    if args.atualizar_baseline:
+        Path(args.baseline).write_text(json.dumps(atual, indent=2, ensure_ascii=False) + "\n")
+        print(f"LINHA DE BASE ATUALIZADA: {args.baseline}")
+        return 0
+
+    if not Path(args.baseline).exists():
+        print(f"LINHA DE BASE {args.baseline} NÃO ENCONTRADA; USE --atualizar-baseline.")
+        return 0
+
+    regressoes = compara(atual, json.loads(Path(args.baseline).read_text()), args.limite, args.piso)
+    if regressoes:
+        print(f"\n{len(regressoes)} REGRESSÃO(ÕES) ACIMA DE {args.limite:.2f}x.")
+        return 1
+    print("\nNENHUMA REGRESSÃO.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Mede o ganho do armazenamento "numpy" da `TGrafoND` nas operações sobre o
+grafo inteiro (extração de arestas, estatísticas de graus e pesos e
+contração de grupos de vértices) em relação aos armazenamentos em Python
+puro, para grafos aleatórios de 1 mil e 10 mil vértices.
+
+Uso:
+    python -m app.utils.benchmarks.vetorizacao
+"""
+
+import random
+
+from time import perf_counter
+
+from loguru import logger
+
+from app.utils.classes.grafo_nd import TGrafoND
+
+TAMANHOS = (1_000, 10_000)
+DENSIDADE = 0.01
+NUM_GRUPOS = 10
+
+
+def cria_grafo(armazenamento: str, vertices: int, arestas: list) -> TGrafoND:
+    grafo = TGrafoND(armazenamento=armazenamento)
+    for _ in range(vertices):
+        grafo.insereVertice()
+    grafo._insereArestasEmLote(arestas)
+    return grafo
+
+
+def cronometra(funcao) -> float:
+    inicio = perf_counter()
+    funcao()
+    return perf_counter() - inicio
+
+
+def main():
+    logger.remove()
+    aleatorio = random.Random(42)
+
+    print(f"{'V':>7} {'armazenamento':>14} {'arestas (s)':>12} {'estatísticas (s)':>17} {'contração (s)':>14}")
+    for vertices in TAMANHOS:
+        num_arestas = int(DENSIDADE * vertices * (vertices - 1) / 2)
+        arestas = [
+            (aleatorio.randrange(vertices), aleatorio.randrange(vertices), aleatorio.randint(1, 37))
+            for _ in range(num_arestas)
+        ]
+        grupos = [set(range(g, vertices, NUM_GRUPOS)) for g in range(NUM_GRUPOS)]
+
+        for armazenamento in ("denso", "esparso", "numpy"):
+            grafo = cria_grafo(armazenamento, vertices, arestas)
+            extrai = getattr(grafo.grafo, "arestasVetorizadas", lambda: list(grafo.grafo.arestas()))
+            tempos = (
+                cronometra(extrai),
+                cronometra(grafo.estatisticasGraus),
+                cronometra(lambda: grafo.contraiGrafo(grupos)),
+            )
+            print(
+                f"{vertices:>7} {armazenamento:>14} {tempos[0]:>12.4f} {tempos[1]:>17.4f} {tempos[2]:>14.4f}"
+            )
+            del grafo
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,489 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Backends de armazenamento da adjacência usados pela classe `TGrafoND`.
+O backend denso guarda a matriz de adjacência completa, adequada para
+grafos pequenos e densos. O backend esparso guarda, para cada
+vértice, apenas um dicionário com os vizinhos reais e seus pesos, de modo que
+a memória e os percursos custam O(V+E) em vez de O(V²).
+
+O backend NumPy (opcional, exige o pacote `numpy`) guarda a matriz em um
+`ndarray`, permitindo que as operações sobre o grafo inteiro (extração de
+arestas, estatísticas de graus e pesos, contração de grupos de vértices)
+sejam feitas como operações vetorizadas.
+
+Todos os backends expõem a mesma interface, sempre indexada pela posição
+interna do vértice (slot).
+
+O tipo dos pesos é escolhido na criação (`TipoPeso`): uint8, uint16, int32,
+int64, float32 ou float64, ou "auto", que começa em uint8 e promove o tipo
+quando um peso não cabe. Os pesos do grafo de livros (número de gêneros em
+comum) cabem em um uint8: no backend denso a matriz inteira é um único
+`array` com 1 byte por célula, em vez de listas com um ponteiro de 8
+bytes por célula; no backend NumPy o tipo vira o `dtype` da matriz. Um peso
+que não cabe em um tipo fixo lança `OverflowError`.
+"""
+
+from array import array
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:  # O BACKEND NUMPY É OPCIONAL
+    np = None
+
+# TIPOS DOS PESOS: (CÓDIGO DO MÓDULO array/NUMPY, MENOR VALOR, MAIOR VALOR); None = PONTO FLUTUANTE
+TIPOS_PESO = {
+    "uint8": ("B", 0, 2**8 - 1),
+    "uint16": ("H", 0, 2**16 - 1),
+    "int32": ("i", -(2**31), 2**31 - 1),
+    "int64": ("q", -(2**63), 2**63 - 1),
+    "float32": ("f", None, None),
+    "float64": ("d", None, None),
+}
+# ORDEM DE PROMOÇÃO DO TIPO "auto" (float64 GUARDA QUALQUER PESO NÃO INTEIRO SEM PERDA)
+PROMOCAO_PESO = ("uint8", "uint16", "int32", "int64", "float64")
+TIPO_PESO_PADRAO = "auto"
+MAIOR_FLOAT32 = 3.4028234663852886e38
+# CRESCIMENTO DA CAPACIDADE DAS MATRIZES: A MEMÓRIA É QUADRÁTICA NA CAPACIDADE, ENTÃO
+# DOBRÁ-LA QUADRUPLICARIA A MATRIZ; COM 1,25 ELA CRESCE ~1,56 VEZES POR REALOCAÇÃO
+FATOR_CRESCIMENTO = 1.25
+CRESCIMENTO_MINIMO = 4
+# TABELA DE `bytes.translate` QUE MARCA COM 1 OS BYTES DIFERENTES DE 0
+MARCA_NAO_NULO = bytes([0] + [1] * 255)
+
+
+def posicoes_nao_nulas(linha: array) -> list:
+    """
+    POSIÇÕES DAS CÉLULAS DIFERENTES DE 0 DE UMA LINHA DA MATRIZ.
+
+    OS BYTES NÃO NULOS SÃO MARCADOS COM `bytes.translate` E LOCALIZADOS COM
+    `bytes.find`, AMBOS EM C, COM CUSTO PYTHON APENAS POR VIZINHO. EM LINHAS COM
+    MUITOS VIZINHOS, UMA PASSADA DE `itertools.compress` SOBRE AS CÉLULAS É MAIS RÁPIDA.
+    """
+    largura = linha.itemsize
+    marcas = linha.tobytes().translate(MARCA_NAO_NULO)
+    if marcas.count(1) > len(linha) // 16:
+        return list(compress(range(len(linha)), linha))
+
+    posicoes = []
+    procura = marcas.find
+    indice = procura(1)
+    while indice >= 0:
+        posicao = indice // largura
+        if linha[posicao]:  # UM PESO -0.0 TEM BYTE NÃO NULO, MAS NÃO É ARESTA
+            posicoes.append(posicao)
+        indice = procura(1, (posicao + 1) * largura)
+    return posicoes
+
+
+class TipoPeso:
+    """
+    TIPO DOS PESOS DE UM ARMAZENAMENTO, COM VERIFICAÇÃO DE FAIXA E, NO MODO
+    "auto", PROMOÇÃO PARA O PRÓXIMO TIPO DE `PROMOCAO_PESO` QUE COMPORTE O PESO.
+    """
+
+    def __init__(self, nome: str = TIPO_PESO_PADRAO):
+        """
+        Args:
+            nome (str): UMA DAS CHAVES DE `TIPOS_PESO` OU "auto".
+
+        Raises:
+            ValueError: SE O TIPO NÃO EXISTE.
+        """
+        if nome != "auto" and nome not in TIPOS_PESO:
+            raise ValueError(f"TIPO DE PESO '{nome}' DESCONHECIDO. OPÇÕES: auto, {', '.join(TIPOS_PESO)}.")
+        self.automatico = nome == "auto"
+        self._define(PROMOCAO_PESO[0] if self.automatico else nome)
+
+    def _define(self, nome: str):
+        self.nome = nome
+        self.codigo, self._minimo, self._maximo = TIPOS_PESO[nome]
+        self.inteiro = self._minimo is not None
+
+    def __repr__(self) -> str:
+        return f"TipoPeso({'auto' if self.automatico else self.nome!r})"
+
+    def _comporta(self, nome: str, peso) -> bool:
+        _, minimo, maximo = TIPOS_PESO[nome]
+        if minimo is None:
+            return nome != "float32" or abs(peso) <= MAIOR_FLOAT32
+        return minimo <= peso <= maximo and peso == int(peso)
+
+    def converte(self, peso):
+        """
+        VERIFICA O PESO E O RETORNA COMO É GUARDADO (int OU float). NO MODO "auto",
+        PROMOVE O TIPO SE NECESSÁRIO (O ARMAZENAMENTO DEVE ENTÃO CONVERTER SEUS
+        PESOS PARA O NOVO `codigo`).
+
+        Raises:
+            OverflowError: SE O PESO NÃO CABE NO TIPO (FIXO).
+        """
+        if type(peso) is int and self.inteiro and self._minimo <= peso <= self._maximo:
+            return peso  # CAMINHO RÁPIDO: INTEIRO DENTRO DA FAIXA
+        if not self._comporta(self.nome, peso):
+            if not self.automatico:
+                raise OverflowError(f"O PESO {peso} NÃO CABE NO TIPO {self.nome}.")
+            atual = PROMOCAO_PESO.index(self.nome) if self.nome in PROMOCAO_PESO else 0
+            self._define(next(nome for nome in PROMOCAO_PESO[atual:] if self._comporta(nome, peso)))
+        return int(peso) if self.inteiro else float(peso)
+
+
+def nova_capacidade(capacidade: int) -> int:
+    """
+    CAPACIDADE DE UMA MATRIZ CHEIA APÓS O CRESCIMENTO (PELO MENOS `CRESCIMENTO_MINIMO` POSIÇÕES A MAIS).
+    """
+    return max(capacidade + CRESCIMENTO_MINIMO, int(capacidade * FATOR_CRESCIMENTO))
+
+
+class ArmazenamentoDenso:
+    """
+    MATRIZ DE ADJACÊNCIA COMPLETA (V x V) EM UM ÚNICO `array` DO TIPO DOS PESOS,
+    LINHA APÓS LINHA (A CÉLULA (ORIGEM, DESTINO) FICA EM ORIGEM * CAPACIDADE + DESTINO).
+
+    A MATRIZ É ALOCADA COM FOLGA (CAPACIDADE 25% MAIOR A CADA CRESCIMENTO, VER
+    `nova_capacidade`), DE MODO QUE INSERIR VÉRTICES NÃO EXIGE REALOCAR A MATRIZ
+    A CADA CHAMADA. LOGO APÓS UM CRESCIMENTO A MATRIZ OCUPA ~1,56 V² CÉLULAS
+    (EM uint8, ~5x MENOS QUE LISTAS DE PONTEIROS DE 8 BYTES, CONTRA 8x SEM
+    FOLGA); A LEITURA DE ARQUIVOS E `compacta` ALOCAM EXATAMENTE V² CÉLULAS.
+    """
+
+    nome = "denso"
+
+    def __init__(self, vertices: int = 0, tipo_peso: str = TIPO_PESO_PADRAO):
+        """
+        CRIA A MATRIZ COM TODOS OS PESOS INICIALIZADOS EM 0.
+
+        Args:
+            vertices (int): NÚMERO INICIAL DE VÉRTICES.
+            tipo_peso (str): TIPO DOS PESOS (VER `TIPOS_PESO`) OU "auto".
+        """
+        self.tipo_peso = TipoPeso(tipo_peso)
+        self._tamanho = vertices
+        self._capacidade = vertices
+        self._celulas = self._zeros(vertices * vertices)
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def _zeros(self, quantidade: int) -> array:
+        return array(self.tipo_peso.codigo, [0]) * quantidade
+
+    def _linha(self, vertice: int, inicio: int = 0) -> array:
+        """
+        CÓPIA DA LINHA DO VÉRTICE, DA COLUNA `inicio` ATÉ A ÚLTIMA POSIÇÃO OCUPADA.
+        """
+        deslocamento = vertice * self._capacidade
+        return self._celulas[deslocamento + inicio : deslocamento + self._tamanho]
+
+    def adicionaVertice(self) -> int:
+        """
+        OCUPA A PRÓXIMA POSIÇÃO DA MATRIZ, AUMENTANDO A CAPACIDADE QUANDO NECESSÁRIO.
+
+        Returns:
+            int: A POSIÇÃO DO NOVO VÉRTICE.
+        """
+        capacidade = self._capacidade
+        if self._tamanho == capacidade:
+            maior = nova_capacidade(capacidade)
+            celulas = self._zeros(maior * maior)
+            for origem in range(self._tamanho):
+                inicio = origem * maior
+                celulas[inicio : inicio + capacidade] = self._celulas[
+                    origem * capacidade : (origem + 1) * capacidade
+                ]
+            self._celulas = celulas
+            self._capacidade = maior
+
+        self._tamanho += 1
+        return self._tamanho - 1
+
+    def limpaVertice(self, vertice: int):
+        """
+        ZERA A LINHA E A COLUNA DO VÉRTICE (A POSIÇÃO PODE SER REAPROVEITADA).
+
+        Args:
+            vertice (int): A POSIÇÃO DO VÉRTICE.
+        """
+        for destino, peso in self.vizinhos(vertice):
+            self._celulas[destino * self._capacidade + vertice] = 0
+        inicio = vertice * self._capacidade
+        self._celulas[inicio : inicio + self._tamanho] = self._zeros(self._tamanho)
+
+    def compacta(self, mapa: list):
+        """
+        REORGANIZA A MATRIZ CONFORME O MAPA DE POSIÇÕES ANTIGAS -> NOVAS.
+
+        Args:
+            mapa (list): NOVA POSIÇÃO DE CADA POSIÇÃO ANTIGA (None PARA DESCARTAR).
+        """
+        ativos = [slot for slot, novo in enumerate(mapa) if novo is not None]
+        celulas = array(self.tipo_peso.codigo)
+        for origem in ativos:
+            linha = self._linha(origem)
+            celulas.extend(array(self.tipo_peso.codigo, [linha[destino] for destino in ativos]))
+        self._celulas = celulas
+        self._tamanho = self._capacidade = len(ativos)
+
+    def peso(self, origem: int, destino: int):
+        return self._celulas[origem * self._capacidade + destino]
+
+    def definePeso(self, origem: int, destino: int, peso):
+        """
+        DEFINE O PESO DA ARESTA NOS DOIS SENTIDOS (PESO 0 REMOVE A ARESTA).
+
+        Raises:
+            OverflowError: SE O PESO NÃO CABE NO TIPO DOS PESOS.
+        """
+        codigo = self.tipo_peso.codigo
+        peso = self.tipo_peso.converte(peso)
+        if self.tipo_peso.codigo != codigo:
+            # TIPO "auto" PROMOVIDO: CONVERTE A MATRIZ PARA O NOVO TIPO
+            self._celulas = array(self.tipo_peso.codigo, self._celulas)
+        self._celulas[origem * self._capacidade + destino] = peso
+        self._celulas[destino * self._capacidade + origem] = peso
+
+    def vizinhos(self, vertice: int):
+        """
+        PERCORRE OS VIZINHOS REAIS DE UM VÉRTICE, SEM UM LAÇO PYTHON POR CÉLULA
+        DA LINHA (VER `posicoes_nao_nulas`).
+
+        Returns:
+            iterator: PARES (VIZINHO, PESO) COM PESO DIFERENTE DE 0.
+        """
+        linha = self._linha(vertice)
+        return ((destino, linha[destino]) for destino in posicoes_nao_nulas(linha))
+
+    def grau(self, vertice: int) -> int:
+        return self._tamanho - self._linha(vertice).count(0)
+
+    def arestas(self):
+        """
+        PERCORRE CADA ARESTA UMA ÚNICA VEZ (ORIGEM < DESTINO).
+
+        Yields:
+            tuple: TRIPLAS (ORIGEM, DESTINO, PESO).
+        """
+        for origem in range(self._tamanho):
+            linha = self._linha(origem, origem + 1)
+            for destino in posicoes_nao_nulas(linha):
+                yield origem, origem + 1 + destino, linha[destino]
+
+    def linha(self, vertice: int) -> list:
+        """
+        RETORNA A LINHA DA MATRIZ DE ADJACÊNCIA DO VÉRTICE.
+        """
+        return self._linha(vertice).tolist()
+
+
+class ArmazenamentoEsparso:
+    """
+    LISTA DE ADJACÊNCIA: UM DICIONÁRIO {VIZINHO: PESO} POR VÉRTICE. O TIPO DOS
+    PESOS APENAS VALIDA OS VALORES (O CUSTO DE MEMÓRIA ESTÁ NOS DICIONÁRIOS).
+    """
+
+    nome = "esparso"
+
+    def __init__(self, vertices: int = 0, tipo_peso: str = TIPO_PESO_PADRAO):
+        """
+        CRIA A LISTA DE ADJACÊNCIA SEM NENHUMA ARESTA.
+
+        Args:
+            vertices (int): NÚMERO INICIAL DE VÉRTICES.
+            tipo_peso (str): TIPO DOS PESOS (VER `TIPOS_PESO`) OU "auto".
+        """
+        self.tipo_peso = TipoPeso(tipo_peso)
+        self._adjacencia = [{} for _ in range(vertices)]
+
+    def __len__(self) -> int:
+        return len(self._adjacencia)
+
+    def adicionaVertice(self) -> int:
+        self._adjacencia.append({})
+        return len(self._adjacencia) - 1
+
+    def limpaVertice(self, vertice: int):
+        """
+        REMOVE TODAS AS ARESTAS DO VÉRTICE EM O(GRAU).
+
+        Args:
+            vertice (int): A POSIÇÃO DO VÉRTICE.
+        """
+        for vizinho in self._adjacencia[vertice]:
+            if vizinho != vertice:
+                del self._adjacencia[vizinho][vertice]
+        self._adjacencia[vertice] = {}
+
+    def compacta(self, mapa: list):
+        """
+        REORGANIZA AS LISTAS CONFORME O MAPA DE POSIÇÕES ANTIGAS -> NOVAS.
+
+        Args:
+            mapa (list): NOVA POSIÇÃO DE CADA POSIÇÃO ANTIGA (None PARA DESCARTAR).
+        """
+        self._adjacencia = [
+            {mapa[vizinho]: peso for vizinho, peso in vizinhos.items()}
+            for slot, vizinhos in enumerate(self._adjacencia)
+            if mapa[slot] is not None
+        ]
+
+    def peso(self, origem: int, destino: int):
+        return self._adjacencia[origem].get(destino, 0)
+
+    def definePeso(self, origem: int, destino: int, peso):
+        """
+        DEFINE O PESO DA ARESTA NOS DOIS SENTIDOS (PESO 0 REMOVE A ARESTA).
+
+        Raises:
+            OverflowError: SE O PESO NÃO CABE NO TIPO DOS PESOS.
+        """
+        peso = self.tipo_peso.converte(peso)
+        if peso == 0:
+            self._adjacencia[origem].pop(destino, None)
+            self._adjacencia[destino].pop(origem, None)
+        else:
+            self._adjacencia[origem][destino] = peso
+            self._adjacencia[destino][origem] = peso
+
+    def vizinhos(self, vertice: int):
+        return iter(self._adjacencia[vertice].items())
+
+    def grau(self, vertice: int) -> int:
+        return len(self._adjacencia[vertice])
+
+    def arestas(self):
+        for origem, vizinhos in enumerate(self._adjacencia):
+            for destino, peso in vizinhos.items():
+                if origem < destino:
+                    yield origem, destino, peso
+
+    def linha(self, vertice: int) -> list:
+        linha = [0] * len(self._adjacencia)
+        for destino, peso in self._adjacencia[vertice].items():
+            linha[destino] = peso
+        return linha
+
+
+class ArmazenamentoNumpy:
+    """
+    MATRIZ DE ADJACÊNCIA EM UM `numpy.ndarray` (V x V), COM CAPACIDADE 25% MAIOR
+    A CADA CRESCIMENTO. AS OPERAÇÕES SOBRE O GRAFO INTEIRO SÃO VETORIZADAS.
+    """
+
+    nome = "numpy"
+    vetorizado = True
+
+    def __init__(self, vertices: int = 0, tipo_peso: str = TIPO_PESO_PADRAO):
+        """
+        CRIA A MATRIZ COM TODOS OS PESOS INICIALIZADOS EM 0.
+
+        Args:
+            vertices (int): NÚMERO INICIAL DE VÉRTICES.
+            tipo_peso (str): TIPO DOS PESOS (VER `TIPOS_PESO`) OU "auto"; DEFINE O `dtype` DA MATRIZ.
+        """
+        if np is None:
+            raise ImportError("O ARMAZENAMENTO 'numpy' EXIGE O PACOTE numpy INSTALADO.")
+        self.tipo_peso = TipoPeso(tipo_peso)
+        self._tamanho = vertices
+        self._matriz = np.zeros((vertices, vertices), dtype=self.tipo_peso.codigo)
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def matriz(self):
+        """
+        RETORNA A MATRIZ DE ADJACÊNCIA (VISÃO SEM CÓPIA, SEM A CAPACIDADE OCIOSA).
+        """
+        return self._matriz[: self._tamanho, : self._tamanho]
+
+    def adicionaVertice(self) -> int:
+        capacidade = self._matriz.shape[0]
+        if self._tamanho == capacidade:
+            nova = np.zeros((nova_capacidade(capacidade),) * 2, dtype=self._matriz.dtype)
+            nova[:capacidade, :capacidade] = self._matriz
+            self._matriz = nova
+
+        self._tamanho += 1
+        return self._tamanho - 1
+
+    def limpaVertice(self, vertice: int):
+        self._matriz[vertice, :] = 0
+        self._matriz[:, vertice] = 0
+
+    def compacta(self, mapa: list):
+        ativos = np.array([slot for slot, novo in enumerate(mapa) if novo is not None], dtype=np.intp)
+        self._matriz = self._matriz[np.ix_(ativos, ativos)]
+        self._tamanho = len(ativos)
+
+    def peso(self, origem: int, destino: int):
+        return self._matriz[origem, destino].item()
+
+    def definePeso(self, origem: int, destino: int, peso):
+        """
+        DEFINE O PESO DA ARESTA NOS DOIS SENTIDOS (PESO 0 REMOVE A ARESTA).
+
+        Raises:
+            OverflowError: SE O PESO NÃO CABE NO TIPO DOS PESOS.
+        """
+        peso = self.tipo_peso.converte(peso)
+        if self._matriz.dtype.char != self.tipo_peso.codigo:
+            self._matriz = self._matriz.astype(self.tipo_peso.codigo)  # TIPO "auto" PROMOVIDO
+        self._matriz[origem, destino] = peso
+        self._matriz[destino, origem] = peso
+
+    def vizinhos(self, vertice: int):
+        linha = self._matriz[vertice, : self._tamanho]
+        destinos = np.flatnonzero(linha)
+        return zip(destinos.tolist(), linha[destinos].tolist())
+
+    def grau(self, vertice: int) -> int:
+        return int(np.count_nonzero(self._matriz[vertice, : self._tamanho]))
+
+    def arestasVetorizadas(self) -> tuple:
+        """
+        EXTRAI TODAS AS ARESTAS DO TRIÂNGULO SUPERIOR DA MATRIZ (ORIGEM < DESTINO).
+
+        Returns:
+            tuple: VETORES (ORIGENS, DESTINOS, PESOS).
+        """
+        matriz = self.matriz()
+        origens, destinos = np.nonzero(matriz)
+        superior = origens < destinos
+        origens, destinos = origens[superior], destinos[superior]
+        return origens, destinos, matriz[origens, destinos]
+
+    def arestas(self):
+        origens, destinos, pesos = self.arestasVetorizadas()
+        return zip(origens.tolist(), destinos.tolist(), pesos.tolist())
+
+    def linha(self, vertice: int) -> list:
+        return self._matriz[vertice, : self._tamanho].tolist()
+
+
+ARMAZENAMENTOS = {
+    ArmazenamentoDenso.nome: ArmazenamentoDenso,
+    ArmazenamentoEsparso.nome: ArmazenamentoEsparso,
+    ArmazenamentoNumpy.nome: ArmazenamentoNumpy,
+}
+
+
+def cria_armazenamento(nome: str, vertices: int = 0, tipo_peso: str = TIPO_PESO_PADRAO):
+    """
+    INSTANCIA O BACKEND DE ARMAZENAMENTO PELO NOME.
+
+    Args:
+        nome (str): "denso", "esparso" OU "numpy".
+        vertices (int): NÚMERO INICIAL DE VÉRTICES.
+        tipo_peso (str): TIPO DOS PESOS (VER `TIPOS_PESO`) OU "auto".
+
+    Returns:
+        O BACKEND DE ARMAZENAMENTO CRIADO.
+    """
+    try:
+        classe = ARMAZENAMENTOS[nome]
+    except KeyError:
+        raise ValueError(
+            f"ARMAZENAMENTO '{nome}' DESCONHECIDO. OPÇÕES: {', '.join(ARMAZENAMENTOS)}."
+        ) from None
+    return classe(vertices, tipo_peso)
@@ -0,0 +1,197 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Cache dos resultados das consultas da `TGrafoND`. Em uso como serviço, as
+mesmas consultas (conexidade, componentes, grafo reduzido, menor caminho,
+recomendações) se repetem muitas vezes entre alterações raras do grafo.
+
+O grafo mantém um contador de versão, incrementado por toda alteração
+(inserção e remoção de vértices e arestas, leitura de arquivos, desfazer e
+refazer). O cache guarda a versão para a qual seus resultados valem: na
+primeira consulta após uma alteração todos os resultados são descartados de
+uma vez, sem precisar saber quais dependiam do que foi alterado.
+
+O cache é LRU com dois limites, número de resultados e memória aproximada
+(em bytes); ao ultrapassar qualquer um, os resultados usados há mais tempo
+são descartados. Os acertos, falhas e descartes ficam disponíveis em
+`estatisticas()`, para dimensionar os limites.
+
+Os resultados em cache são compartilhados entre as chamadas; por isso os
+métodos com cache retornam valores imutáveis (tuplas e frozensets), e quem
+precisar alterar um resultado deve copiá-lo.
+"""
+
+import inspect
+import sys
+import threading
+
+from collections import OrderedDict
+from functools import wraps
+from itertools import islice
+
+MAX_ENTRADAS = 1024
+MAX_BYTES = 64 * 1024 * 1024
+# ELEMENTOS MEDIDOS POR CONTÊINER NA ESTIMATIVA DE MEMÓRIA DOS RESULTADOS
+AMOSTRA_TAMANHO = 32
+
+
+def tamanho_aproximado(valor) -> int:
+    """
+    ESTIMA A MEMÓRIA (EM BYTES) DE UM RESULTADO COM LISTAS, TUPLAS, CONJUNTOS E
+    DICIONÁRIOS ANINHADOS. EM CADA CONTÊINER APENAS UMA AMOSTRA DOS ELEMENTOS É
+    MEDIDA E O RESULTADO É EXTRAPOLADO, PARA QUE A ESTIMATIVA CUSTE POUCO MESMO
+    EM MATRIZES GRANDES.
+    """
+    if type(valor) is int and -5 <= valor <= 256:
+        return 0  # INTEIROS PEQUENOS SÃO OBJETOS COMPARTILHADOS PELO INTERPRETADOR
+    total = sys.getsizeof(valor)
+    if isinstance(valor, dict):
+        quantidade = 2 * len(valor)
+        amostra = [item for par in islice(valor.items(), AMOSTRA_TAMANHO) for item in par]
+    elif isinstance(valor, (list, tuple)):
+        quantidade = len(valor)
+        amostra = valor[:: max(1, quantidade // AMOSTRA_TAMANHO)][:AMOSTRA_TAMANHO]
+    elif isinstance(valor, (set, frozenset)):
+        quantidade = len(valor)
+        amostra = list(islice(valor, AMOSTRA_TAMANHO))
+    else:
+        return total
+    if amostra:
+        total += sum(map(tamanho_aproximado, amostra)) * quantidade // len(amostra)
+    return total
+
+
+class CacheConsultas:
+    """
+    CACHE LRU DE RESULTADOS, VÁLIDO PARA UMA ÚNICA VERSÃO DO GRAFO.
+    """
+
+    def __init__(self, max_entradas: int = MAX_ENTRADAS, max_bytes: int = MAX_BYTES):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._entradas = OrderedDict()  # CHAVE -> (RESULTADO, TAMANHO), DO MENOS PARA O MAIS RECENTE
+        self._versao = None
+        self._bytes = 0
+        # VÁRIAS CONSULTAS (LEITORES DO GRAFO) USAM O CACHE AO MESMO TEMPO
+        self._mutex = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0  # RESULTADOS REMOVIDOS PELOS LIMITES
+        self.invalidacoes = 0  # VEZES EM QUE UMA ALTERAÇÃO DO GRAFO ESVAZIOU O CACHE
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def _atualizaVersao(self, versao: int):
+        if versao != self._versao:
+            if self._entradas:
+                self.invalidacoes += 1
+            self._entradas.clear()
+            self._bytes = 0
+            self._versao = versao
+
+    def obtem(self, chave, versao: int) -> tuple:
+        """
+        PROCURA UM RESULTADO.
+
+        Returns:
+            tuple: (ENCONTRADO, RESULTADO).
+        """
+        with self._mutex:
+            self._atualizaVersao(versao)
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                self.falhas += 1
+                return False, None
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return True, entrada[0]
+
+    def guarda(self, chave, versao: int, resultado):
+        """
+        GUARDA O RESULTADO DE UMA CONSULTA FEITA NA VERSÃO `versao` DO GRAFO.
+        RESULTADOS MAIORES QUE O LIMITE DE MEMÓRIA NÃO SÃO GUARDADOS.
+        """
+        tamanho = tamanho_aproximado(resultado)
+        if tamanho > self.max_bytes or self.max_entradas <= 0:
+            return
+        with self._mutex:
+            self._atualizaVersao(versao)
+            anterior = self._entradas.pop(chave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._entradas[chave] = (resultado, tamanho)
+            self._bytes += tamanho
+            while len(self._entradas) > self.max_entradas or self._bytes > self.max_bytes:
+                _, (_, liberado) = self._entradas.popitem(last=False)
+                self._bytes -= liberado
+                self.descartes += 1
+
+    def limpa(self):
+        with self._mutex:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def estatisticas(self) -> dict:
+        consultas = self.acertos + self.falhas
+        return {
+            "entradas": len(self._entradas),
+            "bytes": self._bytes,
+            "max_entradas": self.max_entradas,
+            "max_bytes": self.max_bytes,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "taxa_acertos": self.acertos / consultas if consultas else 0.0,
+            "descartes": self.descartes,
+            "invalidacoes": self.invalidacoes,
+        }
+
+
+def memoiza(metodo):
+    """
+    DECORADOR DE MÉTODOS DE CONSULTA: GUARDA O RESULTADO EM `self._cache` PARA A
+    VERSÃO ATUAL DO GRAFO (`self._versao`). DEVE FICAR DENTRO DA TRAVA DE LEITURA,
+    PARA QUE NENHUMA ALTERAÇÃO ACONTEÇA ENTRE A CONSULTA E A GRAVAÇÃO NO CACHE.
+    ARGUMENTOS NÃO HASHEÁVEIS (EX.: LISTAS) EXECUTAM A CONSULTA SEM CACHE.
+    O MÉTODO DEVE RETORNAR UM VALOR IMUTÁVEL, JÁ QUE O MESMO OBJETO É DEVOLVIDO
+    A TODAS AS CHAMADAS ATÉ A PRÓXIMA ALTERAÇÃO DO GRAFO.
+    """
+    # POSIÇÃO E VALOR PADRÃO DE CADA PARÂMETRO (SEM O self), PARA MONTAR A CHAVE
+    # SEM `inspect.Signature.bind`, QUE CUSTARIA MAIS QUE AS CONSULTAS MAIS RÁPIDAS
+    parametros = list(inspect.signature(metodo).parameters.values())[1:]
+    posicoes = {parametro.name: i for i, parametro in enumerate(parametros)}
+    padroes = tuple(parametro.default for parametro in parametros)
+    nome = metodo.__name__
+
+    @wraps(metodo)
+    def memoizado(self, *args, **kwargs):
+        cache = self._cache
+        if cache is None or len(args) > len(padroes):
+            return metodo(self, *args, **kwargs)
+
+        # A MESMA CONSULTA GERA A MESMA CHAVE COM ARGUMENTOS POSICIONAIS, NOMEADOS OU PADRÃO
+        argumentos = args + padroes[len(args) :]
+        if kwargs:
+            argumentos = list(argumentos)
+            for parametro, valor in kwargs.items():
+                posicao = posicoes.get(parametro)
+                if posicao is None or posicao < len(args):
+                    return metodo(self, *args, **kwargs)  # O PRÓPRIO MÉTODO LANÇA O TypeError
+                argumentos[posicao] = valor
+        chave = (nome, *argumentos)
+        if inspect.Parameter.empty in chave:
+            return metodo(self, *args, **kwargs)  # FALTOU UM ARGUMENTO OBRIGATÓRIO
+        try:
+            hash(chave)
+        except TypeError:
+            return metodo(self, *args, **kwargs)
+
+        versao = self._versao
+        encontrado, resultado = cache.obtem(chave, versao)
+        if not encontrado:
+            resultado = metodo(self, *args, **kwargs)
+            cache.guarda(chave, versao, resultado)
+        return resultado
+
+    return memoizado
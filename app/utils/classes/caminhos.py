@@ -0,0 +1,116 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Motor de caminhos mínimos usado pela classe `TGrafoND`. Implementa o
+algoritmo de Dijkstra com heap binário sobre listas de adjacência, em
+O((V+E) log V), com parada antecipada no destino, múltiplas origens e um
+modo em lote para todos os pares. Como os pesos do grafo de livros são
+contagens de gêneros em comum (quanto maior, mais próximos), o módulo
+também oferece transformações de similaridade em distância.
+
+As funções trabalham com as posições internas (slots) dos vértices; a
+tradução para os números dos vértices fica a cargo da `TGrafoND`.
+"""
+
+import math
+
+from heapq import heappop, heappush
+
+INFINITO = math.inf
+
+
+def similaridade_para_distancia(modo: str = "inverso", peso_maximo=None):
+    """
+    CRIA A FUNÇÃO QUE CONVERTE UM PESO DE SIMILARIDADE EM UMA DISTÂNCIA POSITIVA.
+
+    Args:
+        modo (str): "inverso" (1 / PESO), "complemento" (PESO_MÁXIMO + 1 - PESO),
+            "log" (-LOG(PESO / (PESO_MÁXIMO + 1))) OU "saltos" (TODA ARESTA CUSTA 1).
+        peso_maximo: MAIOR PESO DO GRAFO (OBRIGATÓRIO PARA "complemento" E "log").
+
+    Returns:
+        callable: FUNÇÃO PESO -> DISTÂNCIA.
+    """
+    if modo == "inverso":
+        return lambda peso: 1 / peso
+    if modo == "saltos":
+        return lambda peso: 1
+    if modo in ("complemento", "log") and peso_maximo is None:
+        raise ValueError(f"O MODO '{modo}' EXIGE O PESO MÁXIMO DO GRAFO.")
+    if modo == "complemento":
+        return lambda peso: peso_maximo + 1 - peso
+    if modo == "log":
+        return lambda peso: -math.log(peso / (peso_maximo + 1))
+    raise ValueError(f"MODO DE TRANSFORMAÇÃO '{modo}' DESCONHECIDO.")
+
+
+def dijkstra(vizinhos, capacidade: int, origens, destino=None, distancia=None) -> tuple:
+    """
+    CALCULA OS CAMINHOS MÍNIMOS A PARTIR DE UMA OU MAIS ORIGENS.
+
+    Args:
+        vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO).
+        capacidade (int): NÚMERO DE POSIÇÕES (TAMANHO DOS VETORES RETORNADOS).
+        origens (iterable): POSIÇÕES DE PARTIDA (TODAS COM DISTÂNCIA 0).
+        destino (int): SE INFORMADO, PARA ASSIM QUE SUA DISTÂNCIA FOR DEFINITIVA.
+        distancia (callable): CONVERSÃO PESO -> CUSTO DA ARESTA (PADRÃO: O PRÓPRIO PESO).
+
+    Returns:
+        tuple: (DISTÂNCIAS, PREDECESSORES), VETORES INDEXADOS PELA POSIÇÃO.
+            POSIÇÕES NÃO ALCANÇADAS TÊM DISTÂNCIA INFINITA E PREDECESSOR -1.
+    """
+    dist = [INFINITO] * capacidade
+    pred = [-1] * capacidade
+    heap = []
+
+    for origem in origens:
+        dist[origem] = 0
+        heap.append((0, origem))
+
+    finalizado = bytearray(capacidade)
+    while heap:
+        d, u = heappop(heap)
+        if finalizado[u]:
+            continue
+        finalizado[u] = 1
+        if u == destino:
+            break
+
+        for v, peso in vizinhos(u):
+            custo = peso if distancia is None else distancia(peso)
+            if custo < 0:
+                raise ValueError("O ALGORITMO DE DIJKSTRA NÃO ACEITA PESOS NEGATIVOS.")
+            nova = d + custo
+            if nova < dist[v]:
+                dist[v] = nova
+                pred[v] = u
+                heappush(heap, (nova, v))
+
+    return dist, pred
+
+
+def reconstroi_caminho(pred: list, destino: int) -> list:
+    """
+    RECONSTRÓI O CAMINHO ATÉ O DESTINO A PARTIR DO VETOR DE PREDECESSORES.
+
+    Returns:
+        list: POSIÇÕES DA ORIGEM ATÉ O DESTINO.
+    """
+    caminho = [destino]
+    while pred[caminho[-1]] != -1:
+        caminho.append(pred[caminho[-1]])
+    caminho.reverse()
+    return caminho
+
+
+def todos_os_pares(vizinhos, capacidade: int, origens, distancia=None):
+    """
+    EXECUTA O DIJKSTRA A PARTIR DE CADA ORIGEM (MODO EM LOTE).
+
+    Yields:
+        tuple: (ORIGEM, DISTÂNCIAS, PREDECESSORES) PARA CADA ORIGEM.
+    """
+    for origem in origens:
+        dist, pred = dijkstra(vizinhos, capacidade, (origem,), distancia=distancia)
+        yield origem, dist, pred
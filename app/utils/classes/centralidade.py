@@ -0,0 +1,380 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Medidas de centralidade do grafo de livros, para identificar os livros
+"centrais" (hubs):
+
+    - grau: número de vizinhos (ou soma dos pesos) de cada livro;
+    - proximidade (closeness): inverso da distância média aos livros
+      alcançáveis, com a correção de Wasserman e Faust para grafos desconexos;
+    - intermediação (betweenness): fração dos caminhos mínimos entre outros
+      pares que passam pelo livro, pelo algoritmo de Brandes.
+
+Proximidade e intermediação exigem um caminho mínimo a partir de cada
+origem, e cada origem é independente das demais: as origens são divididas em
+lotes e distribuídas entre processos (`ProcessPoolExecutor`). O grafo não é
+enviado aos processos: ele é gravado uma vez no formato binário (ou, se foi
+aberto de um arquivo binário sem alterações, o próprio arquivo é usado) e
+cada processo o abre via mmap, compartilhando as páginas do sistema
+operacional. Em grafos pequenos, ou com um único processo, o cálculo é feito
+no próprio processo, sem gravar arquivo algum.
+
+Para grafos muito grandes (milhões de vértices), `amostras` limita o cálculo
+a um número de origens sorteadas: a intermediação é estimada extrapolando as
+dependências das origens sorteadas (Brandes e Pich) e a proximidade pela
+distância média até as origens sorteadas (Eppstein e Wang).
+
+As distâncias seguem as transformações de `caminhos.py` ("inverso" por
+padrão, pois os pesos são similaridades; "saltos" ignora os pesos) ou, com
+None, o próprio peso é a distância.
+"""
+
+import math
+import os
+import random
+import tempfile
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+
+from .caminhos import INFINITO, dijkstra, similaridade_para_distancia
+from .formato_binario import abre_binario, grava_binario
+
+# ABAIXO DESTE NÚMERO DE VÉRTICES O CÁLCULO É FEITO NO PRÓPRIO PROCESSO
+MINIMO_PARALELO = 2_000
+# LOTES DE ORIGENS POR PROCESSO (MAIS LOTES EQUILIBRAM MELHOR ORIGENS DE CUSTOS DIFERENTES)
+LOTES_POR_PROCESSO = 4
+
+# ESTADO DE CADA PROCESSO TRABALHADOR: VIZINHOS, CAPACIDADE E FUNÇÃO DE DISTÂNCIA
+_TRABALHADOR = {}
+
+
+def funcao_distancia(transformacao, peso_maximo=None):
+    """
+    RETORNA A FUNÇÃO PESO -> DISTÂNCIA DA TRANSFORMAÇÃO (None: O PRÓPRIO PESO).
+    """
+    if transformacao is None:
+        return None
+    return similaridade_para_distancia(transformacao, peso_maximo)
+
+
+def _inicializa_trabalhador(arquivo: str, transformacao, peso_maximo):
+    """
+    ABRE O GRAFO BINÁRIO (MMAP) UMA ÚNICA VEZ EM CADA PROCESSO TRABALHADOR.
+    """
+    armazenamento, _, _ = abre_binario(arquivo)
+    _TRABALHADOR.update(
+        vizinhos=armazenamento.vizinhos,
+        capacidade=len(armazenamento),
+        distancia=funcao_distancia(transformacao, peso_maximo),
+        armazenamento=armazenamento,
+    )
+
+
+def _brandes(vizinhos, distancia, origem: int, acumulado):
+    """
+    CAMINHOS MÍNIMOS A PARTIR DA ORIGEM, CONTANDO OS CAMINHOS MÍNIMOS (SIGMA),
+    E ACUMULA AS DEPENDÊNCIAS DE CADA VÉRTICE (FASE DE RETROCESSO DE BRANDES).
+    """
+    finalizados = []
+    predecessores = {origem: []}
+    sigma = {origem: 1}
+    provisorias = {origem: 0}
+    definitivas = {}
+    heap = [(0, origem)]
+
+    while heap:
+        d, v = heappop(heap)
+        if v in definitivas:
+            continue
+        definitivas[v] = d
+        finalizados.append(v)
+        sigma_v = sigma[v]
+        for w, peso in vizinhos(v):
+            if w in definitivas:
+                continue
+            nova = d + (peso if distancia is None else distancia(peso))
+            atual = provisorias.get(w)
+            if atual is None or nova < atual:
+                provisorias[w] = nova
+                sigma[w] = sigma_v
+                predecessores[w] = [v]
+                heappush(heap, (nova, w))
+            elif nova == atual:
+                sigma[w] += sigma_v
+                predecessores[w].append(v)
+
+    dependencia = dict.fromkeys(finalizados, 0.0)
+    for w in reversed(finalizados):
+        coeficiente = (1 + dependencia[w]) / sigma[w]
+        for v in predecessores[w]:
+            dependencia[v] += sigma[v] * coeficiente
+        if w != origem:
+            acumulado[w] += dependencia[w]
+
+
+def _lote_intermediacao(origens: list, estado: dict = None) -> array:
+    """
+    TAREFA: SOMA DAS DEPENDÊNCIAS DE TODOS OS VÉRTICES PARA AS ORIGENS DO LOTE.
+    """
+    estado = estado or _TRABALHADOR
+    acumulado = array("d", bytes(8 * estado["capacidade"]))
+    for origem in origens:
+        _brandes(estado["vizinhos"], estado["distancia"], origem, acumulado)
+    return acumulado
+
+
+def _lote_proximidade(origens: list, estado: dict = None) -> list:
+    """
+    TAREFA: (ORIGEM, SOMA DAS DISTÂNCIAS, VÉRTICES ALCANÇADOS) PARA CADA ORIGEM DO LOTE.
+    """
+    estado = estado or _TRABALHADOR
+    resultado = []
+    for origem in origens:
+        dist, _ = dijkstra(estado["vizinhos"], estado["capacidade"], (origem,), distancia=estado["distancia"])
+        alcancadas = [d for d in dist if d != INFINITO]
+        resultado.append((origem, sum(alcancadas), len(alcancadas)))
+    return resultado
+
+
+def _lote_proximidade_amostrada(origens: list, estado: dict = None) -> tuple:
+    """
+    TAREFA: PARA CADA VÉRTICE, SOMA DAS DISTÂNCIAS ÀS ORIGENS DO LOTE E QUANTAS O ALCANÇAM.
+    """
+    estado = estado or _TRABALHADOR
+    soma = array("d", bytes(8 * estado["capacidade"]))
+    contagem = array("l", bytes(array("l").itemsize * estado["capacidade"]))
+    for origem in origens:
+        dist, _ = dijkstra(estado["vizinhos"], estado["capacidade"], (origem,), distancia=estado["distancia"])
+        for v, d in enumerate(dist):
+            if d != INFINITO and v != origem:
+                soma[v] += d
+                contagem[v] += 1
+    return soma, contagem
+
+
+def _lote_distancias(origens: list, estado: dict = None) -> list:
+    """
+    TAREFA: (ORIGEM, {POSIÇÃO: DISTÂNCIA}) PARA CADA ORIGEM DO LOTE.
+    """
+    estado = estado or _TRABALHADOR
+    resultado = []
+    for origem in origens:
+        dist, _ = dijkstra(estado["vizinhos"], estado["capacidade"], (origem,), distancia=estado["distancia"])
+        resultado.append((origem, {v: d for v, d in enumerate(dist) if d != INFINITO}))
+    return resultado
+
+
+def _divide(origens: list, lotes: int) -> list:
+    tamanho = max(1, math.ceil(len(origens) / max(lotes, 1)))
+    return [origens[i : i + tamanho] for i in range(0, len(origens), tamanho)]
+
+
+def _executa(grafo, tarefa, transformacao, processos, origens=None, amostras=None, semente=42) -> tuple:
+    """
+    EXECUTA A TAREFA SOBRE AS ORIGENS, NO PRÓPRIO PROCESSO OU EM UM POOL DE PROCESSOS.
+
+    Args:
+        grafo (TGrafoND): O GRAFO.
+        tarefa (callable): UMA DAS FUNÇÕES `_lote_*`.
+        transformacao: CONVERSÃO DO PESO EM DISTÂNCIA (NOME; FUNÇÕES SÓ SEM PROCESSOS).
+        processos (int): NÚMERO DE PROCESSOS (PADRÃO: NÚMERO DE CPUS).
+        origens (iterable): VÉRTICES DE PARTIDA (PADRÃO: TODOS).
+        amostras (int): SE INFORMADO, SORTEIA ESTE NÚMERO DE ORIGENS.
+        semente (int): SEMENTE DO SORTEIO DAS ORIGENS.
+
+    Returns:
+        tuple: (RESULTADOS DOS LOTES, IDENTIFICADOR DE CADA POSIÇÃO, POSIÇÕES ATIVAS,
+            ORIGENS USADAS).
+    """
+    processos = processos or os.cpu_count() or 1
+    if callable(transformacao):
+        processos = 1  # FUNÇÕES ARBITRÁRIAS NÃO PODEM SER ENVIADAS AOS PROCESSOS
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        # A TRAVA DE LEITURA SÓ É MANTIDA ENQUANTO O GRAFO É LIDO: NO MODO PARALELO,
+        # OS PROCESSOS TRABALHAM SOBRE A CÓPIA GRAVADA E O GRAFO PODE SER ALTERADO
+        with grafo._trava.leitura():
+            peso_maximo = None
+            if transformacao in ("complemento", "log"):
+                peso_maximo = max((peso for _, _, peso in grafo.grafo.arestas()), default=1)
+
+            paralelo = processos > 1 and grafo.vertices >= MINIMO_PARALELO
+            if paralelo:
+                # O ARQUIVO MAPEADO PELO ARMAZENAMENTO CSR, E NÃO `arquivo_base`, QUE PASSA A
+                # SER O ÚLTIMO ARQUIVO GRAVADO (QUE PODE SER TXT) SEM TROCAR O ARMAZENAMENTO
+                if getattr(grafo.grafo, "arquivo", None):
+                    arquivo = grafo.grafo.arquivo
+                else:
+                    arquivo = os.path.join(diretorio, "grafo.bkg")
+                    grava_binario(grafo, arquivo)
+                ids = list(grafo._alocador.ids())
+                posicoes = list(range(len(ids)))
+                traducao = dict(zip(ids, posicoes))
+            else:
+                vertice = grafo._alocador.vertice
+                ids = [vertice(slot) for slot in range(len(grafo.grafo))]
+                posicoes = [slot for slot, _ in grafo._alocador.slotsAtivos()]
+                traducao = None
+
+            if origens is None:
+                escolhidas = posicoes
+            else:
+                escolhidas = [
+                    traducao[v] if paralelo else grafo._slot(v) for v in origens if v in grafo._alocador
+                ]
+            if amostras is not None and amostras < len(escolhidas):
+                escolhidas = sorted(random.Random(semente).sample(escolhidas, amostras))
+
+            if not paralelo:
+                distancia = (
+                    transformacao if callable(transformacao) else funcao_distancia(transformacao, peso_maximo)
+                )
+                estado = {
+                    "vizinhos": grafo.grafo.vizinhos,
+                    "capacidade": len(grafo.grafo),
+                    "distancia": distancia,
+                }
+                return [tarefa(escolhidas, estado)], ids, posicoes, escolhidas
+
+        with ProcessPoolExecutor(
+            processos, initializer=_inicializa_trabalhador, initargs=(arquivo, transformacao, peso_maximo)
+        ) as pool:
+            resultados = list(pool.map(tarefa, _divide(escolhidas, processos * LOTES_POR_PROCESSO)))
+        return resultados, ids, posicoes, escolhidas
+
+
+def centralidade_grau(grafo, ponderado: bool = False) -> dict:
+    """
+    CENTRALIDADE DE GRAU.
+
+    Args:
+        grafo (TGrafoND): O GRAFO.
+        ponderado (bool): SE True, RETORNA A SOMA DOS PESOS DAS ARESTAS (FORÇA)
+            EM VEZ DO GRAU NORMALIZADO POR N-1.
+
+    Returns:
+        dict: {VÉRTICE: CENTRALIDADE}.
+    """
+    with grafo._trava.leitura():
+        n = grafo.vertices
+        if ponderado:
+            return {
+                vertice: sum(peso for _, peso in grafo.grafo.vizinhos(slot))
+                for slot, vertice in grafo._alocador.slotsAtivos()
+            }
+        escala = 1 / (n - 1) if n > 1 else 0.0
+        return {vertice: grafo.grafo.grau(slot) * escala for slot, vertice in grafo._alocador.slotsAtivos()}
+
+
+def centralidade_proximidade(
+    grafo, transformacao="inverso", amostras: int = None, processos: int = None, semente: int = 42
+) -> dict:
+    """
+    CENTRALIDADE DE PROXIMIDADE (CLOSENESS) COM A CORREÇÃO DE WASSERMAN E FAUST:
+    ((R-1) / SOMA DAS DISTÂNCIAS) * ((R-1) / (N-1)), ONDE R É O NÚMERO DE
+    VÉRTICES ALCANÇÁVEIS (INCLUINDO O PRÓPRIO VÉRTICE).
+
+    Args:
+        grafo (TGrafoND): O GRAFO.
+        transformacao: CONVERSÃO DO PESO EM DISTÂNCIA ("inverso", "complemento",
+            "log", "saltos" OU None).
+        amostras (int): SE INFORMADO, ESTIMA A PROXIMIDADE DE TODOS OS VÉRTICES
+            PELAS DISTÂNCIAS ATÉ ESTE NÚMERO DE ORIGENS SORTEADAS.
+        processos (int): NÚMERO DE PROCESSOS (PADRÃO: NÚMERO DE CPUS).
+        semente (int): SEMENTE DO SORTEIO DAS ORIGENS.
+
+    Returns:
+        dict: {VÉRTICE: CENTRALIDADE}.
+    """
+    if amostras is None:
+        resultados, ids, posicoes, _ = _executa(grafo, _lote_proximidade, transformacao, processos)
+        n = len(posicoes)
+        centralidade = {}
+        for lote in resultados:
+            for origem, soma, alcancados in lote:
+                r = alcancados - 1
+                centralidade[ids[origem]] = (r / soma) * (r / (n - 1)) if soma > 0 and n > 1 else 0.0
+        return centralidade
+
+    resultados, ids, posicoes, origens = _executa(
+        grafo, _lote_proximidade_amostrada, transformacao, processos, amostras=amostras, semente=semente
+    )
+    soma = [0.0] * len(ids)
+    contagem = [0] * len(ids)
+    for parcial_soma, parcial_contagem in resultados:
+        soma = [a + b for a, b in zip(soma, parcial_soma)]
+        contagem = [a + b for a, b in zip(contagem, parcial_contagem)]
+
+    # DISTÂNCIA MÉDIA ESTIMADA = SOMA / CONTAGEM; FRAÇÃO ALCANÇÁVEL ESTIMADA = CONTAGEM / K
+    k = len(origens)
+    return {
+        ids[p]: (contagem[p] / soma[p]) * (contagem[p] / k) if soma[p] > 0 else 0.0 for p in posicoes
+    }
+
+
+def centralidade_intermediacao(
+    grafo,
+    transformacao="inverso",
+    amostras: int = None,
+    normalizado: bool = True,
+    processos: int = None,
+    semente: int = 42,
+) -> dict:
+    """
+    CENTRALIDADE DE INTERMEDIAÇÃO (BETWEENNESS) PELO ALGORITMO DE BRANDES.
+
+    Args:
+        grafo (TGrafoND): O GRAFO.
+        transformacao: CONVERSÃO DO PESO EM DISTÂNCIA ("inverso", "complemento",
+            "log", "saltos" OU None).
+        amostras (int): SE INFORMADO, USA APENAS ESTE NÚMERO DE ORIGENS SORTEADAS E
+            EXTRAPOLA O RESULTADO (N / AMOSTRAS).
+        normalizado (bool): DIVIDE PELO NÚMERO DE PARES (N-1)(N-2); SENÃO, CADA PAR
+            NÃO ORDENADO É CONTADO UMA VEZ.
+        processos (int): NÚMERO DE PROCESSOS (PADRÃO: NÚMERO DE CPUS).
+        semente (int): SEMENTE DO SORTEIO DAS ORIGENS.
+
+    Returns:
+        dict: {VÉRTICE: CENTRALIDADE}.
+    """
+    resultados, ids, posicoes, origens = _executa(
+        grafo, _lote_intermediacao, transformacao, processos, amostras=amostras, semente=semente
+    )
+    total = [0.0] * len(ids)
+    for parcial in resultados:
+        total = [a + b for a, b in zip(total, parcial)]
+
+    n = len(posicoes)
+    if normalizado:
+        escala = 1 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+    else:
+        escala = 0.5  # GRAFO NÃO DIRIGIDO: CADA PAR É VISTO A PARTIR DAS DUAS PONTAS
+    if origens and len(origens) < n:
+        escala *= n / len(origens)
+    return {ids[p]: total[p] * escala for p in posicoes}
+
+
+def distancias_todos_os_pares(grafo, origens=None, transformacao=None, processos: int = None) -> dict:
+    """
+    DISTÂNCIAS MÍNIMAS DE CADA ORIGEM PARA TODOS OS VÉRTICES, COM AS ORIGENS
+    DISTRIBUÍDAS ENTRE PROCESSOS.
+
+    Returns:
+        dict: {ORIGEM: {VÉRTICE: DISTÂNCIA}} APENAS PARA VÉRTICES ALCANÇADOS.
+    """
+    resultados, ids, _, _ = _executa(grafo, _lote_distancias, transformacao, processos, origens=origens)
+    return {
+        ids[origem]: {ids[v]: d for v, d in distancias.items()}
+        for lote in resultados
+        for origem, distancias in lote
+    }
+
+
+def mais_centrais(centralidades: dict, k: int = 10) -> list:
+    """
+    RETORNA OS K VÉRTICES MAIS CENTRAIS, COMO PARES (VÉRTICE, CENTRALIDADE).
+    """
+    return sorted(centralidades.items(), key=lambda item: (-item[1], item[0]))[:k]
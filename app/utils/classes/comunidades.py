@@ -0,0 +1,244 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Detecção de comunidades (grupos de livros mais ligados entre si do que com o
+resto do grafo) sobre as arestas ponderadas da `TGrafoND`. No grafo de
+similaridade tudo está em uma única componente conectada, mas os pesos
+revelam agrupamentos de gêneros.
+
+A adjacência é copiada para vetores compactos (`array`, no formato CSR:
+início dos vizinhos de cada vértice, destinos e pesos), e os algoritmos
+trabalham sobre posições 0..N-1:
+
+    - propagação de rótulos: cada vértice adota o rótulo de maior peso entre
+      os vizinhos, visitando os vértices em ordem aleatória a cada rodada e
+      parando quando poucos rótulos mudam (quase linear por rodada);
+    - Louvain: move vértices entre comunidades enquanto a modularidade
+      aumentar e então agrega cada comunidade em um único vértice, repetindo
+      sobre o grafo agregado até não haver melhora.
+"""
+
+import random
+
+from array import array
+
+# FRAÇÃO MÍNIMA DE VÉRTICES QUE MUDAM DE RÓTULO PARA A PROPAGAÇÃO CONTINUAR
+TOLERANCIA_PROPAGACAO = 1e-3
+MAX_ITERACOES_PROPAGACAO = 100
+# GANHO MÍNIMO DE MODULARIDADE PARA O LOUVAIN CONTINUAR (POR RODADA E POR NÍVEL)
+TOLERANCIA_LOUVAIN = 1e-7
+
+
+class AdjacenciaCompacta:
+    """
+    ADJACÊNCIA NÃO DIRIGIDA EM VETORES (CSR) SOBRE AS POSIÇÕES 0..N-1.
+    """
+
+    def __init__(self, inicio: array, destinos: array, pesos: array):
+        self.inicio = inicio
+        self.destinos = destinos
+        self.pesos = pesos
+        self.n = len(inicio) - 1
+        # GRAU PONDERADO DE CADA VÉRTICE E SOMA DE TODOS (2M)
+        self.graus = array("d", (sum(pesos[inicio[i] : inicio[i + 1]]) for i in range(self.n)))
+        self.total = sum(self.graus)
+
+    @classmethod
+    def deArmazenamento(cls, vizinhos, slots: list) -> "AdjacenciaCompacta":
+        """
+        COPIA A ADJACÊNCIA DE UM ARMAZENAMENTO DA `TGrafoND`.
+
+        Args:
+            vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO).
+            slots (list): POSIÇÕES DOS VÉRTICES ATIVOS; O VÉRTICE slots[i] VIRA A POSIÇÃO i.
+        """
+        posicao = {slot: i for i, slot in enumerate(slots)}
+        inicio, destinos, pesos = array("q", [0]), array("q"), array("d")
+        for slot in slots:
+            for vizinho, peso in vizinhos(slot):
+                destinos.append(posicao[vizinho])
+                pesos.append(peso)
+            inicio.append(len(destinos))
+        return cls(inicio, destinos, pesos)
+
+    def vizinhos(self, i: int):
+        a, b = self.inicio[i], self.inicio[i + 1]
+        return zip(self.destinos[a:b], self.pesos[a:b])
+
+    def agrega(self, comunidade: list, num_comunidades: int) -> "AdjacenciaCompacta":
+        """
+        CRIA O GRAFO DE COMUNIDADES: O PESO ENTRE DUAS COMUNIDADES É A SOMA DOS PESOS
+        ENTRE SEUS VÉRTICES, E AS ARESTAS INTERNAS VIRAM LAÇOS (O TOTAL 2M SE MANTÉM).
+        """
+        linhas = [{} for _ in range(num_comunidades)]
+        for i in range(self.n):
+            linha = linhas[comunidade[i]]
+            for j, peso in self.vizinhos(i):
+                c = comunidade[j]
+                linha[c] = linha.get(c, 0.0) + peso
+
+        inicio, destinos, pesos = array("q", [0]), array("q"), array("d")
+        for linha in linhas:
+            destinos.extend(linha.keys())
+            pesos.extend(linha.values())
+            inicio.append(len(destinos))
+        return AdjacenciaCompacta(inicio, destinos, pesos)
+
+
+def renumera(rotulos: list) -> tuple:
+    """
+    RENUMERA OS RÓTULOS PARA 0..C-1 (NA ORDEM DE PRIMEIRA OCORRÊNCIA).
+
+    Returns:
+        tuple: (NOVOS RÓTULOS, NÚMERO DE COMUNIDADES).
+    """
+    novos = {}
+    resultado = [novos.setdefault(rotulo, len(novos)) for rotulo in rotulos]
+    return resultado, len(novos)
+
+
+def modularidade(adjacencia: AdjacenciaCompacta, comunidade: list, resolucao: float = 1.0) -> float:
+    """
+    MODULARIDADE Q = SOMA SOBRE AS COMUNIDADES DE (INTERNO / 2M - RESOLUÇÃO * (TOTAL / 2M)²).
+    """
+    if not adjacencia.total:
+        return 0.0
+    interno, total = {}, {}
+    for i in range(adjacencia.n):
+        c = comunidade[i]
+        total[c] = total.get(c, 0.0) + adjacencia.graus[i]
+        for j, peso in adjacencia.vizinhos(i):
+            if comunidade[j] == c:
+                interno[c] = interno.get(c, 0.0) + peso
+    m2 = adjacencia.total
+    return sum(interno.get(c, 0.0) / m2 - resolucao * (t / m2) ** 2 for c, t in total.items())
+
+
+def propagacao_rotulos(
+    adjacencia: AdjacenciaCompacta,
+    semente: int = 42,
+    max_iteracoes: int = MAX_ITERACOES_PROPAGACAO,
+    tolerancia: float = TOLERANCIA_PROPAGACAO,
+) -> list:
+    """
+    DETECTA COMUNIDADES POR PROPAGAÇÃO DE RÓTULOS PONDERADA.
+
+    Args:
+        adjacencia (AdjacenciaCompacta): O GRAFO.
+        semente (int): SEMENTE DA ORDEM ALEATÓRIA E DOS DESEMPATES.
+        max_iteracoes (int): NÚMERO MÁXIMO DE RODADAS.
+        tolerancia (float): PARA QUANDO A FRAÇÃO DE VÉRTICES QUE MUDARAM DE RÓTULO
+            EM UMA RODADA FOR MENOR OU IGUAL A ESTE VALOR.
+
+    Returns:
+        list: RÓTULO (0..C-1) DE CADA POSIÇÃO.
+    """
+    aleatorio = random.Random(semente)
+    rotulos = list(range(adjacencia.n))
+    ordem = list(range(adjacencia.n))
+    limite = tolerancia * adjacencia.n
+
+    for _ in range(max_iteracoes):
+        aleatorio.shuffle(ordem)
+        mudancas = 0
+        for i in ordem:
+            pesos = {}
+            for j, peso in adjacencia.vizinhos(i):
+                if j != i:
+                    rotulo = rotulos[j]
+                    pesos[rotulo] = pesos.get(rotulo, 0.0) + peso
+            if not pesos:
+                continue
+            maximo = max(pesos.values())
+            if pesos.get(rotulos[i]) == maximo:
+                continue  # O RÓTULO ATUAL JÁ ESTÁ ENTRE OS MELHORES: NÃO OSCILA
+            melhores = [rotulo for rotulo, peso in pesos.items() if peso == maximo]
+            rotulos[i] = melhores[0] if len(melhores) == 1 else aleatorio.choice(melhores)
+            mudancas += 1
+        if mudancas <= limite:
+            break
+
+    return renumera(rotulos)[0]
+
+
+def _movimentos_locais(adjacencia: AdjacenciaCompacta, resolucao: float, aleatorio: random.Random) -> tuple:
+    """
+    FASE 1 DO LOUVAIN: MOVE CADA VÉRTICE PARA A COMUNIDADE VIZINHA DE MAIOR GANHO
+    DE MODULARIDADE, EM RODADAS, ATÉ NENHUM MOVIMENTO MELHORAR O SUFICIENTE.
+
+    Returns:
+        tuple: (COMUNIDADE DE CADA VÉRTICE, HOUVE ALGUM MOVIMENTO).
+    """
+    n, graus, m2 = adjacencia.n, adjacencia.graus, adjacencia.total
+    comunidade = list(range(n))
+    total = list(graus)  # SOMA DOS GRAUS DE CADA COMUNIDADE
+    ordem = list(range(n))
+    aleatorio.shuffle(ordem)
+    moveu = False
+
+    while True:
+        ganho_rodada = 0.0
+        movimentos = 0
+        for i in ordem:
+            atual, grau = comunidade[i], graus[i]
+            ligacoes = {}  # PESO DE i PARA CADA COMUNIDADE VIZINHA (SEM LAÇOS)
+            for j, peso in adjacencia.vizinhos(i):
+                if j != i:
+                    c = comunidade[j]
+                    ligacoes[c] = ligacoes.get(c, 0.0) + peso
+
+            # RETIRA i DA SUA COMUNIDADE E ESCOLHE ONDE REINSERI-LO
+            total[atual] -= grau
+            fator = resolucao * grau / m2
+            melhor = atual
+            melhor_ganho = ligacoes.get(atual, 0.0) - fator * total[atual]
+            for c, peso in ligacoes.items():
+                ganho = peso - fator * total[c]
+                if ganho > melhor_ganho:
+                    melhor, melhor_ganho = c, ganho
+            total[melhor] += grau
+
+            if melhor != atual:
+                ganho_rodada += melhor_ganho - (ligacoes.get(atual, 0.0) - fator * total[atual])
+                comunidade[i] = melhor
+                movimentos += 1
+
+        if movimentos:
+            moveu = True
+        if not movimentos or ganho_rodada / m2 < TOLERANCIA_LOUVAIN:
+            return comunidade, moveu
+
+
+def louvain(adjacencia: AdjacenciaCompacta, resolucao: float = 1.0, semente: int = 42) -> list:
+    """
+    DETECTA COMUNIDADES PELO MÉTODO DE LOUVAIN (OTIMIZAÇÃO DA MODULARIDADE).
+
+    Args:
+        adjacencia (AdjacenciaCompacta): O GRAFO.
+        resolucao (float): VALORES MAIORES QUE 1 PRODUZEM COMUNIDADES MENORES.
+        semente (int): SEMENTE DA ORDEM EM QUE OS VÉRTICES SÃO VISITADOS.
+
+    Returns:
+        list: COMUNIDADE (0..C-1) DE CADA POSIÇÃO.
+    """
+    aleatorio = random.Random(semente)
+    resultado = list(range(adjacencia.n))
+    if not adjacencia.total:
+        return resultado
+
+    atual = adjacencia
+    qualidade = modularidade(atual, resultado, resolucao)
+    while True:
+        comunidade, moveu = _movimentos_locais(atual, resolucao, aleatorio)
+        if not moveu:
+            break
+        comunidade, num_comunidades = renumera(comunidade)
+        agregado = atual.agrega(comunidade, num_comunidades)
+        nova_qualidade = modularidade(agregado, list(range(num_comunidades)), resolucao)
+        if nova_qualidade - qualidade < TOLERANCIA_LOUVAIN:
+            break
+        resultado = [comunidade[c] for c in resultado]
+        atual, qualidade = agregado, nova_qualidade
+
+    return renumera(resultado)[0]
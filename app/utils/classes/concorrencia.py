@@ -0,0 +1,175 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Controle de concorrência da classe `TGrafoND`, para servir consultas de
+vários usuários a partir de um único grafo em memória. Uma trava de leitores
+e escritor permite que qualquer número de threads consulte o grafo ao mesmo
+tempo (recomendações, conexidade, menor caminho, buscas), enquanto as
+alterações (inserção e remoção de vértices e arestas, leitura de arquivos,
+desfazer/refazer) têm acesso exclusivo: nenhum leitor vê o armazenamento ou
+os índices no meio de uma alteração.
+
+A trava dá preferência aos escritores: quando um escritor está esperando,
+novos leitores aguardam, de modo que um fluxo contínuo de consultas não
+impede as alterações. Ela é reentrante para a mesma thread (um método de
+alteração pode chamar outros métodos do grafo), mas uma thread que só tem a
+trava de leitura não pode passar a escrever (isso travaria com outro leitor
+fazendo o mesmo) e recebe um `RuntimeError`.
+
+Os índices criados sob demanda nas consultas (componentes, k vizinhos mais
+similares, títulos) são criados e publicados sob uma trava simples do grafo,
+e a compressão de caminho do union-find só grava o representante correto;
+por isso várias consultas podem usá-los ao mesmo tempo sem corromper nada.
+As gravações de arquivos também rodam sob a trava de leitura (as consultas
+continuam durante a gravação), mas são serializadas por outra trava simples,
+pois escrevem no mesmo arquivo e descartam as alterações pendentes.
+"""
+
+import threading
+
+from contextlib import contextmanager
+from functools import wraps
+
+
+class TravaLeituraEscrita:
+    """
+    TRAVA DE LEITORES E ESCRITOR, COM PREFERÊNCIA AOS ESCRITORES E REENTRANTE POR THREAD.
+    """
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._condicao = threading.Condition(self._mutex)
+        self._leitores = 0  # LEITURAS ATIVAS (CONTANDO REENTRADAS)
+        self._escritores_esperando = 0
+        self._escritor = None  # THREAD QUE DETÉM A ESCRITA
+        self._profundidade_escrita = 0
+        # THREADS BLOQUEADAS NA CONDIÇÃO: SEM NINGUÉM ESPERANDO, LIBERAR A TRAVA NÃO
+        # PRECISA DO notify_all (O CASO COMUM, E O MAIS CARO DA LIBERAÇÃO)
+        self._esperando = 0
+        # LEITURAS ATIVAS POR THREAD (SÓ A PRÓPRIA THREAD ALTERA A SUA ENTRADA). UM
+        # DICIONÁRIO E NÃO threading.local, CUJO getattr COM PADRÃO CUSTA ~1us QUANDO
+        # O ATRIBUTO NÃO EXISTE, O CASO DE TODA ALTERAÇÃO
+        self._leituras = {}
+
+    def adquireLeitura(self):
+        """
+        ADQUIRE A TRAVA PARA LEITURA (COMPARTILHADA).
+        """
+        thread = threading.get_ident()
+        leituras = self._leituras.get(thread, 0)
+        with self._mutex:
+            # CAMINHO RÁPIDO: SEM ESCRITOR ATIVO OU NA FILA. SE A THREAD JÁ TEM UMA
+            # LEITURA OU A ESCRITA, TAMBÉM ENTRA SEM ESPERAR (ESPERAR POR UM
+            # ESCRITOR NA FILA AQUI TRAVARIA OS DOIS)
+            if not (
+                (self._escritor is None and not self._escritores_esperando)
+                or leituras
+                or self._escritor == thread
+            ):
+                self._esperando += 1
+                try:
+                    while self._escritor is not None or self._escritores_esperando:
+                        self._condicao.wait()
+                finally:
+                    self._esperando -= 1
+            self._leitores += 1
+        self._leituras[thread] = leituras + 1
+
+    def liberaLeitura(self):
+        thread = threading.get_ident()
+        leituras = self._leituras[thread] - 1
+        if leituras:
+            self._leituras[thread] = leituras
+        else:
+            del self._leituras[thread]
+        with self._mutex:
+            self._leitores -= 1
+            if not self._leitores and self._esperando:
+                self._condicao.notify_all()
+
+    def adquireEscrita(self):
+        """
+        ADQUIRE A TRAVA PARA ESCRITA (EXCLUSIVA).
+
+        Raises:
+            RuntimeError: SE A THREAD TEM APENAS A TRAVA DE LEITURA.
+        """
+        thread = threading.get_ident()
+        if self._escritor == thread:
+            self._profundidade_escrita += 1
+            return
+        if thread in self._leituras:
+            raise RuntimeError("NÃO É POSSÍVEL ALTERAR O GRAFO DURANTE UMA CONSULTA DA MESMA THREAD.")
+
+        with self._mutex:
+            if self._escritor is not None or self._leitores:
+                self._escritores_esperando += 1
+                self._esperando += 1
+                try:
+                    while self._escritor is not None or self._leitores:
+                        self._condicao.wait()
+                finally:
+                    self._escritores_esperando -= 1
+                    self._esperando -= 1
+            self._escritor = thread
+            self._profundidade_escrita = 1
+
+    def liberaEscrita(self):
+        self._profundidade_escrita -= 1
+        if self._profundidade_escrita:
+            return
+        with self._mutex:
+            self._escritor = None
+            if self._esperando:
+                self._condicao.notify_all()
+
+    @contextmanager
+    def leitura(self):
+        self.adquireLeitura()
+        try:
+            yield
+        finally:
+            self.liberaLeitura()
+
+    @contextmanager
+    def escrita(self):
+        self.adquireEscrita()
+        try:
+            yield
+        finally:
+            self.liberaEscrita()
+
+
+def leitura(metodo):
+    """
+    DECORADOR DE MÉTODOS DE CONSULTA: EXECUTA COM A TRAVA `self._trava` EM LEITURA.
+    """
+
+    @wraps(metodo)
+    def com_leitura(self, *args, **kwargs):
+        trava = self._trava
+        trava.adquireLeitura()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            trava.liberaLeitura()
+
+    return com_leitura
+
+
+def escrita(metodo):
+    """
+    DECORADOR DE MÉTODOS DE ALTERAÇÃO: EXECUTA COM A TRAVA `self._trava` EM ESCRITA.
+    """
+
+    @wraps(metodo)
+    def com_escrita(self, *args, **kwargs):
+        trava = self._trava
+        trava.adquireEscrita()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            trava.liberaEscrita()
+
+    return com_escrita
@@ -0,0 +1,98 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Estrutura de conjuntos disjuntos (union-find) com compressão de caminho e
+união por posto, usada pela classe `TGrafoND` como índice incremental das
+componentes conectadas: inserir vértices e arestas apenas une conjuntos,
+e as consultas de conectividade custam praticamente O(1).
+"""
+
+
+class ConjuntosDisjuntos:
+    """
+    FLORESTA DE CONJUNTOS DISJUNTOS SOBRE OS ELEMENTOS 0..N-1.
+    """
+
+    def __init__(self, tamanho: int = 0):
+        """
+        CRIA N CONJUNTOS UNITÁRIOS.
+
+        Args:
+            tamanho (int): NÚMERO INICIAL DE ELEMENTOS.
+        """
+        self._pai = list(range(tamanho))
+        self._posto = bytearray(tamanho)
+        # NÚMERO DE CONJUNTOS DISTINTOS
+        self.conjuntos = tamanho
+
+    @classmethod
+    def deRotulos(cls, rotulos: list) -> "ConjuntosDisjuntos":
+        """
+        CRIA A FLORESTA A PARTIR DE RÓTULOS DE COMPONENTES JÁ CALCULADOS, ONDE CADA
+        REPRESENTANTE É ROTULADO COM ELE MESMO (TODAS AS ÁRVORES FICAM COM ALTURA 1).
+
+        Args:
+            rotulos (list): REPRESENTANTE DE CADA ELEMENTO.
+        """
+        conjuntos = cls()
+        conjuntos._pai = list(rotulos)
+        conjuntos._posto = bytearray(len(rotulos))
+        for elemento, raiz in enumerate(rotulos):
+            if elemento != raiz:
+                conjuntos._posto[raiz] = 1
+        conjuntos.conjuntos = sum(
+            1 for elemento, raiz in enumerate(rotulos) if elemento == raiz
+        )
+        return conjuntos
+
+    def __len__(self) -> int:
+        return len(self._pai)
+
+    def adiciona(self) -> int:
+        """
+        ADICIONA UM NOVO ELEMENTO EM UM CONJUNTO UNITÁRIO.
+
+        Returns:
+            int: O NOVO ELEMENTO.
+        """
+        elemento = len(self._pai)
+        self._pai.append(elemento)
+        self._posto.append(0)
+        self.conjuntos += 1
+        return elemento
+
+    def encontra(self, elemento: int) -> int:
+        """
+        RETORNA O REPRESENTANTE DO CONJUNTO DO ELEMENTO (ITERATIVO, COM COMPRESSÃO DE CAMINHO).
+        """
+        pai = self._pai
+        raiz = elemento
+        while pai[raiz] != raiz:
+            raiz = pai[raiz]
+        while pai[elemento] != raiz:
+            pai[elemento], elemento = raiz, pai[elemento]
+        return raiz
+
+    def une(self, a: int, b: int) -> bool:
+        """
+        UNE OS CONJUNTOS DE A E B (UNIÃO POR POSTO).
+
+        Returns:
+            bool: True SE OS CONJUNTOS ERAM DISTINTOS.
+        """
+        raiz_a, raiz_b = self.encontra(a), self.encontra(b)
+        if raiz_a == raiz_b:
+            return False
+
+        if self._posto[raiz_a] < self._posto[raiz_b]:
+            raiz_a, raiz_b = raiz_b, raiz_a
+        self._pai[raiz_b] = raiz_a
+        if self._posto[raiz_a] == self._posto[raiz_b]:
+            self._posto[raiz_a] += 1
+
+        self.conjuntos -= 1
+        return True
+
+    def mesmoConjunto(self, a: int, b: int) -> bool:
+        return self.encontra(a) == self.encontra(b)
@@ -1,4 +1,7 @@
-import sys
+try:
+    from .caminhos import dijkstra as dijkstra_heap
+except ImportError:
+    from caminhos import dijkstra as dijkstra_heap
 
 
 class Graph:
@@ -12,34 +15,15 @@ class Graph:
         for node in range(self.V):
             print(node, "\t", dist[node])
 
-    def minDistance(self, dist, sptSet):
-
-        min = sys.maxsize
-        for u in range(self.V):
-            if dist[u] < min and sptSet[u] == False:
-                min = dist[u]
-                min_index = u
-
-        return min_index
+    def neighbours(self, u):
+        return ((v, w) for v, w in enumerate(self.graph[u]) if w > 0)
 
     def dijkstra(self, src):
 
-        dist = [sys.maxsize] * self.V
-        dist[src] = 0
-        sptSet = [False] * self.V
-
-        for _ in range(self.V):
-            x = self.minDistance(dist, sptSet)
-            sptSet[x] = True
-            for y in range(self.V):
-                if (
-                    self.graph[x][y] > 0
-                    and sptSet[y] == False
-                    and dist[y] > dist[x] + self.graph[x][y]
-                ):
-                    dist[y] = dist[x] + self.graph[x][y]
+        dist, _ = dijkstra_heap(self.neighbours, self.V, (src,))
 
         self.printSolution(dist)
+        return dist
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Esparsificação do grafo de livros. O grafo real é quase completo: a maioria
+dos pares de livros tem algum gênero em comum, com peso 1 ou 2, o que faz
+todo algoritmo O(V+E) custar O(V²) e junta tudo em uma única componente. As
+funções abaixo escolhem quais arestas manter:
+
+    - limiar: apenas as arestas com peso maior ou igual ao limiar;
+    - top-k: para cada vértice, as k arestas de maior peso (a aresta é mantida
+      se estiver entre as k melhores de qualquer uma das pontas), preservando
+      exatamente o que as recomendações consultam;
+    - floresta geradora máxima: algoritmo de Kruskal com union-find, que mantém
+      a conectividade de cada componente com as arestas mais fortes possíveis
+      (V - C arestas).
+
+Todas trabalham com as posições internas (slots) e retornam triplas
+(ORIGEM, DESTINO, PESO) com ORIGEM < DESTINO; a `TGrafoND` monta o novo grafo.
+"""
+
+import heapq
+
+from .conjuntos_disjuntos import ConjuntosDisjuntos
+
+METODOS = ("limiar", "topk", "floresta")
+
+
+def arestas_acima_do_limiar(arestas, limiar) -> list:
+    """
+    MANTÉM AS ARESTAS COM PESO MAIOR OU IGUAL AO LIMIAR.
+
+    Args:
+        arestas (iterable): TRIPLAS (ORIGEM, DESTINO, PESO).
+        limiar: PESO MÍNIMO DAS ARESTAS MANTIDAS.
+    """
+    return [(origem, destino, peso) for origem, destino, peso in arestas if peso >= limiar]
+
+
+def arestas_topk(vizinhos, slots, k: int) -> list:
+    """
+    MANTÉM, PARA CADA VÉRTICE, AS K ARESTAS DE MAIOR PESO (EMPATES PELO MENOR VIZINHO).
+
+    Args:
+        vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO).
+        slots (iterable): POSIÇÕES DOS VÉRTICES ATIVOS.
+        k (int): NÚMERO DE ARESTAS MANTIDAS POR VÉRTICE.
+    """
+    mantidas = {}
+    for slot in slots:
+        for negativo, vizinho in heapq.nsmallest(k, ((-peso, w) for w, peso in vizinhos(slot))):
+            mantidas[(min(slot, vizinho), max(slot, vizinho))] = -negativo
+    return [(origem, destino, peso) for (origem, destino), peso in sorted(mantidas.items())]
+
+
+def floresta_geradora_maxima(arestas, capacidade: int) -> list:
+    """
+    FLORESTA GERADORA DE PESO MÁXIMO (KRUSKAL): PERCORRE AS ARESTAS DA MAIS PESADA
+    PARA A MAIS LEVE, MANTENDO AS QUE LIGAM CONJUNTOS AINDA SEPARADOS.
+
+    Args:
+        arestas (iterable): TRIPLAS (ORIGEM, DESTINO, PESO).
+        capacidade (int): NÚMERO DE POSIÇÕES DO ARMAZENAMENTO.
+    """
+    conjuntos = ConjuntosDisjuntos(capacidade)
+    mantidas = []
+    for origem, destino, peso in sorted(arestas, key=lambda aresta: -aresta[2]):
+        if conjuntos.une(origem, destino):
+            mantidas.append((origem, destino, peso))
+    return mantidas
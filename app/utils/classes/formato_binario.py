@@ -0,0 +1,294 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Formato binário compacto e versionado para o grafo de livros, lido via
+`mmap`. O arquivo contém um cabeçalho, a tabela de nomes dos livros e a
+adjacência em formato CSR (offsets, destinos e pesos como vetores de
+largura fixa). Ao abrir o arquivo nada é convertido em listas Python: os
+vetores são acessados diretamente na memória mapeada, de modo que um grafo
+com vários GB fica disponível para consulta em milissegundos.
+
+Layout (little-endian, cada seção alinhada em 8 bytes):
+    CABEÇALHO   MAGIC "BKGR", VERSÃO, TIPOS DOS VETORES, FLAGS, N, M, BYTES DOS NOMES
+    IDS         int64[N]       NÚMERO DO VÉRTICE EM CADA POSIÇÃO
+    NOMES       uint64[N + 1]  OFFSETS + BYTES UTF-8 DOS NOMES
+    OFFSETS     uint64[N + 1]  INÍCIO DOS VIZINHOS DE CADA POSIÇÃO
+    DESTINOS    uint32/uint64[M] POSIÇÕES VIZINHAS (ORDENADAS POR VÉRTICE)
+    PESOS       uint8/uint16/int32/int64/float64[M]  O TIPO MAIS ESTREITO QUE COMPORTA OS PESOS
+
+Uso como conversor:
+    python -m app.utils.classes.formato_binario app/data/grafo.txt app/data/grafo.bkg
+"""
+
+import mmap
+import os
+import struct
+import sys
+import threading
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from contextlib import contextmanager
+
+from loguru import logger
+
+from .vertices import AlocadorVertices
+
+MAGIC = b"BKGR"
+VERSAO = 1
+# MAGIC, VERSÃO, TIPO DOS DESTINOS, TIPO DOS PESOS, FLAGS, N, M, BYTES DOS NOMES
+CABECALHO = struct.Struct("<4sHccHxxQQQ")
+# OS IDENTIFICADORES DOS VÉRTICES SÃO EXATAMENTE 0..N-1
+FLAG_IDS_SEQUENCIAIS = 1
+
+
+def _alinha(posicao: int) -> int:
+    return (posicao + 7) & ~7
+
+
+@contextmanager
+def gravacao_atomica(arquivo: str, modo: str = "wb"):
+    """
+    ABRE UM ARQUIVO TEMPORÁRIO AO LADO DE `arquivo` E, AO FINAL DO BLOCO, O GRAVA EM
+    DISCO (fsync) E O RENOMEIA PARA `arquivo`. O ARQUIVO ANTIGO NUNCA FICA PELA METADE
+    E UM MAPEAMENTO (mmap) DELE CONTINUA VÁLIDO, POIS APONTA PARA O INODE ANTIGO;
+    REESCREVÊ-LO NO LUGAR DERRUBARIA O PROCESSO (SIGBUS) EM UMA CONSULTA CONCORRENTE.
+    SE O BLOCO FALHAR, O TEMPORÁRIO É REMOVIDO E O ARQUIVO ANTIGO FICA INTACTO.
+
+    Args:
+        arquivo (str): O CAMINHO FINAL DO ARQUIVO.
+        modo (str): MODO DE ABERTURA DO TEMPORÁRIO ("wb" OU "w").
+    """
+    temporario = f"{arquivo}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporario, modo) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, arquivo)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+
+class ArmazenamentoCSR:
+    """
+    ADJACÊNCIA SOMENTE LEITURA EM FORMATO CSR SOBRE VETORES MAPEADOS EM MEMÓRIA.
+    """
+
+    nome = "csr"
+    somente_leitura = True
+
+    def __init__(self, offsets, destinos, pesos, mapa=None, arquivo=None):
+        """
+        Args:
+            offsets (memoryview): INÍCIO DOS VIZINHOS DE CADA POSIÇÃO (N + 1 VALORES).
+            destinos (memoryview): POSIÇÕES VIZINHAS, ORDENADAS DENTRO DE CADA POSIÇÃO.
+            pesos (memoryview): PESO DE CADA ENTRADA DE `destinos`.
+            mapa (mmap.mmap): MAPEAMENTO QUE MANTÉM OS VETORES VÁLIDOS.
+            arquivo (str): O ARQUIVO BINÁRIO MAPEADO (PODE SER REABERTO POR OUTROS PROCESSOS).
+        """
+        self._offsets = offsets
+        self._destinos = destinos
+        self._pesos = pesos
+        self._mapa = mapa
+        self.arquivo = arquivo
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _somenteLeitura(self, *args):
+        raise TypeError("O ARMAZENAMENTO CSR MAPEADO EM MEMÓRIA É SOMENTE LEITURA.")
+
+    adicionaVertice = limpaVertice = compacta = definePeso = _somenteLeitura
+
+    def peso(self, origem: int, destino: int):
+        inicio, fim = self._offsets[origem], self._offsets[origem + 1]
+        posicao = bisect_left(self._destinos, destino, inicio, fim)
+        if posicao < fim and self._destinos[posicao] == destino:
+            return self._pesos[posicao]
+        return 0
+
+    def vizinhos(self, vertice: int):
+        inicio, fim = self._offsets[vertice], self._offsets[vertice + 1]
+        return zip(self._destinos[inicio:fim], self._pesos[inicio:fim])
+
+    def grau(self, vertice: int) -> int:
+        return self._offsets[vertice + 1] - self._offsets[vertice]
+
+    def arestas(self):
+        for origem in range(len(self)):
+            for destino, peso in self.vizinhos(origem):
+                if origem < destino:
+                    yield origem, destino, peso
+
+    def linha(self, vertice: int) -> list:
+        linha = [0] * len(self)
+        for destino, peso in self.vizinhos(vertice):
+            linha[destino] = peso
+        return linha
+
+
+class TitulosMapeados(Mapping):
+    """
+    DICIONÁRIO SOMENTE LEITURA {VÉRTICE: NOME DO LIVRO} SOBRE A TABELA DE NOMES MAPEADA.
+    OS NOMES SÓ SÃO DECODIFICADOS QUANDO ACESSADOS.
+    """
+
+    def __init__(self, alocador, offsets, dados):
+        self._alocador = alocador
+        self._offsets = offsets
+        self._dados = dados
+        self._tamanho = None
+
+    def _titulo(self, slot: int) -> str:
+        return str(self._dados[self._offsets[slot] : self._offsets[slot + 1]], "utf-8")
+
+    def __getitem__(self, vertice) -> str:
+        if vertice not in self._alocador:
+            raise KeyError(vertice)
+        slot = self._alocador.slot(vertice)
+        if self._offsets[slot] == self._offsets[slot + 1]:
+            raise KeyError(vertice)
+        return self._titulo(slot)
+
+    def __iter__(self):
+        for slot, vertice in self._alocador.slotsAtivos():
+            if self._offsets[slot] != self._offsets[slot + 1]:
+                yield vertice
+
+    def __len__(self) -> int:
+        if self._tamanho is None:
+            self._tamanho = sum(1 for _ in self)
+        return self._tamanho
+
+
+def grava_binario(grafo, arquivo: str):
+    """
+    GRAVA UM `TGrafoND` NO FORMATO BINÁRIO, COM AS POSIÇÕES COMPACTADAS.
+
+    Args:
+        grafo (TGrafoND): O GRAFO A SER GRAVADO.
+        arquivo (str): O CAMINHO DO ARQUIVO BINÁRIO.
+    """
+    ativos = list(grafo._alocador.slotsAtivos())
+    n = len(ativos)
+    nova_posicao = {slot: posicao for posicao, (slot, _) in enumerate(ativos)}
+
+    ids = array("q", (vertice for _, vertice in ativos))
+    sequenciais = all(vertice == posicao for posicao, vertice in enumerate(ids))
+
+    nomes = array("Q", [0])
+    dados_nomes = bytearray()
+    for _, vertice in ativos:
+        dados_nomes += grafo.livros.get(vertice, "").replace('"', "").encode("utf-8")
+        nomes.append(len(dados_nomes))
+
+    offsets = array("Q", [0])
+    destinos = array("I" if n < 2**32 else "Q")
+    lista_pesos = []
+    for slot, _ in ativos:
+        vizinhos = sorted(
+            (nova_posicao[destino], peso) for destino, peso in grafo.grafo.vizinhos(slot)
+        )
+        destinos.extend(destino for destino, _ in vizinhos)
+        lista_pesos.extend(peso for _, peso in vizinhos)
+        offsets.append(len(destinos))
+
+    # ESCOLHE O VETOR DE PESOS MAIS ESTREITO QUE COMPORTA TODOS OS VALORES
+    for tipo in ("B", "H", "i", "q", "d"):
+        try:
+            pesos = array(tipo, lista_pesos)
+            break
+        except (OverflowError, TypeError):
+            continue
+
+    with gravacao_atomica(arquivo, "wb") as f:
+        f.write(
+            CABECALHO.pack(
+                MAGIC,
+                VERSAO,
+                destinos.typecode.encode(),
+                pesos.typecode.encode(),
+                FLAG_IDS_SEQUENCIAIS if sequenciais else 0,
+                n,
+                len(destinos),
+                len(dados_nomes),
+            )
+        )
+        f.write(b"\0" * (_alinha(f.tell()) - f.tell()))
+        for secao in (ids, nomes, bytes(dados_nomes), offsets, destinos, pesos):
+            f.write(secao if isinstance(secao, bytes) else secao.tobytes())
+            f.write(b"\0" * (_alinha(f.tell()) - f.tell()))
+
+    logger.info(f"GRAFO GRAVADO NO FORMATO BINÁRIO NO ARQUIVO {arquivo}.")
+
+
+def abre_binario(arquivo: str) -> tuple:
+    """
+    ABRE UM ARQUIVO BINÁRIO VIA MMAP, SEM MATERIALIZAR A ADJACÊNCIA.
+
+    Args:
+        arquivo (str): O CAMINHO DO ARQUIVO BINÁRIO.
+
+    Returns:
+        tuple: (ArmazenamentoCSR, AlocadorVertices, TitulosMapeados).
+    """
+    with open(arquivo, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, versao, tipo_destino, tipo_peso, flags, n, m, bytes_nomes = (
+        CABECALHO.unpack_from(mapa)
+    )
+    if magic != MAGIC:
+        raise ValueError(f"O ARQUIVO {arquivo} NÃO ESTÁ NO FORMATO BINÁRIO DO GRAFO.")
+    if versao > VERSAO:
+        raise ValueError(f"VERSÃO {versao} DO FORMATO BINÁRIO NÃO É SUPORTADA.")
+
+    memoria = memoryview(mapa)
+    posicao = _alinha(CABECALHO.size)
+
+    def secao(tipo: str, quantidade: int):
+        nonlocal posicao
+        tamanho = array(tipo).itemsize * quantidade
+        vetor = memoria[posicao : posicao + tamanho].cast(tipo)
+        posicao = _alinha(posicao + tamanho)
+        return vetor
+
+    ids = secao("q", n)
+    offsets_nomes = secao("Q", n + 1)
+    dados_nomes = secao("B", bytes_nomes)
+    offsets = secao("Q", n + 1)
+    destinos = secao(tipo_destino.decode(), m)
+    pesos = secao(tipo_peso.decode(), m)
+
+    if flags & FLAG_IDS_SEQUENCIAIS:
+        alocador = AlocadorVertices(n)
+    else:
+        alocador = AlocadorVertices.deIds(ids)
+
+    armazenamento = ArmazenamentoCSR(offsets, destinos, pesos, mapa, arquivo)
+    return armazenamento, alocador, TitulosMapeados(alocador, offsets_nomes, dados_nomes)
+
+
+def converte_para_binario(arquivo_txt: str, arquivo_binario: str):
+    """
+    CONVERTE UM ARQUIVO TXT DO GRAFO (grafo.txt, grafo_raw_*.txt) PARA O FORMATO BINÁRIO.
+
+    Args:
+        arquivo_txt (str): O CAMINHO DO ARQUIVO TXT DE ORIGEM.
+        arquivo_binario (str): O CAMINHO DO ARQUIVO BINÁRIO DE DESTINO.
+    """
+    from .grafo_nd import TGrafoND
+
+    grafo = TGrafoND(armazenamento="esparso")
+    if not grafo.leArquivo(arquivo_txt, imprimir=False):
+        raise ValueError(f"ERRO AO CARREGAR O GRAFO DO ARQUIVO {arquivo_txt}.")
+    grava_binario(grafo, arquivo_binario)
+
+
+if __name__ == "__main__":
+    converte_para_binario(sys.argv[1], sys.argv[2])
@@ -19,55 +19,236 @@ as componentes conectadas do grafo original, mostrando como as diferentes partes
 do grafo estão interligadas.
 """
 
-from collections import deque
+import heapq
+import os
+import threading
+
+from itertools import islice
+from time import perf_counter
 
 from loguru import logger
 
+from .armazenamento import TIPO_PESO_PADRAO, ArmazenamentoEsparso, cria_armazenamento, np
+from .cache import MAX_BYTES, MAX_ENTRADAS, CacheConsultas, memoiza
+from .caminhos import (
+    INFINITO,
+    dijkstra as dijkstra_heap,
+    reconstroi_caminho,
+    similaridade_para_distancia,
+    todos_os_pares,
+)
+from .centralidade import (
+    centralidade_grau,
+    centralidade_intermediacao,
+    centralidade_proximidade,
+    distancias_todos_os_pares,
+)
+from .comunidades import AdjacenciaCompacta, louvain, modularidade, propagacao_rotulos
+from .concorrencia import TravaLeituraEscrita, escrita, leitura
+from .conjuntos_disjuntos import ConjuntosDisjuntos
+from .esparsificacao import METODOS, arestas_acima_do_limiar, arestas_topk, floresta_geradora_maxima
+from .formato_binario import abre_binario, grava_binario, gravacao_atomica
+from .indice_titulos import IndiceTitulos
+from .instrumentacao import detalhado, instrumenta, silencioso
+from .percurso import busca_largura, rotula_componentes
+from .recomendacao import K_PADRAO, IndiceTopK
+from .versionamento import HistoricoMutacoes, arquivo_delta, inverte, le_delta
+from .vertices import AlocadorVertices
+
+# NÚMERO PADRÃO DE LINHAS DE ARESTAS INTERPRETADAS POR LOTE NA LEITURA DO ARQUIVO
+TAMANHO_LOTE_ARESTAS = 65536
+# NÚMERO PADRÃO DE VÉRTICES (LINHAS E COLUNAS) EXIBIDOS POR JANELA DA MATRIZ
+TAMANHO_JANELA = 20
+# NÚMERO PADRÃO DE ITENS EXIBIDOS POR PÁGINA NAS LISTAGENS DE VÉRTICES E ARESTAS
+TAMANHO_PAGINA = 50
+
+
+def faixa_potencia_de_dois(valor: int) -> str:
+    """
+    RETORNA A FAIXA [2^k, 2^(k+1)-1] DO VALOR, USADA NAS DISTRIBUIÇÕES DO RESUMO.
+    """
+    if valor <= 1:
+        return str(valor)
+    inicio = 1 << (valor.bit_length() - 1)
+    return f"{inicio}-{2 * inicio - 1}"
+
+
+def lotes_de_arestas(arquivo, tamanho_lote: int = TAMANHO_LOTE_ARESTAS):
+    """
+    INTERPRETA AS LINHAS DE ARESTAS ("ORIGEM DESTINO PESO") DE UM ARQUIVO JÁ
+    ABERTO, EM LOTES, SEM CRIAR UMA LISTA COM TODAS AS LINHAS DO ARQUIVO.
+
+    Args:
+        arquivo: ARQUIVO DE TEXTO ABERTO, POSICIONADO NA PRIMEIRA LINHA DE ARESTA.
+        tamanho_lote (int): NÚMERO DE LINHAS LIDAS POR LOTE.
+
+    Yields:
+        list: LISTA DE TRIPLAS (ORIGEM, DESTINO, PESO) DE CADA LOTE.
+    """
+    while True:
+        linhas = list(islice(arquivo, tamanho_lote))
+        if not linhas:
+            return
+
+        # TOKENIZA O LOTE INTEIRO DE UMA VEZ E AGRUPA OS VALORES DE TRÊS EM TRÊS
+        valores = list(map(int, "".join(linhas).split()))
+        if len(valores) % 3:
+            raise ValueError("LINHA DE ARESTA MALFORMADA: ESPERADO 'ORIGEM DESTINO PESO'.")
+
+        iterador = iter(valores)
+        yield list(zip(iterador, iterador, iterador))
+
+
 class TGrafoND:
-    def __init__(self):
+    def __init__(self, armazenamento: str = "denso", tipo_peso: str = TIPO_PESO_PADRAO):
         """
-        INICIALIZA O GRAFO COM UMA MATRIZ DE ADJACÊNCIA
-        DE TAMANHO `VERTICES` x `VERTICES`.
+        INICIALIZA O GRAFO VAZIO COM O BACKEND DE ARMAZENAMENTO ESCOLHIDO.
 
         Args:
-            vertices (int): NÚMERO DE VÉRTICES DO GRAFO.
+            armazenamento (str): "denso" (MATRIZ DE ADJACÊNCIA) OU
+                "esparso" (LISTA DE ADJACÊNCIA, RECOMENDADO PARA GRAFOS GRANDES).
+            tipo_peso (str): TIPO DOS PESOS ("uint8", "uint16", "int32", "float32", ...)
+                OU "auto" (PROMOVIDO CONFORME OS PESOS INSERIDOS; VER `armazenamento.py`).
         """
 
         # INICIALIZA O NÚMERO DE VÉRTICES
         self.vertices = 0
-        # CRIA A MATRIZ DE ADJACÊNCIA COM TODOS OS VALORES INICIALIZADOS EM 0
-        self.grafo = []
+        # CRIA O ARMAZENAMENTO DA ADJACÊNCIA (SEM VÉRTICES)
+        self.armazenamento = armazenamento
+        self.tipo_peso = tipo_peso
+        self.grafo = cria_armazenamento(armazenamento, tipo_peso=tipo_peso)
+        # MAPEIA O NÚMERO (ESTÁVEL) DE CADA VÉRTICE PARA SUA POSIÇÃO NO ARMAZENAMENTO
+        self._alocador = AlocadorVertices()
         self.livros = {}
+        # ÍNDICE INCREMENTAL DAS COMPONENTES CONECTADAS (None = RECONSTRUIR NA PRÓXIMA CONSULTA)
+        self._componentes = None
+        # ÍNDICE DOS K VIZINHOS MAIS SIMILARES DE CADA VÉRTICE (CRIADO NA PRIMEIRA RECOMENDAÇÃO)
+        self._topk = None
+        # ÍNDICE DE BUSCA DOS LIVROS PELO TÍTULO (CRIADO NA PRIMEIRA BUSCA)
+        self._titulos = None
+        # LOG DAS ALTERAÇÕES (DESFAZER/REFAZER, SNAPSHOTS E ARQUIVO DELTA)
+        self._historico = HistoricoMutacoes()
+        # ÚLTIMO ARQUIVO LIDO OU GRAVADO POR COMPLETO (BASE DO ARQUIVO DELTA)
+        self.arquivo_base = None
+        # CONSULTAS SIMULTÂNEAS COMPARTILHAM A TRAVA; ALTERAÇÕES A TÊM COM EXCLUSIVIDADE
+        self._trava = TravaLeituraEscrita()
+        # O QUE AS CONSULTAS ALTERAM SOB A TRAVA COMPARTILHADA É SERIALIZADO À PARTE: A
+        # GRAVAÇÃO DE ARQUIVOS (COM O DESCARTE DAS ALTERAÇÕES PENDENTES) E A PUBLICAÇÃO
+        # DOS ÍNDICES CRIADOS SOB DEMANDA
+        self._trava_gravacao = threading.Lock()
+        self._trava_indices = threading.Lock()
+        # VERSÃO DO GRAFO, INCREMENTADA POR TODA ALTERAÇÃO, E CACHE DAS CONSULTAS DA VERSÃO ATUAL
+        self._versao = 0
+        self._cache = CacheConsultas()
+
+    def _slot(self, vertice: int) -> int:
+        """
+        RETORNA A POSIÇÃO INTERNA DO VÉRTICE NO ARMAZENAMENTO.
 
-    def imprimeGrafo(self):
+        Raises:
+            ValueError: SE O VÉRTICE NÃO EXISTE NO GRAFO.
+        """
+        return self._alocador.slot(vertice)
+
+    def _garanteMutavel(self):
+        """
+        CONVERTE UM GRAFO ABERTO DO FORMATO BINÁRIO (SOMENTE LEITURA) PARA O
+        ARMAZENAMENTO ESPARSO ANTES DA PRIMEIRA ALTERAÇÃO.
+        """
+        if getattr(self.grafo, "somente_leitura", False):
+            esparso = ArmazenamentoEsparso(len(self.grafo), self.tipo_peso)
+            for origem, destino, peso in self.grafo.arestas():
+                esparso.definePeso(origem, destino, peso)
+            self.grafo = esparso
+            self.armazenamento = esparso.nome
+            self.livros = dict(self.livros)
+
+    def _indiceComponentes(self) -> ConjuntosDisjuntos:
+        """
+        RETORNA O ÍNDICE UNION-FIND DAS COMPONENTES CONECTADAS, RECONSTRUINDO-O
+        APENAS SE UMA REMOÇÃO O INVALIDOU DESDE A ÚLTIMA CONSULTA. A RECONSTRUÇÃO
+        USA A BUSCA EM PROFUNDIDADE ITERATIVA, EM O(V+E) E SEM RECURSÃO.
+        """
+        with self._trava_indices:
+            if self._componentes is None:
+                self._componentes = ConjuntosDisjuntos.deRotulos(
+                    rotula_componentes(self.grafo.vizinhos, len(self.grafo))
+                )
+            return self._componentes
+
+    def _numeroArestas(self) -> int:
+        """
+        CONTA AS ARESTAS (SEM LAÇOS, COMO EM `arestas()`) PELOS GRAUS DAS POSIÇÕES
+        ATIVAS, SEM PERCORRER AS ARESTAS UMA A UMA.
+        """
+        grau, peso = self.grafo.grau, self.grafo.peso
+        soma = 0
+        for slot, _ in self._alocador.slotsAtivos():
+            soma += grau(slot) - (peso(slot, slot) != 0)
+        return soma // 2
+
+    def _indiceTitulos(self) -> IndiceTitulos:
+        """
+        RETORNA O ÍNDICE DE TÍTULOS, CRIANDO-O A PARTIR DE `self.livros` NA PRIMEIRA BUSCA.
+        """
+        with self._trava_indices:
+            if self._titulos is None:
+                self._titulos = IndiceTitulos(self.livros)
+            return self._titulos
+
+    @instrumenta
+    @leitura
+    def imprimeGrafo(
+        self, linha_inicial: int = 0, coluna_inicial: int = None, tamanho: int = TAMANHO_JANELA
+    ):
         """
-        EXIBE A MATRIZ DE ADJACÊNCIA DO GRAFO.
+        EXIBE UMA JANELA DA MATRIZ DE ADJACÊNCIA DO GRAFO. A SAÍDA TEM NO MÁXIMO
+        `tamanho` x `tamanho` CÉLULAS, QUALQUER QUE SEJA O TAMANHO DO GRAFO.
+
+        Args:
+            linha_inicial (int): POSIÇÃO (NA ORDEM DOS VÉRTICES) DA PRIMEIRA LINHA EXIBIDA.
+            coluna_inicial (int): POSIÇÃO DA PRIMEIRA COLUNA (PADRÃO: A MESMA DA LINHA).
+            tamanho (int): NÚMERO DE LINHAS E DE COLUNAS DA JANELA.
         """
 
-        if self.grafo:
-            logger.info("A MATRIZ DE ADJACÊNCIA É: ")
-            print(f"\n{'     ':^2}" + f" ".join([f"{i:^2}" for i in range(self.vertices)]))
-            print(f"{'     ':^2}" + f" ".join([f"{'-':^2}" for _ in range(self.vertices)]))
-            for i in range(self.vertices):
-                aux = []
-                for peso in self.grafo[i]:
-                    aux.append(f"{str(peso):^2}")
+        if self.vertices:
+            if coluna_inicial is None:
+                coluna_inicial = linha_inicial
+            linhas = list(islice(self._alocador.slotsAtivos(), linha_inicial, linha_inicial + tamanho))
+            colunas = list(islice(self._alocador.slotsAtivos(), coluna_inicial, coluna_inicial + tamanho))
+
+            logger.info(
+                f"A MATRIZ DE ADJACÊNCIA É (LINHAS {linha_inicial} A {linha_inicial + len(linhas) - 1}, "
+                f"COLUNAS {coluna_inicial} A {coluna_inicial + len(colunas) - 1} DE {self.vertices} VÉRTICES): "
+            )
+            print(f"\n{'     ':^2}" + f" ".join([f"{i:^2}" for _, i in colunas]))
+            print(f"{'     ':^2}" + f" ".join([f"{'-':^2}" for _ in colunas]))
+            peso = self.grafo.peso
+            for slot, i in linhas:
+                aux = [f"{str(peso(slot, destino)):^2}" for destino, _ in colunas]
                 print(f"{i:^2} | {' '.join(aux)}")
         else:
             logger.info("A MATRIZ DE ADJACÊNCIA AINDA NÃO FOI CRIADA! LEIA UM ARQUIVO OU ADICIONE VÉRTICES E ARESTAS!")
 
-
-
-    def imprimeRelacaoVertices(self):
+    @leitura
+    def imprimeRelacaoVertices(self, inicio: int = 0, tamanho: int = TAMANHO_PAGINA):
         """
-        EXIBE A MATRIZ DE ADJACÊNCIA DO GRAFO.
+        EXIBE UMA PÁGINA DA RELAÇÃO ENTRE OS VÉRTICES E OS NOMES DOS LIVROS.
+
+        Args:
+            inicio (int): POSIÇÃO DO PRIMEIRO VÉRTICE EXIBIDO.
+            tamanho (int): NÚMERO DE VÉRTICES EXIBIDOS.
         """
 
-        logger.info("A MATRIZ DE ADJACÊNCIA É: ")
-        for num, nome in self.livros.items():
-            print(f"{num} --> {nome}")
+        logger.info(
+            f"A RELAÇÃO DE VÉRTICES É ({inicio} A {min(inicio + tamanho, self.vertices) - 1} DE {self.vertices}): "
+        )
+        for num in islice(self._alocador.ids(), inicio, inicio + tamanho):
+            print(f"{num} --> {self.livros.get(num, '')}")
 
-    def insereAresta(self, vertice_origem: int, vertice_destino: int, peso: int = 1):
+    @instrumenta
+    @escrita
+    def insereAresta(self, vertice_origem: int, vertice_destino: int, peso: int = 1) -> bool:
         """
         INSERE UMA ARESTA ENTRE OS VÉRTICES U E V EM UM GRAFO NÃO-DIRIGIDO.
 
@@ -75,298 +256,1255 @@ class TGrafoND:
             vertice_origem (int): O ÍNDICE DO VÉRTICE DE ORIGEM (1-INDEXADO).
             vertice_destino (int): O ÍNDICE DO VÉRTICE DE DESTINO (1-INDEXADO).
             peso (int): O PESO DA ARESTA.
+
+        Returns:
+            bool: True SE A ARESTA FOI INSERIDA; False SE HOUVE ERRO (EX.: VÉRTICE
+                INEXISTENTE), QUE É APENAS REGISTRADO NO LOG.
+
+        Raises:
+            OverflowError: SE O PESO NÃO CABE NO TIPO DOS PESOS DO GRAFO (`tipo_peso`).
         """
 
         try:
+            self._garanteMutavel()
+            origem, destino = self._slot(vertice_origem), self._slot(vertice_destino)
+            anterior = self.grafo.peso(origem, destino)
+
             # ADICIONA UMA ARESTA ENTRE U E V (NÃO DIRIGIDO)
-            self.grafo[vertice_origem][vertice_destino] = peso
-            self.grafo[vertice_destino][vertice_origem] = peso
-            
-            # INFORMA A INSERÇÃO E MOSTRA A MATRIZ DE ADJACÊNCIA ATUALIZADA
-            logger.info(
-                f"ARESTA INSERIDA ENTRE OS VÉRTICES {vertice_origem} E {vertice_destino} COM PESO {peso}."
+            self.grafo.definePeso(origem, destino, peso)
+            self._versao += 1
+            if anterior != peso:
+                self._historico.registra(("A", vertice_origem, vertice_destino, anterior, peso))
+
+            # ATUALIZA O ÍNDICE DE COMPONENTES (PESO 0 EQUIVALE A REMOVER A ARESTA)
+            if self._componentes is not None:
+                if peso != 0:
+                    self._componentes.une(origem, destino)
+                elif anterior != 0:
+                    self._componentes = None
+            if self._topk is not None:
+                self._topk.atualiza(origem, destino, peso)
+
+            # INFORMA A INSERÇÃO (EXCETO NO MODO SILENCIOSO)
+            if detalhado():
+                logger.info(
+                    f"ARESTA INSERIDA ENTRE OS VÉRTICES {vertice_origem} E {vertice_destino} COM PESO {peso}."
+                )
+            return True
+        except OverflowError as erro:
+            # O PESO NÃO CABE NO TIPO DOS PESOS DO ARMAZENAMENTO: A ARESTA NÃO É ALTERADA
+            logger.error(
+                f"ERRO AO INSERIR ARESTA ENTRE OS VÉRTICES {vertice_origem} E {vertice_destino}: {erro}"
             )
+            raise
         except Exception:
             logger.error(
                 f"ERRO AO INSERIR ARESTA ENTRE OS VÉRTICES {vertice_origem} E {vertice_destino}."
             )
+            return False
 
 
-    def removeAresta(self, vertice_origem: int, vertice_destino: int):
+    @instrumenta
+    @escrita
+    def removeAresta(self, vertice_origem: int, vertice_destino: int) -> bool:
         """
         REMOVE A ARESTA ENTRE OS VÉRTICES U E V EM UM GRAFO NÃO-DIRIGIDO E EXIBE A MATRIZ RESULTANTE.
 
         Args:
             vertice_origem (int): O ÍNDICE DO VÉRTICE DE ORIGEM (1-INDEXADO).
             vertice_destino (int): O ÍNDICE DO VÉRTICE DE DESTINO (1-INDEXADO).
+
+        Returns:
+            bool: True SE A ARESTA EXISTIA E FOI REMOVIDA.
         """
 
+        self._garanteMutavel()
+        origem, destino = self._slot(vertice_origem), self._slot(vertice_destino)
+        anterior = self.grafo.peso(origem, destino)
         # REMOVE A ARESTA ENTRE U E V (NÃO DIRIGIDO)
-        self.grafo[vertice_origem][vertice_destino] = 0
-        self.grafo[vertice_destino][vertice_origem] = 0
-
-        # INFORMA A REMOÇÃO E MOSTRA A MATRIZ DE ADJACÊNCIA ATUALIZADA
-        logger.info(
-            f"ARESTA REMOVIDA ENTRE OS VÉRTICES {vertice_origem} E {vertice_destino}."
-        )
+        self.grafo.definePeso(origem, destino, 0)
+        self._versao += 1
+        if anterior != 0:
+            self._historico.registra(("A", vertice_origem, vertice_destino, anterior, 0))
+        self._componentes = None
+        if self._topk is not None:
+            self._topk.atualiza(origem, destino, 0)
+
+        # INFORMA A REMOÇÃO (EXCETO NO MODO SILENCIOSO)
+        if detalhado():
+            logger.info(
+                f"ARESTA REMOVIDA ENTRE OS VÉRTICES {vertice_origem} E {vertice_destino}."
+            )
+        return anterior != 0
 
-    def insereVertice(self):
+    @instrumenta
+    @escrita
+    def insereVertice(self, nome_livro: str = None, vertice: int = None) -> int:
         """
-        INSERE UM NOVO VÉRTICE NO GRAFO.
+        INSERE UM NOVO VÉRTICE NO GRAFO EM O(1) AMORTIZADO, REAPROVEITANDO
+        A POSIÇÃO DE UM VÉRTICE REMOVIDO QUANDO HOUVER.
+
+        Args:
+            nome_livro (str): NOME DO LIVRO REPRESENTADO PELO VÉRTICE (OPCIONAL).
+            vertice (int): NÚMERO DESEJADO PARA O VÉRTICE (PADRÃO: O PRÓXIMO LIVRE).
+
+        Returns:
+            int: O NÚMERO DO VÉRTICE INSERIDO.
         """
 
-        self.vertices += 1
+        self._garanteMutavel()
+        vertice, slot = self._alocador.aloca(vertice)
 
-        # ADICIONA UMA NOVA LINHA E COLUNA COM 0 PARA A NOVA MATRIZ DE ADJACÊNCIA
-        self.grafo.append([0] * self.vertices)
-        for i in range(self.vertices-1):
-            self.grafo[i].append(0)
+        # SE NÃO HOUVE POSIÇÃO LIVRE, OCUPA UMA NOVA POSIÇÃO (SEM ARESTAS) NO ARMAZENAMENTO
+        if slot == len(self.grafo):
+            self.grafo.adicionaVertice()
+            if self._componentes is not None:
+                self._componentes.adiciona()
+            if self._topk is not None:
+                self._topk.adiciona()
 
-        self.imprimeGrafo()
-        logger.info(f"VÉRTICE {self.vertices-1} INSERIDO COM SUCESSO.")
+        if nome_livro is not None:
+            self.livros[vertice] = nome_livro
+            if self._titulos is not None:
+                self._titulos.adiciona(vertice, nome_livro)
 
+        self.vertices += 1
+        self._versao += 1
+        self._historico.registra(("V+", vertice, nome_livro))
+        if detalhado():
+            logger.info(f"VÉRTICE {vertice} INSERIDO COM SUCESSO.")
+        return vertice
+
+    @instrumenta
+    @escrita
     def removeVertice(self, vertice: int):
         """
         REMOVE UM VÉRTICE DE UM GRAFO NÃO-DIRECIONADO E TODAS AS ARESTAS ASSOCIADAS.
 
         Args:
-            vertice (int): O ÍNDICE DO VÉRTICE A SER REMOVIDO (1-INDEXADO).
+            vertice (int): O NÚMERO DO VÉRTICE A SER REMOVIDO.
         """
 
-        # REMOVE A LINHA DO VÉRTICE
-        self.grafo.pop(vertice)
-
-        # REMOVE A COLUNA DO VÉRTICE EM CADA LINHA RESTANTE
-        for i in range(len(self.grafo)):
-            self.grafo[i].pop(vertice)
+        # MARCA A POSIÇÃO DO VÉRTICE COMO LIVRE E REMOVE TODAS AS SUAS ARESTAS
+        # (OS DEMAIS VÉRTICES MANTÊM SEUS NÚMEROS, SEM RENUMERAÇÃO)
+        self._garanteMutavel()
+        slot = self._alocador.libera(vertice)
+        if self._historico.ativo:
+            # GUARDA AS ARESTAS DO VÉRTICE PARA PODER DESFAZER A REMOÇÃO
+            id_vertice = self._alocador.vertice
+            arestas = [
+                (vertice if v == slot else id_vertice(v), peso) for v, peso in self.grafo.vizinhos(slot)
+            ]
+            self._historico.registra(("V-", vertice, self.livros.get(vertice), arestas))
+        if self._topk is not None:
+            self._topk.removeSlot(slot, self.grafo.vizinhos)
+        self.grafo.limpaVertice(slot)
+        self.livros.pop(vertice, None)
+        if self._titulos is not None:
+            self._titulos.remove(vertice)
+        self._componentes = None
+        self._versao += 1
 
         # ATUALIZAR O NÚMERO DE VÉRTICES
         self.vertices -= 1
 
-        # INFORMA A REMOÇÃO E MOSTRA A MATRIZ DE ADJACÊNCIA ATUALIZADA
-        logger.success(
-            f"VÉRTICE {vertice} E TODAS AS ARESTAS ASSOCIADAS FORAM REMOVIDAS."
-        )
+        # INFORMA A REMOÇÃO (EXCETO NO MODO SILENCIOSO)
+        if detalhado():
+            logger.success(
+                f"VÉRTICE {vertice} E TODAS AS ARESTAS ASSOCIADAS FORAM REMOVIDAS."
+            )
 
-    def leArquivo(self, arquivo: str):
+    @instrumenta
+    @escrita
+    def compactar(self):
+        """
+        ELIMINA AS POSIÇÕES LIVRES DEIXADAS POR VÉRTICES REMOVIDOS, REORGANIZANDO
+        O ARMAZENAMENTO. OS NÚMEROS DOS VÉRTICES (E `self.livros`) NÃO MUDAM.
+        """
+
+        self._garanteMutavel()
+        if self._alocador.lapides:
+            self.grafo.compacta(self._alocador.compacta())
+            self._componentes = None
+            self._topk = None
+        logger.info("GRAFO COMPACTADO.")
+
+    @instrumenta
+    @escrita
+    def leArquivo(
+        self,
+        arquivo: str,
+        tamanho_lote: int = TAMANHO_LOTE_ARESTAS,
+        imprimir: bool = True,
+        tipo_peso: str = None,
+    ) -> bool:
         """
         CARREGA O GRAFO A PARTIR DE UM ARQUIVO TXT E SALVA OS NOMES DOS LIVROS.
 
+        O ARQUIVO É LIDO EM UMA ÚNICA PASSADA, SEM CARREGAR TODAS AS LINHAS NA
+        MEMÓRIA: O CABEÇALHO E OS VÉRTICES SÃO LIDOS LINHA A LINHA E AS ARESTAS
+        SÃO INTERPRETADAS EM LOTES E INSERIDAS SEM LOG POR ARESTA. SE EXISTIR UM
+        ARQUIVO DELTA AO LADO DO ARQUIVO (VER `gravarDelta`), SUAS ALTERAÇÕES SÃO
+        APLICADAS EM SEGUIDA. O HISTÓRICO DE ALTERAÇÕES RECOMEÇA VAZIO.
+
         Args:
             arquivo (str): O CAMINHO DO ARQUIVO TXT QUE CONTÉM OS DADOS DO GRAFO.
+            tamanho_lote (int): NÚMERO DE LINHAS DE ARESTAS INTERPRETADAS POR LOTE.
+            imprimir (bool): EXIBE A PRIMEIRA JANELA DA MATRIZ DE ADJACÊNCIA AO FINAL DA LEITURA.
+            tipo_peso (str): TIPO DOS PESOS DO GRAFO LIDO (PADRÃO: O ATUAL, `self.tipo_peso`).
+                UM PESO DO ARQUIVO QUE NÃO CAIBA NO TIPO INTERROMPE A LEITURA.
+
+        Returns:
+            bool: True SE O GRAFO FOI CARREGADO; False SE HOUVE ERRO, QUE É APENAS
+                REGISTRADO NO LOG.
+
+        Raises:
+            OverflowError: SE UM PESO NÃO CABE NO TIPO DOS PESOS (O GRAFO FICA VAZIO).
         """
         try:
-            with open(arquivo, "r") as f:
-                linhas = f.readlines()
+            inicio = perf_counter()
+            if tipo_peso is not None:
+                self.tipo_peso = tipo_peso
 
-            self.vertices = int(linhas[1].strip())
-            self.grafo = [[0] * self.vertices for _ in range(self.vertices)]
+            with open(arquivo, "r") as f:
+                f.readline()  # TIPO DO GRAFO
+                self._reiniciaGrafo(int(f.readline()))
 
-            for linha in linhas[2 : self.vertices + 2]:
-                dados = linha.strip().split(' "')
-                if len(dados) >= 2:
+                for _ in range(self.vertices):
+                    dados = f.readline().strip().split(' "', 1)
                     vertice = int(dados[0])
-                    nome_livro = dados[1]
-                    self.livros[vertice] = nome_livro
-
-            for linha in linhas[self.vertices + 3 :]:
-                dados = linha.strip().split(" ")
-                vertice_origem, vertice_destino, peso = (
-                    int(dados[0]),
-                    int(dados[1]),
-                    int(dados[2]),
-                )
-                self.insereAresta(vertice_origem, vertice_destino, peso)
+                    self._alocador.aloca(vertice)
+                    if len(dados) >= 2:
+                        self.livros[vertice] = dados[1].removesuffix('"')
+
+                f.readline()  # NÚMERO DE ARESTAS
 
-            logger.success("GRAFO CARREGADO COM SUCESSO A PARTIR DO ARQUIVO.")
+                num_arestas = 0
+                for lote in lotes_de_arestas(f, tamanho_lote):
+                    num_arestas += self._insereArestasEmLote(lote, registrar=False)
+
+            alteracoes = self._aplicaDelta(arquivo)
+            duracao = perf_counter() - inicio
+            # A TAXA É A DAS LINHAS DE ARESTAS LIDAS DO ARQUIVO (QUE PODE LISTAR CADA ARESTA
+            # NOS DOIS SENTIDOS); O TOTAL É O DO GRAFO CARREGADO, JÁ COM O DELTA
+            arestas_grafo = self._numeroArestas()
+            logger.success(
+                f"GRAFO CARREGADO COM SUCESSO A PARTIR DO ARQUIVO: {self.vertices} VÉRTICES E "
+                f"{arestas_grafo} ARESTAS EM {duracao:.3f}s "
+                f"({num_arestas / max(duracao, 1e-9):,.0f} ARESTAS/s"
+                + (f", {alteracoes} ALTERAÇÕES DO DELTA)." if alteracoes else ").")
+            )
 
-            self.imprimeGrafo()
+            if imprimir:
+                self.imprimeGrafo()
+            return True
 
         except FileNotFoundError:
             logger.error(f"O arquivo {arquivo} não foi encontrado.")
+        except OverflowError as erro:
+            # UM PESO NÃO CABE NO TIPO: O GRAFO LIDO ATÉ AQUI É DESCARTADO
+            logger.error(f"Ocorreu um erro ao carregar o grafo: {erro}")
+            self._reiniciaGrafo(0)
+            raise
         except Exception as e:
             logger.error(f"Ocorreu um erro ao carregar o grafo: {e}")
+        return False
+
+    def _reiniciaGrafo(self, vertices: int):
+        """
+        SUBSTITUI O GRAFO POR UM SEM ARESTAS, COM ESPAÇO PARA `vertices` VÉRTICES (AINDA
+        NÃO ALOCADOS), DESCARTANDO OS NOMES, OS ÍNDICES E O HISTÓRICO.
+        """
+        self.vertices = vertices
+        self.grafo = cria_armazenamento(self.armazenamento, vertices, self.tipo_peso)
+        self._alocador = AlocadorVertices()
+        self.livros = {}
+        self._componentes = None
+        self._topk = None
+        self._titulos = None
+        self._versao += 1
+        self._historico.reinicia()
+
+    @escrita
+    def _insereArestasEmLote(self, arestas, registrar: bool = True) -> int:
+        """
+        INSERE VÁRIAS ARESTAS DE UMA VEZ, SEM LOG POR ARESTA.
+        ARESTAS COM PESO 0 SÃO IGNORADAS (EQUIVALEM À AUSÊNCIA DE ARESTA).
+
+        Args:
+            arestas (iterable): TRIPLAS (ORIGEM, DESTINO, PESO) COM OS NÚMEROS DOS VÉRTICES.
+            registrar (bool): REGISTRA AS ARESTAS NO HISTÓRICO (FALSE NA LEITURA DE ARQUIVOS).
+
+        Returns:
+            int: NÚMERO DE ARESTAS INSERIDAS.
+        """
+        self._garanteMutavel()
+        self._componentes = None
+        self._topk = None
+        self._versao += 1
+
+        slot = self._slot
+        define_peso = self.grafo.definePeso
+        inseridas = 0
+        if registrar and self._historico.ativo:
+            peso_atual, registra = self.grafo.peso, self._historico.registra
+            for vertice_origem, vertice_destino, peso in arestas:
+                if peso != 0:
+                    origem, destino = slot(vertice_origem), slot(vertice_destino)
+                    anterior = peso_atual(origem, destino)
+                    define_peso(origem, destino, peso)
+                    if anterior != peso:
+                        registra(("A", vertice_origem, vertice_destino, anterior, peso))
+                    inseridas += 1
+            return inseridas
+
+        for vertice_origem, vertice_destino, peso in arestas:
+            if peso != 0:
+                define_peso(slot(vertice_origem), slot(vertice_destino), peso)
+                inseridas += 1
+        return inseridas
+
+    def _aplicaMutacao(self, mutacao: tuple):
+        """
+        APLICA UMA ALTERAÇÃO DO HISTÓRICO ("V+", "V-" OU "A") PELOS MÉTODOS PÚBLICOS,
+        MANTENDO OS ÍNDICES ATUALIZADOS.
+        """
+        tipo = mutacao[0]
+        if tipo == "V+":
+            self.insereVertice(mutacao[2], vertice=mutacao[1])
+        elif tipo == "V-":
+            self.removeVertice(mutacao[1])
+        elif mutacao[-1] == 0:
+            self.removeAresta(mutacao[1], mutacao[2])
+        else:
+            self.insereAresta(mutacao[1], mutacao[2], mutacao[-1])
+
+    def _aplicaDelta(self, arquivo: str) -> int:
+        """
+        APLICA AS ALTERAÇÕES DO ARQUIVO DELTA ASSOCIADO AO ARQUIVO (SE EXISTIR), SEM
+        REGISTRÁ-LAS NO HISTÓRICO, E TORNA O ARQUIVO A BASE DOS PRÓXIMOS DELTAS.
+
+        Returns:
+            int: NÚMERO DE ALTERAÇÕES APLICADAS.
+        """
+        self.arquivo_base = arquivo
+        delta = arquivo_delta(arquivo)
+        if not os.path.exists(delta):
+            return 0
+
+        alteracoes = 0
+        with self._historico.suspenso(), silencioso():
+            for mutacao in le_delta(delta):
+                self._aplicaMutacao(mutacao)
+                alteracoes += 1
+        logger.info(f"{alteracoes} ALTERAÇÕES APLICADAS A PARTIR DO ARQUIVO DELTA {delta}.")
+        return alteracoes
+
+    @instrumenta
+    @escrita
+    def abreBinario(self, arquivo: str) -> bool:
+        """
+        ABRE O GRAFO A PARTIR DE UM ARQUIVO NO FORMATO BINÁRIO, MAPEADO EM MEMÓRIA.
+        A ADJACÊNCIA E OS NOMES SÃO LIDOS SOB DEMANDA; A PRIMEIRA ALTERAÇÃO NO
+        GRAFO O CONVERTE PARA O ARMAZENAMENTO ESPARSO.
+
+        Args:
+            arquivo (str): O CAMINHO DO ARQUIVO BINÁRIO.
+
+        Returns:
+            bool: True SE O GRAFO FOI ABERTO; False SE HOUVE ERRO, QUE É APENAS
+                REGISTRADO NO LOG.
+        """
+        try:
+            inicio = perf_counter()
+            self.grafo, self._alocador, self.livros = abre_binario(arquivo)
+            self._componentes = None
+            self._topk = None
+            self._titulos = None
+            self._versao += 1
+            self._historico.reinicia()
+            self.armazenamento = self.grafo.nome
+            self.vertices = len(self._alocador)
+            self._aplicaDelta(arquivo)
+            logger.success(
+                f"GRAFO BINÁRIO ABERTO COM SUCESSO: {self.vertices} VÉRTICES "
+                f"EM {perf_counter() - inicio:.4f}s."
+            )
+            return True
+        except FileNotFoundError:
+            logger.error(f"O arquivo {arquivo} não foi encontrado.")
+        except Exception as e:
+            logger.error(f"Ocorreu um erro ao abrir o grafo binário: {e}")
+        return False
+
+    @instrumenta
+    @leitura
+    def gravarBinario(self, arquivo: str) -> bool:
+        """
+        GRAVA O GRAFO NO FORMATO BINÁRIO (CABEÇALHO, NOMES E ADJACÊNCIA CSR),
+        REMOVENDO O ARQUIVO DELTA ASSOCIADO A ELE, SE HOUVER. O ARQUIVO É
+        SUBSTITUÍDO DE FORMA ATÔMICA, ENTÃO PODE SER O PRÓPRIO ARQUIVO ABERTO
+        POR `abreBinario` MESMO COM CONSULTAS EM ANDAMENTO.
+
+        Args:
+            arquivo (str): O CAMINHO DO ARQUIVO BINÁRIO A SER GRAVADO.
+
+        Returns:
+            bool: True SE O GRAFO FOI GRAVADO; False SE HOUVE ERRO, QUE É APENAS
+                REGISTRADO NO LOG (O ARQUIVO ANTERIOR, SE HOUVER, FICA INTACTO).
+        """
+        try:
+            with self._trava_gravacao:
+                grava_binario(self, arquivo)
+                self._descartaDelta(arquivo)
+            return True
+        except Exception as e:
+            logger.error(f"Ocorreu um erro ao gravar o grafo binário: {e}")
+        return False
 
-    def exibirGrafoVisual(self):
+    @leitura
+    def exibirGrafoVisual(self, pagina: int = 0, tamanho: int = TAMANHO_PAGINA):
         """
-        EXIBE O CONTEÚDO ATUAL DO GRAFO DE FORMA VISUALMENTE COMPREENSÍVEL E ATRAENTE.
+        EXIBE O CONTEÚDO ATUAL DO GRAFO DE FORMA VISUALMENTE COMPREENSÍVEL E ATRAENTE,
+        UMA PÁGINA POR VEZ (NO MÁXIMO `tamanho` VÉRTICES E `tamanho` ARESTAS).
+
+        Args:
+            pagina (int): NÚMERO DA PÁGINA (A PARTIR DE 0).
+            tamanho (int): NÚMERO DE VÉRTICES E DE ARESTAS POR PÁGINA.
         """
+        inicio, fim = pagina * tamanho, (pagina + 1) * tamanho
+        vertice = self._alocador.vertice
 
         print("===============================================================")
         print(f"Tipo do Grafo: Não Orientado com peso nas arestas")
         print(f"Número de Vértices: {self.vertices}")
+        print(f"Página: {pagina} ({tamanho} itens por página)")
         print("---------------------------------------------------------------")
 
         print("Vértices e seus respectivos nomes:")
-        for vertice, nome_livro in self.livros.items():
-            print(f"- Vértice {vertice}: {nome_livro.replace('"', "")}")
+        for v in islice(self._alocador.ids(), inicio, fim):
+            nome_livro = self.livros.get(v, "").replace('"', "")
+            print(f"- Vértice {v}: {nome_livro}")
 
         print("---------------------------------------------------------------")
         print("\nArestas (conexões entre os vértices) e seus respectivos pesos:")
-        arestas = []
-        for i in range(self.vertices-1):
-            for j in range(i + 1, self.vertices-1):  # Para não repetir arestas
-                if self.grafo[i][j] != 0:
-                    arestas.append((i + 1, j + 1, self.grafo[i][j]))
-                    print(
-                        f"- {self.livros[i + 1]} - {self.livros[j]} ---> Com peso: {j + 1}"
-                    )
+        arestas = 0
+        # CADA ARESTA APARECE UMA ÚNICA VEZ (ORIGEM < DESTINO), INCLUINDO AS DO ÚLTIMO VÉRTICE
+        for origem, destino, peso in islice(self.grafo.arestas(), inicio, fim):
+            arestas += 1
+            print(
+                f"- {self.livros.get(vertice(origem), vertice(origem))} - "
+                f"{self.livros.get(vertice(destino), vertice(destino))} ---> Com peso: {peso}"
+            )
 
         if not arestas:
-            print("Não há arestas neste grafo.")
+            print("Não há arestas nesta página." if pagina else "Não há arestas neste grafo.")
+
+        print("===============================================================")
+
+    @instrumenta
+    @leitura
+    def resumo(self, maiores_arestas: int = 10) -> dict:
+        """
+        CALCULA UM RESUMO DO GRAFO EM UMA PASSADA O(V+E), SEM MONTAR A MATRIZ:
+        NÚMERO DE VÉRTICES E ARESTAS, DENSIDADE, DISTRIBUIÇÕES DE GRAUS E PESOS
+        (EM FAIXAS DE POTÊNCIAS DE 2), TAMANHOS DAS COMPONENTES E AS ARESTAS DE
+        MAIOR PESO.
+
+        Args:
+            maiores_arestas (int): NÚMERO DE ARESTAS DE MAIOR PESO NO RESUMO.
 
+        Returns:
+            dict: O RESUMO DO GRAFO.
+        """
+        graus = [0] * len(self.grafo)
+        pesos = {}
+        maiores = []  # HEAP (PESO, ORIGEM, DESTINO) DAS ARESTAS DE MAIOR PESO
+        num_arestas, peso_total = 0, 0
+        for origem, destino, peso in self.grafo.arestas():
+            num_arestas += 1
+            peso_total += peso
+            graus[origem] += 1
+            graus[destino] += 1
+            faixa = faixa_potencia_de_dois(peso)
+            pesos[faixa] = pesos.get(faixa, 0) + 1
+            if len(maiores) < maiores_arestas:
+                heapq.heappush(maiores, (peso, origem, destino))
+            elif peso > maiores[0][0]:
+                heapq.heapreplace(maiores, (peso, origem, destino))
+
+        distribuicao_graus = {}
+        grau_minimo, grau_maximo = None, 0
+        indice = self._indiceComponentes()
+        tamanhos = {}
+        for slot, _ in self._alocador.slotsAtivos():
+            grau = graus[slot]
+            grau_minimo = grau if grau_minimo is None else min(grau_minimo, grau)
+            grau_maximo = max(grau_maximo, grau)
+            faixa = faixa_potencia_de_dois(grau)
+            distribuicao_graus[faixa] = distribuicao_graus.get(faixa, 0) + 1
+            raiz = indice.encontra(slot)
+            tamanhos[raiz] = tamanhos.get(raiz, 0) + 1
+
+        def ordena(faixas):
+            return dict(sorted(faixas.items(), key=lambda item: int(item[0].split("-")[0])))
+
+        ativos = self.vertices
+        vertice = self._alocador.vertice
+        return {
+            "vertices": ativos,
+            "arestas": num_arestas,
+            "densidade": 2 * num_arestas / (ativos * (ativos - 1)) if ativos > 1 else 0.0,
+            "grau_minimo": grau_minimo or 0,
+            "grau_maximo": grau_maximo,
+            "grau_medio": 2 * num_arestas / ativos if ativos else 0.0,
+            "distribuicao_graus": ordena(distribuicao_graus),
+            "peso_medio": peso_total / num_arestas if num_arestas else 0.0,
+            "distribuicao_pesos": ordena(pesos),
+            "componentes": len(tamanhos),
+            "tamanhos_componentes": sorted(tamanhos.values(), reverse=True),
+            "maiores_arestas": [
+                (vertice(origem), vertice(destino), peso)
+                for peso, origem, destino in sorted(maiores, reverse=True)
+            ],
+        }
+
+    @leitura
+    def exibeResumo(self, maiores_arestas: int = 10, maximo_componentes: int = 10):
+        """
+        EXIBE O RESUMO DO GRAFO (VER `resumo`), COM TAMANHO DE SAÍDA INDEPENDENTE DO GRAFO.
+        """
+        dados = self.resumo(maiores_arestas)
+
+        print("===============================================================")
+        print(f"Vértices: {dados['vertices']}    Arestas: {dados['arestas']}    Densidade: {dados['densidade']:.4f}")
+        print(
+            f"Grau mínimo/médio/máximo: {dados['grau_minimo']} / {dados['grau_medio']:.2f} / {dados['grau_maximo']}"
+        )
+        print(f"Distribuição dos graus: {dados['distribuicao_graus']}")
+        print(f"Peso médio: {dados['peso_medio']:.2f}    Distribuição dos pesos: {dados['distribuicao_pesos']}")
+        tamanhos = dados["tamanhos_componentes"]
+        restantes = f" (+{len(tamanhos) - maximo_componentes})" if len(tamanhos) > maximo_componentes else ""
+        print(f"Componentes: {dados['componentes']}    Tamanhos: {tamanhos[:maximo_componentes]}{restantes}")
+        print("---------------------------------------------------------------")
+        print("Arestas de maior peso:")
+        for origem, destino, peso in dados["maiores_arestas"]:
+            print(f"- {self.livros.get(origem, origem)} - {self.livros.get(destino, destino)} ---> Com peso: {peso}")
         print("===============================================================")
 
-    def gravarGrafo(self, arquivo: str):
+    @instrumenta
+    @leitura
+    def gravarGrafo(self, arquivo: str) -> bool:
         """
-        GRAVA O GRAFO EM UM ARQUIVO TXT NO FORMATO ESPECIFICADO.
+        GRAVA O GRAFO EM UM ARQUIVO TXT NO FORMATO ESPECIFICADO (EM UM TEMPORÁRIO,
+        RENOMEADO AO FINAL). O ARQUIVO DELTA ASSOCIADO A ELE, SE HOUVER, É REMOVIDO
+        (O ARQUIVO JÁ CONTÉM AS ALTERAÇÕES).
 
         Args:
             arquivo (str): O CAMINHO DO ARQUIVO TXT A SER GRAVADO.
+
+        Returns:
+            bool: True SE O GRAFO FOI GRAVADO; False SE HOUVE ERRO, QUE É APENAS
+                REGISTRADO NO LOG (O ARQUIVO ANTERIOR, SE HOUVER, FICA INTACTO).
         """
         try:
-            with open(arquivo, 'w') as f:
-                f.write(f"2\n")
-                f.write(f"{self.vertices}\n")
+            with self._trava_gravacao:
+                with gravacao_atomica(arquivo, "w") as f:
+                    f.write(f"2\n")
+                    f.write(f"{self.vertices}\n")
 
-                for vertice, nome_livro in self.livros.items():
-                    f.write(f'{vertice} "{nome_livro.replace('"', "")}"\n')
+                    for vertice in self._alocador.ids():
+                        nome_livro = self.livros.get(vertice, "").replace('"', "")
+                        f.write(f'{vertice} "{nome_livro}"\n')
 
-                num_arestas = 0
-                arestas = []
-                for i in range(self.vertices):
-                    for j in range(i + 1, self.vertices):
-                        if self.grafo[i][j] != 0:
-                            num_arestas += 1
-                            arestas.append(f"{i} {j} {self.grafo[i][j]}\n")
+                    # PERCORRE APENAS AS ARESTAS EXISTENTES (CADA UMA UMA ÚNICA VEZ)
+                    vertice = self._alocador.vertice
+                    arestas = [
+                        f"{vertice(i)} {vertice(j)} {peso}\n" for i, j, peso in self.grafo.arestas()
+                    ]
 
-                f.write(f"{num_arestas}\n")
+                    f.write(f"{len(arestas)}\n")
 
-                for aresta in arestas:
-                    f.write(aresta)
+                    for aresta in arestas:
+                        f.write(aresta)
 
+                self._descartaDelta(arquivo)
             logger.info(f"GRAFO GRAVADO COM SUCESSO NO ARQUIVO {arquivo}.")
+            return True
         except Exception as e:
             logger.error(f"Ocorreu um erro ao gravar o grafo: {e}")
+        return False
 
-    def tipo_conexidade(self) -> int:
+    def _descartaDelta(self, arquivo: str):
+        """
+        APÓS UMA GRAVAÇÃO COMPLETA: REMOVE O ARQUIVO DELTA, LIMPA AS ALTERAÇÕES
+        PENDENTES E TORNA O ARQUIVO A BASE DOS PRÓXIMOS DELTAS.
         """
+        delta = arquivo_delta(arquivo)
+        if os.path.exists(delta):
+            os.remove(delta)
+        self._historico.pendentes = []
+        self.arquivo_base = arquivo
+
+    @instrumenta
+    @escrita
+    def gravarDelta(self, arquivo: str = None):
+        """
+        ACRESCENTA AO ARQUIVO DELTA (EX.: grafo.txt.delta) APENAS AS ALTERAÇÕES
+        FEITAS DESDE A ÚLTIMA GRAVAÇÃO, SEM REGRAVAR O GRAFO INTEIRO. O DELTA É
+        APLICADO AUTOMATICAMENTE PELA PRÓXIMA LEITURA DO ARQUIVO.
 
-        VERIFICA O TIPO DE CONEXIDADE DE UM GRAFO NÃO DIRECIONADO.
+        Args:
+            arquivo (str): ARQUIVO DO GRAFO AO QUAL O DELTA SE REFERE (PADRÃO: O
+                ÚLTIMO ARQUIVO LIDO OU GRAVADO POR COMPLETO).
+        """
+        arquivo = arquivo or self.arquivo_base
+        if arquivo is None:
+            logger.error("NENHUM ARQUIVO BASE: LEIA OU GRAVE O GRAFO COMPLETO ANTES DE GRAVAR UM DELTA.")
+            return
+        try:
+            gravadas = self._historico.gravaPendentes(arquivo_delta(arquivo))
+            logger.info(f"{gravadas} ALTERAÇÕES GRAVADAS NO ARQUIVO {arquivo_delta(arquivo)}.")
+        except Exception as e:
+            logger.error(f"Ocorreu um erro ao gravar o arquivo delta: {e}")
+
+    def _reaplica(self, mutacoes: list):
+        """
+        APLICA ALTERAÇÕES DE DESFAZER/REFAZER SEM CRIAR NOVAS ENTRADAS NO LOG.
+        """
+        with self._historico.reaplicando(), silencioso():
+            for mutacao in mutacoes:
+                self._aplicaMutacao(mutacao)
+
+    @instrumenta
+    @escrita
+    def desfazer(self) -> bool:
+        """
+        DESFAZ A ÚLTIMA ALTERAÇÃO (INSERÇÃO OU REMOÇÃO DE VÉRTICE OU ARESTA).
 
         Returns:
-            int: RETORNA 0 SE O GRAFO É CONEXO E 1 SE O GRAFO É DESCONEXO.
+            bool: FALSE SE NÃO HAVIA ALTERAÇÃO PARA DESFAZER.
         """
+        if not self._historico.podeDesfazer():
+            logger.info("NÃO HÁ ALTERAÇÕES PARA DESFAZER.")
+            return False
+        mutacao = self._historico.desfaz()
+        self._reaplica(inverte(mutacao))
+        logger.info(f"ALTERAÇÃO DESFEITA: {mutacao[:3]}.")
+        return True
+
+    @instrumenta
+    @escrita
+    def refazer(self) -> bool:
+        """
+        REFAZ A ÚLTIMA ALTERAÇÃO DESFEITA.
+
+        Returns:
+            bool: FALSE SE NÃO HAVIA ALTERAÇÃO PARA REFAZER.
+        """
+        if not self._historico.podeRefazer():
+            logger.info("NÃO HÁ ALTERAÇÕES PARA REFAZER.")
+            return False
+        mutacao = self._historico.refaz()
+        self._reaplica([mutacao])
+        logger.info(f"ALTERAÇÃO REFEITA: {mutacao[:3]}.")
+        return True
+
+    @leitura
+    def snapshot(self) -> int:
+        """
+        RETORNA O IDENTIFICADOR DA VERSÃO ATUAL DO GRAFO, EM O(1) (NADA É COPIADO).
+        """
+        return self._historico.snapshot()
+
+    @instrumenta
+    @escrita
+    def restauraSnapshot(self, versao: int):
+        """
+        VOLTA O GRAFO À VERSÃO INFORMADA, DESFAZENDO OU REFAZENDO AS ALTERAÇÕES
+        ENTRE ELA E A VERSÃO ATUAL (CUSTO PROPORCIONAL A ESSAS ALTERAÇÕES).
+
+        Args:
+            versao (int): IDENTIFICADOR RETORNADO POR `snapshot`.
+
+        Raises:
+            ValueError: SE A VERSÃO FOI DESCARTADA (ALTERAÇÕES FEITAS APÓS DESFAZÊ-LA).
+        """
+        historico = self._historico
+        alvo = historico.posicao(versao)
+        with silencioso():
+            while historico.cursor > alvo:
+                self._reaplica(inverte(historico.desfaz()))
+            while historico.cursor < alvo:
+                self._reaplica([historico.refaz()])
+        logger.info(f"GRAFO RESTAURADO PARA A VERSÃO {versao}.")
+
+    def configuraCache(self, max_entradas: int = MAX_ENTRADAS, max_bytes: int = MAX_BYTES):
+        """
+        RECRIA O CACHE DE CONSULTAS COM NOVOS LIMITES (VER `cache.py`).
+
+        Args:
+            max_entradas (int): NÚMERO MÁXIMO DE RESULTADOS GUARDADOS (0 DESATIVA O CACHE).
+            max_bytes (int): MEMÓRIA APROXIMADA MÁXIMA DOS RESULTADOS GUARDADOS.
+        """
+        self._cache = CacheConsultas(max_entradas, max_bytes) if max_entradas > 0 else None
+
+    def estatisticasCache(self) -> dict:
+        """
+        RETORNA OS ACERTOS, FALHAS, DESCARTES E OCUPAÇÃO DO CACHE DE CONSULTAS.
+        """
+        cache = self._cache
+        return {"versao": self._versao, **(cache.estatisticas() if cache is not None else {"ativo": False})}
 
-        # LISTA PARA MARCAR OS VÉRTICES VISITADOS
-        visitados = [False] * self.vertices
+    @memoiza
+    def _numeroComponentes(self) -> int:
+        """
+        CONTA AS COMPONENTES CONECTADAS PELO ÍNDICE UNION-FIND (CHAMADO COM A TRAVA DE LEITURA).
+        """
+        # AS POSIÇÕES LIVRES (VÉRTICES REMOVIDOS) SÃO CONJUNTOS UNITÁRIOS NO ÍNDICE
+        return self._indiceComponentes().conjuntos - self._alocador.lapides
 
-        def busca_profundidade(v: int):
-            """
-            REALIZA A BUSCA EM PROFUNDIDADE (DFS) A PARTIR DE UM VÉRTICE.
+    @instrumenta
+    @leitura
+    def tipo_conexidade(self) -> int:
+        """
 
-            Args:
-                v (int): O ÍNDICE DO VÉRTICE DE PARTIDA PARA A BUSCA EM PROFUNDIDADE.
-            """
-            visitados[v] = True  # MARCA O VÉRTICE ATUAL COMO VISITADO
-            # PERCORRE OS VÉRTICES VIZINHOS DO VÉRTICE ATUAL
-            for i in range(self.vertices):
-                # SE HÁ UMA ARESTA E O VÉRTICE AINDA NÃO FOI VISITADO, CONTINUA A BUSCA
-                if self.grafo[v][i] == 1 and not visitados[i]:
-                    busca_profundidade(i)  # CHAMA A FUNÇÃO RECURSIVAMENTE PARA O VIZINHO
+        VERIFICA O TIPO DE CONEXIDADE DE UM GRAFO NÃO DIRECIONADO.
 
-        # INICIA A BUSCA EM PROFUNDIDADE A PARTIR DO VÉRTICE 0
-        busca_profundidade(0)
+        Returns:
+            int: RETORNA 0 SE O GRAFO É CONEXO E 1 SE O GRAFO É DESCONEXO.
+        """
 
-        # VERIFICA SE TODOS OS VÉRTICES FORAM VISITADOS
-        if all(visitados):
+        # O GRAFO É CONEXO SE TODOS OS VÉRTICES ESTÃO NA MESMA COMPONENTE
+        if self._numeroComponentes() <= 1:
             logger.info("GRAFO É CONEXO")  # MENSAGEM DE QUE O GRAFO É CONEXO
             return 0  # O GRAFO É CONEXO
         else:
             logger.info("GRAFO É DESCONEXO")  # MENSAGEM DE QUE O GRAFO É DESCONEXO
             return 1  # O GRAFO É DESCONEXO
 
-    def bfs(self, vertice_inicial: int, visitado: list) -> set:
+    @instrumenta
+    @leitura
+    def bfs(self, vertice_inicial: int, visitado=None) -> set:
         """
         REALIZA UMA BUSCA EM LARGURA (BFS) A PARTIR DE UM VÉRTICE INICIAL.
         RETORNA O CONJUNTO DE VÉRTICES QUE PERTENCEM À MESMA COMPONENTE CONECTADA.
 
         Args:
             vertice_inicial (int): O VÉRTICE DE PARTIDA PARA A BUSCA EM LARGURA.
-            visitado (list): LISTA QUE CONTROLA OS VÉRTICES VISITADOS.
+            visitado (bytearray): MARCAÇÃO, INDEXADA PELA POSIÇÃO INTERNA DOS VÉRTICES,
+                DOS VÉRTICES JÁ VISITADOS. PODE SER REAPROVEITADA ENTRE CHAMADAS;
+                SE OMITIDA, UMA NOVA É CRIADA.
 
         Returns:
             set: CONJUNTO DE VÉRTICES DA COMPONENTE CONECTADA.
         """
-        fila = deque([vertice_inicial])  # INICIA A FILA COM O VÉRTICE INICIAL
-        visitado[vertice_inicial] = True  # MARCA O VÉRTICE INICIAL COMO VISITADO
-        componente = {vertice_inicial}  # INICIALIZA O CONJUNTO DA COMPONENTE
+        if visitado is None:
+            visitado = bytearray(len(self.grafo))
+
+        ordem = busca_largura(self.grafo.vizinhos, self._slot(vertice_inicial), visitado)
+        return {self._alocador.vertice(slot) for slot in ordem}
+
+    @instrumenta
+    @leitura
+    @memoiza
+    def componentesConectadas(self) -> tuple:
+        """
+        ENCONTRA TODAS AS COMPONENTES CONECTADAS DO GRAFO.
+        RETORNA UMA TUPLA DE CONJUNTOS, ONDE CADA CONJUNTO REPRESENTA UMA COMPONENTE CONECTADA.
+        O RESULTADO FICA EM CACHE E É COMPARTILHADO, POR ISSO É IMUTÁVEL (frozenset).
+
+        Returns:
+            tuple: TUPLA DE COMPONENTES CONECTADAS.
+        """
+        indice = self._indiceComponentes()
+        componentes = {}  # REPRESENTANTE NO ÍNDICE -> CONJUNTO DE VÉRTICES
 
-        while fila:  # ENQUANTO HOUVER VÉRTICES NA FILA
-            v = fila.popleft()  # REMOVE O VÉRTICE DO INÍCIO DA FILA
+        for slot, v in self._alocador.slotsAtivos():
+            componentes.setdefault(indice.encontra(slot), set()).add(v)
 
-            for i in range(self.vertices):
-                if self.grafo[v][i] != 0 and not visitado[i]:  # SE HÁ UMA ARESTA E O VIZINHO NÃO FOI VISITADO
-                    fila.append(i)  # ADICIONA O VIZINHO À FILA
-                    visitado[i] = True  # MARCA O VIZINHO COMO VISITADO
-                    componente.add(i)  # ADICIONA O VIZINHO À COMPONENTE
+        return tuple(map(frozenset, componentes.values()))  # RETORNA AS COMPONENTES CONECTADAS
 
-        return componente  # RETORNA O CONJUNTO DE VÉRTICES DA COMPONENTE
 
-    def componentesConectadas(self) -> list:
+    @instrumenta
+    @leitura
+    @memoiza
+    def comunidades(self, metodo: str = "louvain", resolucao: float = 1.0, semente: int = 42) -> tuple:
         """
-        ENCONTRA TODAS AS COMPONENTES CONECTADAS DO GRAFO.
-        RETORNA UMA LISTA DE CONJUNTOS, ONDE CADA CONJUNTO REPRESENTA UMA COMPONENTE CONECTADA.
+        DETECTA COMUNIDADES (GRUPOS DE LIVROS MAIS LIGADOS ENTRE SI) USANDO OS PESOS
+        DAS ARESTAS (VER `comunidades.py`).
+
+        Args:
+            metodo (str): "louvain" (OTIMIZA A MODULARIDADE) OU "propagacao"
+                (PROPAGAÇÃO DE RÓTULOS, MAIS RÁPIDA E MENOS PRECISA).
+            resolucao (float): RESOLUÇÃO DO LOUVAIN; VALORES MAIORES GERAM COMUNIDADES MENORES.
+            semente (int): SEMENTE DA ORDEM ALEATÓRIA DOS VÉRTICES.
 
         Returns:
-            list: LISTA DE COMPONENTES CONECTADAS.
+            tuple: TUPLA DE CONJUNTOS (frozenset) DE VÉRTICES, DA MAIOR PARA A MENOR COMUNIDADE.
         """
-        visitado = [False] * self.vertices  # INICIALIZA A LISTA DE VISITADOS
-        componentes = []  # LISTA PARA ARMAZENAR AS COMPONENTES ENCONTRADAS
+        slots = [slot for slot, _ in self._alocador.slotsAtivos()]
+        adjacencia = AdjacenciaCompacta.deArmazenamento(self.grafo.vizinhos, slots)
+        if metodo == "louvain":
+            rotulos = louvain(adjacencia, resolucao, semente)
+        elif metodo == "propagacao":
+            rotulos = propagacao_rotulos(adjacencia, semente)
+        else:
+            raise ValueError(f"MÉTODO DE COMUNIDADES '{metodo}' DESCONHECIDO (USE 'louvain' OU 'propagacao').")
 
-        for v in range(self.vertices):
-            if not visitado[v]:  # SE O VÉRTICE AINDA NÃO FOI VISITADO
-                componente = self.bfs(v, visitado)  # REALIZA A BUSCA EM LARGURA
-                componentes.append(componente)  # ADICIONA A COMPONENTE À LISTA
+        grupos = {}
+        for slot, rotulo in zip(slots, rotulos):
+            grupos.setdefault(rotulo, set()).add(self._alocador.vertice(slot))
+        logger.info(
+            f"{len(grupos)} COMUNIDADES ({metodo}), MODULARIDADE {modularidade(adjacencia, rotulos):.4f}."
+        )
+        return tuple(map(frozenset, sorted(grupos.values(), key=len, reverse=True)))
 
-        return componentes  # RETORNA A LISTA DE COMPONENTES CONECTADAS
+    @instrumenta
+    @leitura
+    @memoiza
+    def calculaGrafoReduzido(self, ponderado: str = None, limiar=None, agrupamento: str = None) -> tuple:
+        """
+        CALCULA O GRAFO REDUZIDO SEM EXIBI-LO (VER `grafo_reduzido`).
 
+        Returns:
+            tuple: (TUPLA DE GRUPOS DE VÉRTICES, MATRIZ DE ADJACÊNCIA DO GRAFO REDUZIDO).
+                A MATRIZ É UMA TUPLA DE LINHAS (TUPLAS), IMUTÁVEL COMO O RESTO DO CACHE.
+        """
+        if limiar is None and ponderado is None and agrupamento is None:
+            componentes = self.componentesConectadas()
 
-    def grafo_reduzido(self):
+            # POR DEFINIÇÃO, NENHUMA ARESTA LIGA DUAS COMPONENTES CONECTADAS DISTINTAS,
+            # ENTÃO NÃO É PRECISO PERCORRER AS ARESTAS: O GRAFO REDUZIDO NÃO TEM ARESTAS
+            return componentes, ((0,) * len(componentes),) * len(componentes)
+
+        base = self if limiar is None else self.esparsifica("limiar", limiar=limiar)
+        if agrupamento is None:
+            componentes = base.componentesConectadas()
+        else:
+            componentes = base.comunidades(agrupamento)
+        return componentes, tuple(map(tuple, self.contraiGrafo(componentes, agregacao=ponderado)))
+
+    @instrumenta
+    @leitura
+    def grafo_reduzido(self, ponderado: str = None, limiar=None, agrupamento: str = None):
         """
         GERA O GRAFO REDUZIDO COM BASE NAS COMPONENTES CONECTADAS DO GRAFO ORIGINAL.
         O GRAFO REDUZIDO CONTÉM UM VÉRTICE PARA CADA COMPONENTE CONECTADA, E UMA ARESTA
         ENTRE DUAS COMPONENTES SE HOUVER PELO MENOS UMA ARESTA CONECTANDO DOIS VÉRTICES DE COMPONENTES DISTINTAS NO GRAFO ORIGINAL.
+
+        COMO O GRAFO DE LIVROS É QUASE COMPLETO, AS COMPONENTES PODEM SER CALCULADAS
+        APENAS COM AS ARESTAS FORTES (PESO >= `limiar`); AS ARESTAS ENTRE ELAS SÃO
+        ENTÃO AS ARESTAS FRACAS DO GRAFO ORIGINAL, AGREGADAS CONFORME `ponderado`.
+        COM `agrupamento`, OS VÉRTICES DO GRAFO REDUZIDO SÃO AS COMUNIDADES EM VEZ
+        DAS COMPONENTES (OS AGRUPAMENTOS DE GÊNEROS DENTRO DE UMA MESMA COMPONENTE).
+        O RESULTADO FICA EM CACHE ATÉ A PRÓXIMA ALTERAÇÃO DO GRAFO.
+
+        Args:
+            ponderado (str): None (MATRIZ 0/1), "soma" OU "maximo" DOS PESOS ENTRE AS COMPONENTES.
+            limiar: SE INFORMADO, AS COMPONENTES SÃO AS DO GRAFO ESPARSIFICADO POR ESTE LIMIAR.
+            agrupamento (str): None (COMPONENTES CONECTADAS), "louvain" OU "propagacao"
+                (COMUNIDADES, VER `comunidades`).
+
+        Returns:
+            tuple: MATRIZ DE ADJACÊNCIA DO GRAFO REDUZIDO (TUPLA DE LINHAS).
         """
-        
-        # ENCONTRA TODAS AS COMPONENTES CONECTADAS
-        componentes = self.componentesConectadas()
-        num_componentes = len(componentes)
-
-        # CRIA A MATRIZ DE ADJACÊNCIA DO GRAFO REDUZIDO
-        grafo_reduzido = [[0] * num_componentes for _ in range(num_componentes)]
-
-        # MAPEAMENTO DOS VÉRTICES PARA SEUS COMPONENTES CONECTADOS
-        vertice_para_componente = {}
-        for idx, componente in enumerate(componentes):
-            for vertice in componente:
-                vertice_para_componente[vertice] = idx
-
-        # CONECTA AS COMPONENTES NO GRAFO REDUZIDO
-        for v1 in range(self.vertices):
-            for v2 in range(v1 + 1, self.vertices):
-                if self.grafo[v1][v2] != 0:  # VERIFICA SE EXISTE UMA ARESTA ENTRE v1 E v2
-                    comp_v1 = vertice_para_componente[v1]  # OBTÉM A COMPONENTE DE v1
-                    comp_v2 = vertice_para_componente[v2]  # OBTÉM A COMPONENTE DE v2
-                    if comp_v1 != comp_v2:  # SE AS COMPONENTES FOREM DIFERENTES
-                        # ARESTA ENTRE COMPONENTES DIFERENTES NO GRAFO ORIGINAL -> ARESTA NO GRAFO REDUZIDO
-                        grafo_reduzido[comp_v1][comp_v2] = 1
-                        grafo_reduzido[comp_v2][comp_v1] = 1
-
-        # EXIBE O GRAFO REDUZIDO
-        logger.info("GRAFO REDUZIDO:")
-        for linha in grafo_reduzido:
-            print(linha)
+        _, grafo_reduzido = self.calculaGrafoReduzido(ponderado, limiar, agrupamento)
+
+        # EXIBE O GRAFO REDUZIDO (A MATRIZ COMPLETA APENAS SE COUBER EM UMA JANELA)
+        grupo = "COMPONENTE CONECTADA" if agrupamento is None else "COMUNIDADE"
+        logger.info(f"GRAFO REDUZIDO: {len(grafo_reduzido)} VÉRTICES (UM POR {grupo}).")
+        for linha in grafo_reduzido[:TAMANHO_JANELA]:
+            print(list(linha[:TAMANHO_JANELA]))
 
         return grafo_reduzido  # RETORNA A MATRIZ DE ADJACÊNCIA DO GRAFO REDUZIDO
 
+    @instrumenta
+    @leitura
+    def contraiGrafo(self, grupos: list, agregacao: str = None) -> list:
+        """
+        CONTRAI CADA GRUPO DE VÉRTICES EM UM ÚNICO VÉRTICE. DOIS GRUPOS FICAM LIGADOS
+        SE HOUVER PELO MENOS UMA ARESTA ENTRE VÉRTICES DELES NO GRAFO ORIGINAL.
+        NO ARMAZENAMENTO "numpy" A CONTRAÇÃO É FEITA COM OPERAÇÕES VETORIZADAS.
+
+        Args:
+            grupos (list): LISTA DE CONJUNTOS DE VÉRTICES (COMO A DE `componentesConectadas`).
+            agregacao (str): None (MATRIZ 0/1), "soma" OU "maximo" DOS PESOS DAS
+                ARESTAS ENTRE CADA PAR DE GRUPOS.
+
+        Returns:
+            list: MATRIZ DE ADJACÊNCIA DO GRAFO CONTRAÍDO.
+        """
+        if agregacao not in (None, "soma", "maximo"):
+            raise ValueError(f"AGREGAÇÃO '{agregacao}' DESCONHECIDA (USE 'soma' OU 'maximo').")
+
+        num_grupos = len(grupos)
+        rotulos = [-1] * len(self.grafo)
+        for idx, grupo in enumerate(grupos):
+            for vertice in grupo:
+                rotulos[self._slot(vertice)] = idx
+
+        if getattr(self.grafo, "vetorizado", False):
+            origens, destinos, pesos = self.grafo.arestasVetorizadas()
+            rotulos = np.asarray(rotulos)
+            grupo_origem, grupo_destino = rotulos[origens], rotulos[destinos]
+            validas = (grupo_origem != grupo_destino) & (grupo_origem >= 0) & (grupo_destino >= 0)
+            grupo_origem, grupo_destino = grupo_origem[validas], grupo_destino[validas]
+            valores = np.ones(len(grupo_origem), dtype=np.int64) if agregacao is None else pesos[validas]
+            # ACUMULA EM 64 BITS: A SOMA DOS PESOS PODE NÃO CABER NO TIPO DOS PESOS (EX.: uint8)
+            valores = valores.astype(np.float64 if valores.dtype.kind == "f" else np.int64)
+            contraido = np.zeros((num_grupos, num_grupos), dtype=valores.dtype)
+            if agregacao == "soma":
+                np.add.at(contraido, (grupo_origem, grupo_destino), valores)
+                np.add.at(contraido, (grupo_destino, grupo_origem), valores)
+            else:
+                np.maximum.at(contraido, (grupo_origem, grupo_destino), valores)
+                np.maximum.at(contraido, (grupo_destino, grupo_origem), valores)
+            return contraido.tolist()
+
+        contraido = [[0] * num_grupos for _ in range(num_grupos)]
+        for origem, destino, peso in self.grafo.arestas():
+            grupo_origem, grupo_destino = rotulos[origem], rotulos[destino]
+            if grupo_origem != grupo_destino and grupo_origem >= 0 and grupo_destino >= 0:
+                if agregacao == "soma":
+                    valor = contraido[grupo_origem][grupo_destino] + peso
+                elif agregacao == "maximo":
+                    valor = max(contraido[grupo_origem][grupo_destino], peso)
+                else:
+                    valor = 1
+                contraido[grupo_origem][grupo_destino] = valor
+                contraido[grupo_destino][grupo_origem] = valor
+        return contraido
+
+    @instrumenta
+    @leitura
+    def esparsifica(
+        self, metodo: str = "limiar", limiar=2, k: int = K_PADRAO, armazenamento: str = "esparso"
+    ) -> "TGrafoND":
+        """
+        CRIA UMA VERSÃO ESPARSA DO GRAFO, COM OS MESMOS VÉRTICES E LIVROS E APENAS
+        PARTE DAS ARESTAS (VER `esparsificacao.py`). O GRAFO ORIGINAL NÃO É ALTERADO.
+
+        Args:
+            metodo (str): "limiar" (PESO >= limiar), "topk" (AS k ARESTAS MAIS PESADAS
+                DE CADA VÉRTICE) OU "floresta" (FLORESTA GERADORA MÁXIMA).
+            limiar: PESO MÍNIMO DO MÉTODO "limiar".
+            k (int): ARESTAS POR VÉRTICE DO MÉTODO "topk".
+            armazenamento (str): BACKEND DO NOVO GRAFO.
+
+        Returns:
+            TGrafoND: O GRAFO ESPARSIFICADO.
+        """
+        if metodo == "limiar":
+            arestas = arestas_acima_do_limiar(self.grafo.arestas(), limiar)
+        elif metodo == "topk":
+            arestas = arestas_topk(self.grafo.vizinhos, (slot for slot, _ in self._alocador.slotsAtivos()), k)
+        elif metodo == "floresta":
+            arestas = floresta_geradora_maxima(self.grafo.arestas(), len(self.grafo))
+        else:
+            raise ValueError(f"MÉTODO DE ESPARSIFICAÇÃO '{metodo}' DESCONHECIDO (USE {', '.join(METODOS)}).")
+
+        ids = list(self._alocador.ids())
+        esparso = TGrafoND(armazenamento=armazenamento, tipo_peso=self.tipo_peso)
+        esparso.vertices = len(ids)
+        esparso.grafo = cria_armazenamento(armazenamento, len(ids), self.tipo_peso)
+        esparso._alocador = AlocadorVertices.deIds(ids)
+        esparso.livros = {vertice: self.livros[vertice] for vertice in ids if vertice in self.livros}
+        vertice = self._alocador.vertice
+        esparso._insereArestasEmLote(
+            ((vertice(origem), vertice(destino), peso) for origem, destino, peso in arestas), registrar=False
+        )
+
+        total = sum(self.grafo.grau(slot) for slot, _ in self._alocador.slotsAtivos()) // 2
+        logger.info(
+            f"GRAFO ESPARSIFICADO ({metodo}): {total} -> {len(arestas)} ARESTAS "
+            f"({100 * len(arestas) / max(total, 1):.1f}%)."
+        )
+        return esparso
+
+    @instrumenta
+    @leitura
+    def estatisticasGraus(self) -> dict:
+        """
+        CALCULA ESTATÍSTICAS DE GRAUS E PESOS DO GRAFO EM UMA PASSADA.
+        NO ARMAZENAMENTO "numpy" OS CÁLCULOS SÃO VETORIZADOS.
+
+        Returns:
+            dict: NÚMERO DE VÉRTICES E ARESTAS, GRAU MÍNIMO/MÁXIMO/MÉDIO E
+                PESO TOTAL/MÍNIMO/MÁXIMO/MÉDIO DAS ARESTAS.
+        """
+        slots = [slot for slot, _ in self._alocador.slotsAtivos()]
+
+        if getattr(self.grafo, "vetorizado", False):
+            graus = np.count_nonzero(self.grafo.matriz(), axis=1)[slots].tolist()
+            pesos = self.grafo.arestasVetorizadas()[2]
+            num_arestas = len(pesos)
+            peso_total = pesos.sum().item()
+            peso_minimo = pesos.min().item() if num_arestas else 0
+            peso_maximo = pesos.max().item() if num_arestas else 0
+        else:
+            graus = [self.grafo.grau(slot) for slot in slots]
+            num_arestas, peso_total = 0, 0
+            peso_minimo, peso_maximo = None, None
+            for _, _, peso in self.grafo.arestas():
+                num_arestas += 1
+                peso_total += peso
+                peso_minimo = peso if peso_minimo is None else min(peso_minimo, peso)
+                peso_maximo = peso if peso_maximo is None else max(peso_maximo, peso)
+            peso_minimo = peso_minimo or 0
+            peso_maximo = peso_maximo or 0
+
+        return {
+            "vertices": len(slots),
+            "arestas": num_arestas,
+            "grau_minimo": min(graus, default=0),
+            "grau_maximo": max(graus, default=0),
+            "grau_medio": sum(graus) / len(slots) if slots else 0,
+            "peso_total": peso_total,
+            "peso_minimo": peso_minimo,
+            "peso_maximo": peso_maximo,
+            "peso_medio": peso_total / num_arestas if num_arestas else 0,
+        }
+
+    def _funcaoDistancia(self, transformacao):
+        """
+        RESOLVE A TRANSFORMAÇÃO PESO -> DISTÂNCIA USADA NOS CAMINHOS MÍNIMOS.
+
+        Args:
+            transformacao: None (O PESO É A DISTÂNCIA), UMA FUNÇÃO PESO -> DISTÂNCIA
+                OU O NOME DE UM MODO DE `similaridade_para_distancia`
+                ("inverso", "complemento", "log", "saltos").
+        """
+        if transformacao is None or callable(transformacao):
+            return transformacao
+        if transformacao in ("inverso", "saltos"):
+            return similaridade_para_distancia(transformacao)
+        peso_maximo = max((peso for _, _, peso in self.grafo.arestas()), default=1)
+        return similaridade_para_distancia(transformacao, peso_maximo)
+
+    @instrumenta
+    @leitura
+    def dijkstra(self, origens, destino: int = None, transformacao=None) -> tuple:
+        """
+        CALCULA OS CAMINHOS MÍNIMOS (DIJKSTRA COM HEAP) A PARTIR DE UMA OU MAIS ORIGENS.
+
+        Args:
+            origens (int | iterable): VÉRTICE(S) DE PARTIDA.
+            destino (int): SE INFORMADO, A BUSCA PARA ASSIM QUE O DESTINO É ALCANÇADO
+                (AS DEMAIS DISTÂNCIAS PODEM FICAR PARCIAIS).
+            transformacao: CONVERSÃO DO PESO EM DISTÂNCIA (VER `_funcaoDistancia`).
+                COMO OS PESOS SÃO SIMILARIDADES, USE "inverso" PARA QUE LIVROS MAIS
+                PARECIDOS FIQUEM MAIS PRÓXIMOS.
+
+        Returns:
+            tuple: (DISTÂNCIAS, PREDECESSORES) - DICIONÁRIOS {VÉRTICE: DISTÂNCIA} E
+                {VÉRTICE: VÉRTICE ANTERIOR NO CAMINHO}, APENAS PARA VÉRTICES ALCANÇADOS.
+        """
+        if isinstance(origens, int):
+            origens = (origens,)
+        slots = [self._slot(vertice) for vertice in origens]
+        alvo = None if destino is None else self._slot(destino)
+
+        dist, pred = dijkstra_heap(
+            self.grafo.vizinhos, len(self.grafo), slots, alvo, self._funcaoDistancia(transformacao)
+        )
+
+        vertice = self._alocador.vertice
+        distancias = {vertice(s): d for s, d in enumerate(dist) if d != INFINITO}
+        predecessores = {vertice(s): vertice(p) for s, p in enumerate(pred) if p != -1}
+        return distancias, predecessores
+
+    @instrumenta
+    @leitura
+    @memoiza
+    def menorCaminho(self, origem: int, destino: int, transformacao="inverso") -> tuple:
+        """
+        ENCONTRA O MENOR CAMINHO ENTRE DOIS LIVROS.
+
+        Args:
+            origem (int): O VÉRTICE DE ORIGEM.
+            destino (int): O VÉRTICE DE DESTINO.
+            transformacao: CONVERSÃO DO PESO EM DISTÂNCIA (PADRÃO: "inverso").
+
+        Returns:
+            tuple: (DISTÂNCIA, TUPLA DE VÉRTICES DO CAMINHO). SE O DESTINO NÃO FOR
+                ALCANÇÁVEL, RETORNA (INFINITO, ()).
+        """
+        slot_destino = self._slot(destino)
+        dist, pred = dijkstra_heap(
+            self.grafo.vizinhos,
+            len(self.grafo),
+            (self._slot(origem),),
+            slot_destino,
+            self._funcaoDistancia(transformacao),
+        )
+
+        if dist[slot_destino] == INFINITO:
+            if detalhado():
+                logger.info(f"NÃO HÁ CAMINHO ENTRE OS VÉRTICES {origem} E {destino}.")
+            return INFINITO, ()
+
+        caminho = tuple(self._alocador.vertice(s) for s in reconstroi_caminho(pred, slot_destino))
+        if detalhado():
+            logger.info(
+                f"MENOR CAMINHO ENTRE OS VÉRTICES {origem} E {destino}: "
+                f"{' -> '.join(map(str, caminho))} (DISTÂNCIA {dist[slot_destino]:.4g})."
+            )
+        return dist[slot_destino], caminho
+
+    @instrumenta
+    @leitura
+    def todosOsPares(self, origens=None, transformacao=None, processos: int = 1) -> dict:
+        """
+        CALCULA AS DISTÂNCIAS MÍNIMAS DE CADA ORIGEM PARA TODOS OS VÉRTICES (EM LOTE).
+
+        Args:
+            origens (iterable): VÉRTICES DE PARTIDA (PADRÃO: TODOS).
+            transformacao: CONVERSÃO DO PESO EM DISTÂNCIA (VER `_funcaoDistancia`).
+            processos (int): SE DIFERENTE DE 1, DISTRIBUI AS ORIGENS ENTRE PROCESSOS
+                (None = NÚMERO DE CPUS; VER `centralidade.py`).
+
+        Returns:
+            dict: {ORIGEM: {VÉRTICE: DISTÂNCIA}} APENAS PARA VÉRTICES ALCANÇADOS.
+        """
+        if processos != 1:
+            return distancias_todos_os_pares(self, origens, transformacao, processos)
+
+        if origens is None:
+            slots = [slot for slot, _ in self._alocador.slotsAtivos()]
+        else:
+            slots = [self._slot(vertice) for vertice in origens]
+
+        vertice = self._alocador.vertice
+        resultado = {}
+        for origem, dist, _ in todos_os_pares(
+            self.grafo.vizinhos, len(self.grafo), slots, self._funcaoDistancia(transformacao)
+        ):
+            resultado[vertice(origem)] = {
+                vertice(s): d for s, d in enumerate(dist) if d != INFINITO
+            }
+        return resultado
+
+    @instrumenta
+    def centralidade(
+        self,
+        medida: str = "intermediacao",
+        transformacao="inverso",
+        amostras: int = None,
+        processos: int = None,
+    ) -> dict:
+        """
+        CALCULA A CENTRALIDADE DE TODOS OS LIVROS (VER `centralidade.py`).
+
+        Args:
+            medida (str): "grau", "forca" (SOMA DOS PESOS), "proximidade" OU "intermediacao".
+            transformacao: CONVERSÃO DO PESO EM DISTÂNCIA ("inverso", "complemento",
+                "log", "saltos" OU None).
+            amostras (int): NÚMERO DE ORIGENS SORTEADAS (APROXIMAÇÃO PARA GRAFOS GRANDES).
+            processos (int): NÚMERO DE PROCESSOS (PADRÃO: NÚMERO DE CPUS).
+
+        Returns:
+            dict: {VÉRTICE: CENTRALIDADE}.
+        """
+        if medida in ("grau", "forca"):
+            return centralidade_grau(self, ponderado=medida == "forca")
+        if medida == "proximidade":
+            return centralidade_proximidade(self, transformacao, amostras, processos)
+        if medida == "intermediacao":
+            return centralidade_intermediacao(self, transformacao, amostras, processos=processos)
+        raise ValueError(f"MEDIDA DE CENTRALIDADE '{medida}' DESCONHECIDA.")
+
+    @instrumenta
+    @leitura
+    def buscaLivro(self, consulta: str, limite: int = 10) -> list:
+        """
+        BUSCA LIVROS PELO TÍTULO: EXATO, POR PALAVRAS, POR PREFIXO OU APROXIMADO
+        (VER `IndiceTitulos.busca`), SEM PERCORRER TODO O CATÁLOGO.
+
+        Args:
+            consulta (str): TÍTULO (OU PARTE DO TÍTULO) PROCURADO.
+            limite (int): NÚMERO MÁXIMO DE RESULTADOS.
+
+        Returns:
+            list: PARES (VÉRTICE, TÍTULO), DO MELHOR PARA O PIOR RESULTADO.
+        """
+        return [(v, self.livros[v]) for v in self._indiceTitulos().busca(consulta, limite)]
+
+    @instrumenta
+    @leitura
+    def localizaLivro(self, livro, estrito: bool = False) -> int:
+        """
+        RESOLVE UM LIVRO INFORMADO PELO NÚMERO DO VÉRTICE OU PELO TÍTULO. UM TEXTO
+        NUMÉRICO É TRATADO COMO NÚMERO DO VÉRTICE SE ESSE VÉRTICE EXISTIR (E COMO
+        TÍTULO, POR EXEMPLO "1984", CASO CONTRÁRIO). PARA TÍTULOS, USA O MELHOR
+        RESULTADO DE `buscaLivro`.
+
+        NO MODO ESTRITO, USADO PELAS OPERAÇÕES QUE ALTERAM O GRAFO, SÓ VALEM UM
+        VÉRTICE EXISTENTE OU UM TÍTULO IGUAL (APÓS NORMALIZAÇÃO) AO DE UM ÚNICO
+        LIVRO, PARA QUE UM TEXTO COMO "the" NÃO REMOVA O LIVRO ERRADO.
+
+        Args:
+            livro (int | str): NÚMERO DO VÉRTICE OU TÍTULO DO LIVRO.
+            estrito (bool): SE True, NÃO USA A BUSCA POR PALAVRAS, PREFIXO OU APROXIMADA.
+
+        Raises:
+            ValueError: SE NENHUM LIVRO CORRESPONDE AO INFORMADO OU, NO MODO ESTRITO,
+                SE O VÉRTICE NÃO EXISTE OU O TÍTULO É DE MAIS DE UM LIVRO (A MENSAGEM
+                LISTA OS CANDIDATOS).
+        """
+        if isinstance(livro, int):
+            if estrito and livro not in self._alocador:
+                raise ValueError(f"VÉRTICE {livro} NÃO EXISTE.")
+            return livro
+        livro = livro.strip()
+        if livro.isdigit() and int(livro) in self._alocador:
+            return int(livro)
+
+        indice = self._indiceTitulos()
+        if estrito:
+            encontrados = indice.exato(livro)
+            if len(encontrados) != 1:
+                candidatos = encontrados or indice.busca(livro, limite=5)
+                descricao = "; ".join(f"{v} --> {self.livros[v]}" for v in candidatos) or "NENHUM"
+                motivo = "É DE MAIS DE UM LIVRO" if encontrados else "NÃO CORRESPONDE EXATAMENTE A NENHUM LIVRO"
+                raise ValueError(f"O TÍTULO '{livro}' {motivo}. CANDIDATOS: {descricao}.")
+        else:
+            encontrados = indice.busca(livro, limite=1)
+        if not encontrados:
+            raise ValueError(f"LIVRO '{livro}' NÃO ENCONTRADO.")
+        vertice = encontrados[0]
+        if detalhado():
+            logger.info(f"LIVRO '{livro}' LOCALIZADO: {vertice} --> {self.livros[vertice]}")
+        return vertice
+
+    @instrumenta
+    @leitura
+    @memoiza
+    def recomenda(self, livro, k: int = K_PADRAO, dois_saltos: bool = False) -> tuple:
+        """
+        RECOMENDA OS K LIVROS MAIS SIMILARES A UM LIVRO, PELO PESO DAS ARESTAS.
+        AS CONSULTAS USAM O ÍNDICE DOS K VIZINHOS MAIS SIMILARES DE CADA VÉRTICE,
+        MANTIDO POR `insereAresta`, `removeAresta` E `removeVertice`.
+
+        Args:
+            livro (int | str): NÚMERO DO VÉRTICE OU TÍTULO DO LIVRO.
+            k (int): NÚMERO DE RECOMENDAÇÕES.
+            dois_saltos (bool): SE True, RECOMENDA LIVROS QUE AINDA NÃO SÃO VIZINHOS,
+                SOMANDO PESO(LIVRO, N) * PESO(N, C) SOBRE OS VIZINHOS N.
+
+        Returns:
+            tuple: PARES (VÉRTICE, PONTUAÇÃO), DO MAIS PARA O MENOS SIMILAR.
+        """
+        slot = self._slot(self.localizaLivro(livro))
+        with self._trava_indices:
+            indice = self._topk
+            if indice is None or indice.k < k:
+                indice = self._topk = IndiceTopK(len(self.grafo), max(k, K_PADRAO))
+
+        vertice = self._alocador.vertice
+        if dois_saltos:
+            recomendados = indice.doisSaltos(slot, k, self.grafo.vizinhos, self.grafo.peso)
+            return tuple((vertice(c), pontuacao) for c, pontuacao in recomendados)
+
+        melhores = indice.melhores(slot, self.grafo.vizinhos)
+        return tuple((vertice(w), -negativo) for negativo, w in melhores[:k])
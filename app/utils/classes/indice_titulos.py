@@ -0,0 +1,208 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Índice de títulos usado pela classe `TGrafoND` para localizar livros pelo
+nome sem percorrer todo o catálogo. Os títulos são normalizados (sem
+acentos, pontuação nem diferença entre maiúsculas e minúsculas) e indexados
+de quatro formas:
+
+    - tabela hash título normalizado -> vértices (busca exata em O(1));
+    - palavras -> vértices, para consultas com todas as palavras do título
+      em qualquer ordem ("pride prejudice");
+    - lista ordenada dos títulos, para busca por prefixo com `bisect`;
+    - trigramas -> vértices, para busca aproximada (erros de digitação),
+      construído apenas na primeira busca aproximada.
+"""
+
+import heapq
+import re
+import unicodedata
+
+from bisect import bisect_left, insort
+from collections import Counter
+
+# NÚMERO DE TRIGRAMAS DA CONSULTA (OS MAIS RAROS) USADOS PARA GERAR CANDIDATOS NA
+# BUSCA APROXIMADA: TRIGRAMAS COMUNS, COMO " th", NÃO AJUDAM A DISTINGUIR TÍTULOS
+MAX_TRIGRAMAS_CANDIDATOS = 8
+# NÚMERO DE CANDIDATOS AVALIADOS COM A SIMILARIDADE EXATA NA BUSCA APROXIMADA
+MAX_CANDIDATOS = 200
+
+
+def normaliza(titulo: str) -> str:
+    """
+    NORMALIZA O TÍTULO: SEM ACENTOS, SEM PONTUAÇÃO, MINÚSCULO E COM ESPAÇOS SIMPLES.
+    """
+    titulo = unicodedata.normalize("NFKD", titulo)
+    titulo = "".join(c for c in titulo if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w\s]", " ", titulo.casefold()).split())
+
+
+def trigramas(normalizado: str) -> set:
+    """
+    RETORNA O CONJUNTO DE TRIGRAMAS DO TÍTULO NORMALIZADO (COM ESPAÇOS NAS BORDAS).
+    """
+    texto = f"  {normalizado} "
+    return {texto[i : i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceTitulos:
+    """
+    ÍNDICE DE TÍTULOS: BUSCA EXATA, POR PALAVRAS, POR PREFIXO E APROXIMADA.
+    """
+
+    def __init__(self, livros: dict = None):
+        """
+        Args:
+            livros (dict): TÍTULOS INICIAIS, {VÉRTICE: TÍTULO}.
+        """
+        self._normalizados = {}  # VÉRTICE -> TÍTULO NORMALIZADO
+        self._exato = {}  # TÍTULO NORMALIZADO -> CONJUNTO DE VÉRTICES
+        self._palavras = {}  # PALAVRA -> CONJUNTO DE VÉRTICES
+        self._ordenados = []  # PARES (TÍTULO NORMALIZADO, VÉRTICE) EM ORDEM
+        self._trigramas = None  # TRIGRAMA -> CONJUNTO DE VÉRTICES (CRIADO SOB DEMANDA)
+
+        for vertice, titulo in (livros or {}).items():
+            self._indexa(vertice, normaliza(titulo))
+        self._ordenados = sorted((n, v) for v, n in self._normalizados.items())
+
+    def __len__(self) -> int:
+        return len(self._normalizados)
+
+    def _indexa(self, vertice: int, normalizado: str):
+        self._normalizados[vertice] = normalizado
+        self._exato.setdefault(normalizado, set()).add(vertice)
+        for palavra in set(normalizado.split()):
+            self._palavras.setdefault(palavra, set()).add(vertice)
+        if self._trigramas is not None:
+            for trigrama in trigramas(normalizado):
+                self._trigramas.setdefault(trigrama, set()).add(vertice)
+
+    def adiciona(self, vertice: int, titulo: str):
+        """
+        INDEXA O TÍTULO DE UM VÉRTICE (SUBSTITUINDO O TÍTULO ANTERIOR, SE HOUVER).
+        """
+        if vertice in self._normalizados:
+            self.remove(vertice)
+        normalizado = normaliza(titulo)
+        self._indexa(vertice, normalizado)
+        insort(self._ordenados, (normalizado, vertice))
+
+    def remove(self, vertice: int):
+        """
+        RETIRA O VÉRTICE DO ÍNDICE (NADA ACONTECE SE ELE NÃO ESTIVER INDEXADO).
+        """
+        normalizado = self._normalizados.pop(vertice, None)
+        if normalizado is None:
+            return
+
+        def descarta(indice, chave):
+            conjunto = indice[chave]
+            conjunto.discard(vertice)
+            if not conjunto:
+                del indice[chave]
+
+        descarta(self._exato, normalizado)
+        for palavra in set(normalizado.split()):
+            descarta(self._palavras, palavra)
+        if self._trigramas is not None:
+            for trigrama in trigramas(normalizado):
+                descarta(self._trigramas, trigrama)
+        del self._ordenados[bisect_left(self._ordenados, (normalizado, vertice))]
+
+    def exato(self, titulo: str) -> list:
+        """
+        RETORNA OS VÉRTICES CUJO TÍTULO NORMALIZADO É IGUAL AO INFORMADO.
+        """
+        return sorted(self._exato.get(normaliza(titulo), ()))
+
+    def porPalavras(self, consulta: str, limite: int = 10) -> list:
+        """
+        RETORNA ATÉ `limite` VÉRTICES CUJO TÍTULO CONTÉM TODAS AS PALAVRAS DA
+        CONSULTA (OS TÍTULOS MAIS CURTOS PRIMEIRO), INTERSECTANDO AS LISTAS DA
+        MENOR PARA A MAIOR.
+        """
+        palavras = set(normaliza(consulta).split())
+        if not palavras:
+            return []
+        conjuntos = sorted((self._palavras.get(p, set()) for p in palavras), key=len)
+        resultado = set(conjuntos[0])
+        for conjunto in conjuntos[1:]:
+            resultado &= conjunto
+            if not resultado:
+                break
+        return heapq.nsmallest(limite, resultado, key=lambda v: (len(self._normalizados[v]), v))
+
+    def prefixo(self, prefixo: str, limite: int = 10) -> list:
+        """
+        RETORNA ATÉ `limite` VÉRTICES CUJO TÍTULO NORMALIZADO COMEÇA COM O PREFIXO,
+        EM ORDEM ALFABÉTICA.
+        """
+        prefixo = normaliza(prefixo)
+        ordenados = self._ordenados
+        resultado = []
+        posicao = bisect_left(ordenados, (prefixo,))
+        while posicao < len(ordenados) and len(resultado) < limite:
+            normalizado, vertice = ordenados[posicao]
+            if not normalizado.startswith(prefixo):
+                break
+            resultado.append(vertice)
+            posicao += 1
+        return resultado
+
+    def aproximado(self, consulta: str, limite: int = 10, minimo: float = 0.3) -> list:
+        """
+        BUSCA APROXIMADA POR TRIGRAMAS (COEFICIENTE DE DICE ENTRE OS CONJUNTOS DE TRIGRAMAS).
+
+        Args:
+            consulta (str): TÍTULO PROCURADO, POSSIVELMENTE COM ERROS.
+            limite (int): NÚMERO MÁXIMO DE RESULTADOS.
+            minimo (float): SIMILARIDADE MÍNIMA (0 A 1) PARA UM RESULTADO.
+
+        Returns:
+            list: PARES (VÉRTICE, SIMILARIDADE), DO MAIS PARA O MENOS SIMILAR.
+        """
+        if self._trigramas is None:
+            # MONTA O ÍNDICE COMPLETO ANTES DE PUBLICÁ-LO (CONSULTAS PODEM SER SIMULTÂNEAS)
+            indice = {}
+            for vertice, normalizado in self._normalizados.items():
+                for trigrama in trigramas(normalizado):
+                    indice.setdefault(trigrama, set()).add(vertice)
+            self._trigramas = indice
+
+        consulta = trigramas(normaliza(consulta))
+        listas = [self._trigramas[t] for t in consulta if t in self._trigramas]
+
+        contagem = Counter()
+        for lista in heapq.nsmallest(MAX_TRIGRAMAS_CANDIDATOS, listas, key=len):
+            contagem.update(lista)
+
+        resultado = []
+        for vertice, _ in contagem.most_common(MAX_CANDIDATOS):
+            candidato = trigramas(self._normalizados[vertice])
+            similaridade = 2 * len(consulta & candidato) / (len(consulta) + len(candidato))
+            if similaridade >= minimo:
+                resultado.append((similaridade, -vertice))
+
+        return [(-v, similaridade) for similaridade, v in heapq.nlargest(limite, resultado)]
+
+    def busca(self, consulta: str, limite: int = 10) -> list:
+        """
+        BUSCA COMBINADA: TÍTULO EXATO, DEPOIS TODAS AS PALAVRAS, DEPOIS PREFIXO
+        E, SE NADA FOR ENCONTRADO, BUSCA APROXIMADA.
+
+        Returns:
+            list: ATÉ `limite` VÉRTICES, DO MELHOR PARA O PIOR RESULTADO.
+        """
+        if not normaliza(consulta):
+            return []
+
+        resultado = self.exato(consulta)
+        for vertice in self.porPalavras(consulta, limite) + self.prefixo(consulta, limite):
+            if len(resultado) >= limite:
+                break
+            if vertice not in resultado:
+                resultado.append(vertice)
+        if not resultado:
+            resultado = [vertice for vertice, _ in self.aproximado(consulta, limite)]
+        return resultado[:limite]
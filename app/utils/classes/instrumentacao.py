@@ -0,0 +1,244 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Instrumentação da classe `TGrafoND`:
+
+    - `METRICAS`: contagem de chamadas e histograma de latência por método,
+      alimentados pelo decorador `instrumenta` e exportáveis como dicionário
+      ou no formato texto do Prometheus (para o textfile collector);
+    - `perfil`: gerenciador de contexto que liga o cProfile e o tracemalloc
+      em volta de qualquer trecho de código;
+    - modo silencioso: nos caminhos quentes (inserção e remoção de vértices
+      e arestas, buscas), o log por chamada passa a custar apenas a
+      verificação de `detalhado()`, sem montar a mensagem.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import threading
+import tracemalloc
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+from loguru import logger
+
+# LIMITES SUPERIORES (EM SEGUNDOS) DAS FAIXAS DO HISTOGRAMA DE LATÊNCIA
+FAIXAS_LATENCIA = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+PREFIXO_PROMETHEUS = "book_graph"
+
+# MODO SILENCIOSO DO PROCESSO (`define_silencioso`, EX.: OPÇÃO DA CLI) E DO BLOCO
+# `silencioso()` ATUAL. O DO BLOCO É UMA ContextVar, PRÓPRIA DE CADA THREAD: COM VÁRIAS
+# THREADS ENTRANDO E SAINDO DE BLOCOS SILENCIOSOS EM ORDEM CRUZADA, UMA NÃO RELIGA NEM
+# DESLIGA O LOG DA OUTRA
+_silencioso = False
+_silencioso_bloco = ContextVar("silencioso_bloco", default=None)
+
+
+def detalhado() -> bool:
+    """
+    INDICA SE OS LOGS POR CHAMADA DOS CAMINHOS QUENTES DEVEM SER EMITIDOS.
+    """
+    bloco = _silencioso_bloco.get()
+    return not (_silencioso if bloco is None else bloco)
+
+
+def define_silencioso(ativo: bool = True):
+    """
+    LIGA OU DESLIGA O MODO SILENCIOSO (SEM LOG POR CHAMADA NOS CAMINHOS QUENTES)
+    PARA TODO O PROCESSO, FORA DOS BLOCOS `silencioso()`. AVISOS, ERROS E MENSAGENS
+    DE OPERAÇÕES INTEIRAS (LEITURA, GRAVAÇÃO) CONTINUAM.
+    """
+    global _silencioso
+    _silencioso = ativo
+
+
+@contextmanager
+def silencioso():
+    """
+    EXECUTA O BLOCO NO MODO SILENCIOSO (APENAS NA THREAD ATUAL), RESTAURANDO O
+    MODO ANTERIOR AO SAIR.
+    """
+    marca = _silencioso_bloco.set(True)
+    try:
+        yield
+    finally:
+        _silencioso_bloco.reset(marca)
+
+
+class Metricas:
+    """
+    REGISTRO DE CHAMADAS E LATÊNCIAS POR OPERAÇÃO (SEGURO ENTRE THREADS).
+    """
+
+    def __init__(self, faixas: tuple = FAIXAS_LATENCIA):
+        self.faixas = faixas
+        self.ativo = True
+        self._trava = threading.Lock()
+        # OPERAÇÃO -> [CHAMADAS, SEGUNDOS TOTAIS, CONTAGEM POR FAIXA (+ UMA PARA +Inf)]
+        self._operacoes = {}
+
+    def ativa(self):
+        self.ativo = True
+
+    def desativa(self):
+        self.ativo = False
+
+    def zera(self):
+        with self._trava:
+            self._operacoes.clear()
+
+    def registra(self, operacao: str, segundos: float):
+        """
+        REGISTRA UMA CHAMADA DA OPERAÇÃO COM A SUA DURAÇÃO.
+        """
+        faixa = bisect_left(self.faixas, segundos)
+        with self._trava:
+            dados = self._operacoes.get(operacao)
+            if dados is None:
+                dados = self._operacoes[operacao] = [0, 0.0, [0] * (len(self.faixas) + 1)]
+            dados[0] += 1
+            dados[1] += segundos
+            dados[2][faixa] += 1
+
+    def exporta(self) -> dict:
+        """
+        RETORNA AS MÉTRICAS COMO DICIONÁRIO: {OPERAÇÃO: {chamadas, segundos_total,
+        segundos_medio, histograma}}, COM O HISTOGRAMA ACUMULADO {LIMITE: CHAMADAS}.
+        """
+        with self._trava:
+            copia = {op: (d[0], d[1], list(d[2])) for op, d in self._operacoes.items()}
+
+        resultado = {}
+        for operacao, (chamadas, total, contagens) in sorted(copia.items()):
+            acumulado, histograma = 0, {}
+            for limite, contagem in zip(self.faixas + (float("inf"),), contagens):
+                acumulado += contagem
+                histograma[str(limite) if limite != float("inf") else "+Inf"] = acumulado
+            resultado[operacao] = {
+                "chamadas": chamadas,
+                "segundos_total": total,
+                "segundos_medio": total / chamadas if chamadas else 0.0,
+                "histograma": histograma,
+            }
+        return resultado
+
+    def prometheus(self) -> str:
+        """
+        RETORNA AS MÉTRICAS NO FORMATO TEXTO DE EXPOSIÇÃO DO PROMETHEUS.
+        """
+        nome = f"{PREFIXO_PROMETHEUS}_operacao_segundos"
+        linhas = [
+            f"# HELP {nome} Latência das operações da TGrafoND.",
+            f"# TYPE {nome} histogram",
+        ]
+        for operacao, dados in self.exporta().items():
+            rotulo = f'operacao="{operacao}"'
+            for limite, acumulado in dados["histograma"].items():
+                linhas.append(f'{nome}_bucket{{{rotulo},le="{limite}"}} {acumulado}')
+            linhas.append(f"{nome}_sum{{{rotulo}}} {dados['segundos_total']}")
+            linhas.append(f"{nome}_count{{{rotulo}}} {dados['chamadas']}")
+        return "\n".join(linhas) + "\n"
+
+    def gravaPrometheus(self, arquivo: str):
+        """
+        GRAVA AS MÉTRICAS NO FORMATO DO PROMETHEUS (ARQUIVO TEMPORÁRIO + RENOMEAÇÃO,
+        PARA O COLETOR NUNCA LER UM ARQUIVO PELA METADE).
+        """
+        temporario = f"{arquivo}.{os.getpid()}.tmp"
+        with open(temporario, "w") as f:
+            f.write(self.prometheus())
+        os.replace(temporario, arquivo)
+
+
+METRICAS = Metricas()
+
+
+def instrumenta(funcao):
+    """
+    DECORADOR QUE REGISTRA EM `METRICAS` AS CHAMADAS E A LATÊNCIA DO MÉTODO.
+    COM AS MÉTRICAS DESATIVADAS, O CUSTO É APENAS A VERIFICAÇÃO DE `METRICAS.ativo`.
+    """
+    operacao = funcao.__qualname__
+
+    @wraps(funcao)
+    def instrumentada(*args, **kwargs):
+        if not METRICAS.ativo:
+            return funcao(*args, **kwargs)
+        inicio = perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            METRICAS.registra(operacao, perf_counter() - inicio)
+
+    return instrumentada
+
+
+class Perfil:
+    """
+    RESULTADO DE `perfil`: ESTATÍSTICAS DO cProfile E USO DE MEMÓRIA DO tracemalloc.
+    """
+
+    def __init__(self):
+        self.perfilador = cProfile.Profile()
+        self.segundos = 0.0
+        self.memoria_atual = 0
+        self.memoria_pico = 0
+        self.maiores_alocacoes = []
+
+    def estatisticas(self, ordenar: str = "cumulative", linhas: int = 20) -> str:
+        """
+        RETORNA O RELATÓRIO DO cProfile COMO TEXTO.
+        """
+        saida = io.StringIO()
+        pstats.Stats(self.perfilador, stream=saida).sort_stats(ordenar).print_stats(linhas)
+        return saida.getvalue()
+
+
+@contextmanager
+def perfil(memoria: bool = True, arquivo: str = None, exibir: bool = False):
+    """
+    PERFILA O BLOCO COM O cProfile E, OPCIONALMENTE, O tracemalloc.
+
+        with perfil() as resultado:
+            grafo.leArquivo("app/data/grafo.txt")
+        print(resultado.estatisticas())
+
+    Args:
+        memoria (bool): TAMBÉM MEDE A MEMÓRIA ALOCADA (tracemalloc).
+        arquivo (str): SE INFORMADO, GRAVA AS ESTATÍSTICAS DO cProfile (PARA snakeviz, pstats...).
+        exibir (bool): EXIBE O RELATÓRIO NO LOG AO FINAL.
+    """
+    resultado = Perfil()
+    rastreava = tracemalloc.is_tracing()
+    if memoria and not rastreava:
+        tracemalloc.start()
+
+    inicio = perf_counter()
+    resultado.perfilador.enable()
+    try:
+        yield resultado
+    finally:
+        resultado.perfilador.disable()
+        resultado.segundos = perf_counter() - inicio
+
+        if memoria:
+            resultado.memoria_atual, resultado.memoria_pico = tracemalloc.get_traced_memory()
+            resultado.maiores_alocacoes = tracemalloc.take_snapshot().statistics("lineno")[:10]
+            if not rastreava:
+                tracemalloc.stop()
+
+        if arquivo:
+            resultado.perfilador.dump_stats(arquivo)
+
+        if exibir:
+            logger.info(
+                f"PERFIL: {resultado.segundos:.4f}s, PICO DE MEMÓRIA "
+                f"{resultado.memoria_pico / 2**20:.2f} MiB\n{resultado.estatisticas()}"
+            )
@@ -0,0 +1,85 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Motor de percurso iterativo compartilhado pela classe `TGrafoND`. A busca
+em profundidade usa uma pilha explícita e a busca em largura uma fila, de
+modo que nenhum percurso depende do limite de recursão do Python. Os
+vértices visitados são marcados em um `bytearray` reaproveitável (um byte
+por posição), e cada percurso custa O(V+E).
+
+As funções trabalham com as posições internas (slots) dos vértices e
+recebem a função de vizinhos do armazenamento.
+"""
+
+from collections import deque
+
+
+def busca_profundidade(vizinhos, inicio: int, visitado: bytearray) -> list:
+    """
+    BUSCA EM PROFUNDIDADE ITERATIVA (PILHA EXPLÍCITA) A PARTIR DE UMA POSIÇÃO.
+
+    Args:
+        vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO).
+        inicio (int): POSIÇÃO DE PARTIDA.
+        visitado (bytearray): MARCAÇÃO DAS POSIÇÕES JÁ VISITADAS (ATUALIZADA AQUI).
+
+    Returns:
+        list: POSIÇÕES ALCANÇADAS, NA ORDEM EM QUE FORAM VISITADAS.
+    """
+    visitado[inicio] = 1
+    ordem = []
+    pilha = [inicio]
+    while pilha:
+        v = pilha.pop()
+        ordem.append(v)
+        for w, _ in vizinhos(v):
+            if not visitado[w]:
+                visitado[w] = 1
+                pilha.append(w)
+    return ordem
+
+
+def busca_largura(vizinhos, inicio: int, visitado: bytearray) -> list:
+    """
+    BUSCA EM LARGURA (FILA) A PARTIR DE UMA POSIÇÃO.
+
+    Args:
+        vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO).
+        inicio (int): POSIÇÃO DE PARTIDA.
+        visitado (bytearray): MARCAÇÃO DAS POSIÇÕES JÁ VISITADAS (ATUALIZADA AQUI).
+
+    Returns:
+        list: POSIÇÕES ALCANÇADAS, EM ORDEM DE DISTÂNCIA (EM ARESTAS) DA ORIGEM.
+    """
+    visitado[inicio] = 1
+    ordem = []
+    fila = deque([inicio])
+    while fila:
+        v = fila.popleft()
+        ordem.append(v)
+        for w, _ in vizinhos(v):
+            if not visitado[w]:
+                visitado[w] = 1
+                fila.append(w)
+    return ordem
+
+
+def rotula_componentes(vizinhos, capacidade: int) -> list:
+    """
+    ROTULA CADA POSIÇÃO COM O REPRESENTANTE (MENOR POSIÇÃO) DE SUA COMPONENTE CONECTADA.
+
+    Args:
+        vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO).
+        capacidade (int): NÚMERO DE POSIÇÕES.
+
+    Returns:
+        list: RÓTULO DA COMPONENTE DE CADA POSIÇÃO.
+    """
+    visitado = bytearray(capacidade)
+    rotulos = [0] * capacidade
+    for inicio in range(capacidade):
+        if not visitado[inicio]:
+            for v in busca_profundidade(vizinhos, inicio, visitado):
+                rotulos[v] = inicio
+    return rotulos
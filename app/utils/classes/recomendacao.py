@@ -0,0 +1,133 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Índice de recomendações usado pela classe `TGrafoND`: para cada posição
+(slot) guarda os k vizinhos de maior peso, em ordem decrescente. A lista de
+um vértice é calculada na primeira consulta (O(grau · log k)) e depois
+mantida pelas inserções e remoções de arestas, de modo que uma consulta
+custa O(k) e a consulta de dois saltos O(k²), independentemente do tamanho
+do grafo.
+
+Uma lista com menos de k itens contém todos os vizinhos do vértice. Quando
+uma aresta de uma lista cheia perde peso (ou é removida), algum vizinho de
+fora pode passar à frente; nesse caso apenas a lista daquele vértice é
+descartada e recalculada na próxima consulta.
+"""
+
+import heapq
+
+from bisect import insort
+from collections import defaultdict
+
+# NÚMERO PADRÃO DE VIZINHOS GUARDADOS POR VÉRTICE
+K_PADRAO = 10
+
+
+class IndiceTopK:
+    """
+    OS K VIZINHOS MAIS SIMILARES DE CADA POSIÇÃO, COMO LISTAS ORDENADAS DE
+    (-PESO, VIZINHO). None INDICA UMA LISTA A (RE)CALCULAR SOB DEMANDA.
+    """
+
+    def __init__(self, capacidade: int, k: int = K_PADRAO):
+        """
+        Args:
+            capacidade (int): NÚMERO DE POSIÇÕES DO ARMAZENAMENTO.
+            k (int): NÚMERO DE VIZINHOS GUARDADOS POR POSIÇÃO.
+        """
+        self.k = k
+        self._listas = [None] * capacidade
+
+    def adiciona(self):
+        """
+        ACOMPANHA UMA NOVA POSIÇÃO (SEM ARESTAS) NO ARMAZENAMENTO.
+        """
+        self._listas.append([])
+
+    def melhores(self, slot: int, vizinhos) -> list:
+        """
+        RETORNA A LISTA (-PESO, VIZINHO) DOS K VIZINHOS DE MAIOR PESO DA POSIÇÃO.
+
+        Args:
+            slot (int): POSIÇÃO DO VÉRTICE.
+            vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO).
+        """
+        lista = self._listas[slot]
+        if lista is None:
+            lista = heapq.nsmallest(self.k, ((-peso, w) for w, peso in vizinhos(slot)))
+            self._listas[slot] = lista
+        return lista
+
+    def atualiza(self, origem: int, destino: int, peso: int):
+        """
+        REFLETE NO ÍNDICE A MUDANÇA DO PESO DA ARESTA ORIGEM-DESTINO (0 = REMOÇÃO).
+        """
+        self._atualizaLado(origem, destino, peso)
+        self._atualizaLado(destino, origem, peso)
+
+    def _atualizaLado(self, slot: int, vizinho: int, peso: int):
+        lista = self._listas[slot]
+        if lista is None:
+            return
+
+        cheia = len(lista) >= self.k
+        for i, (negativo, w) in enumerate(lista):
+            if w == vizinho:
+                if cheia and peso < -negativo:
+                    # O PESO CAIU: UM VIZINHO FORA DA LISTA PODE PASSAR À FRENTE
+                    self._listas[slot] = None
+                    return
+                del lista[i]
+                break
+        else:
+            if peso == 0 or (cheia and (-peso, vizinho) > lista[-1]):
+                return
+
+        if peso != 0:
+            insort(lista, (-peso, vizinho))
+            if len(lista) > self.k:
+                lista.pop()
+
+    def removeSlot(self, slot: int, vizinhos):
+        """
+        RETIRA DO ÍNDICE TODAS AS ARESTAS DE UMA POSIÇÃO PRESTES A SER LIMPA.
+
+        Args:
+            slot (int): POSIÇÃO DO VÉRTICE REMOVIDO.
+            vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO),
+                AINDA COM AS ARESTAS DA POSIÇÃO.
+        """
+        for w, _ in list(vizinhos(slot)):
+            self._atualizaLado(w, slot, 0)
+        self._listas[slot] = []
+
+    def doisSaltos(self, slot: int, k: int, vizinhos, peso) -> list:
+        """
+        RECOMENDAÇÃO DE DOIS SALTOS: CADA CANDIDATO C RECEBE A SOMA, SOBRE OS
+        VIZINHOS N DA LISTA DO VÉRTICE, DE PESO(V, N) * PESO(N, C). O PRÓPRIO
+        VÉRTICE E SEUS VIZINHOS DIRETOS NÃO SÃO RECOMENDADOS.
+
+        Args:
+            slot (int): POSIÇÃO DO VÉRTICE.
+            k (int): NÚMERO DE RECOMENDAÇÕES.
+            vizinhos (callable): FUNÇÃO POSIÇÃO -> ITERÁVEL DE (VIZINHO, PESO).
+            peso (callable): FUNÇÃO (POSIÇÃO, POSIÇÃO) -> PESO DA ARESTA.
+
+        Returns:
+            list: ATÉ K PARES (POSIÇÃO, PONTUAÇÃO), DA MAIOR PARA A MENOR PONTUAÇÃO.
+        """
+        pontos = defaultdict(int)
+        for negativo, n in self.melhores(slot, vizinhos):
+            for negativo_n, c in self.melhores(n, vizinhos):
+                pontos[c] += negativo * negativo_n
+
+        melhores = heapq.nsmallest(
+            k,
+            (
+                (-pontuacao, c)
+                for c, pontuacao in pontos.items()
+                if c != slot and peso(slot, c) == 0
+            ),
+        )
+        return [(c, -negativo) for negativo, c in melhores]
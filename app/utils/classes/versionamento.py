@@ -0,0 +1,217 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Histórico de alterações da classe `TGrafoND`. Toda alteração (inserção e
+remoção de vértices, definição do peso de uma aresta) é registrada em um log
+que só cresce no final, junto com os valores anteriores necessários para
+desfazê-la:
+
+    ("V+", VÉRTICE, NOME)                    VÉRTICE INSERIDO
+    ("V-", VÉRTICE, NOME, [(VIZINHO, PESO)]) VÉRTICE REMOVIDO (COM SUAS ARESTAS)
+    ("A", ORIGEM, DESTINO, ANTERIOR, NOVO)   PESO DA ARESTA ALTERADO (0 = SEM ARESTA)
+
+Um cursor separa as alterações aplicadas das que podem ser refeitas; uma nova
+alteração descarta as que estavam depois do cursor. Um snapshot é apenas a
+identificação da posição do cursor (O(1)): voltar a ele desfaz ou refaz as
+alterações entre as duas posições, sem copiar o grafo.
+
+Além do log, o histórico acumula as alterações efetivas (incluindo as
+causadas por desfazer e refazer) ainda não gravadas em disco. Elas podem ser
+acrescentadas a um arquivo delta (uma alteração por linha, em JSON) ao lado
+do arquivo do grafo, em vez de regravar o arquivo inteiro.
+"""
+
+import json
+import os
+
+from contextlib import contextmanager
+
+# EXTENSÃO DO ARQUIVO DELTA, GRAVADO AO LADO DO ARQUIVO DO GRAFO (EX.: grafo.txt.delta)
+EXTENSAO_DELTA = ".delta"
+
+
+def arquivo_delta(arquivo: str) -> str:
+    """
+    RETORNA O CAMINHO DO ARQUIVO DELTA ASSOCIADO AO ARQUIVO DO GRAFO.
+    """
+    return f"{arquivo}{EXTENSAO_DELTA}"
+
+
+def inverte(mutacao: tuple) -> list:
+    """
+    RETORNA AS ALTERAÇÕES QUE DESFAZEM A ALTERAÇÃO INFORMADA, NA ORDEM DE APLICAÇÃO.
+    """
+    tipo = mutacao[0]
+    if tipo == "V+":
+        _, vertice, nome = mutacao
+        return [("V-", vertice, nome, [])]
+    if tipo == "V-":
+        _, vertice, nome, arestas = mutacao
+        return [("V+", vertice, nome)] + [
+            ("A", vertice, vizinho, 0, peso) for vizinho, peso in arestas
+        ]
+    if tipo == "A":
+        _, origem, destino, anterior, novo = mutacao
+        return [("A", origem, destino, novo, anterior)]
+    raise ValueError(f"ALTERAÇÃO DESCONHECIDA: {tipo}.")
+
+
+def serializa(mutacao: tuple) -> str:
+    """
+    CONVERTE A ALTERAÇÃO NA LINHA DO ARQUIVO DELTA (APENAS O NECESSÁRIO PARA REAPLICÁ-LA).
+    """
+    tipo = mutacao[0]
+    if tipo == "V+":
+        dados = list(mutacao)
+    elif tipo == "V-":
+        dados = ["V-", mutacao[1]]
+    else:
+        dados = ["A", mutacao[1], mutacao[2], mutacao[4]]
+    return json.dumps(dados, ensure_ascii=False) + "\n"
+
+
+def le_delta(arquivo: str):
+    """
+    PERCORRE AS ALTERAÇÕES DE UM ARQUIVO DELTA: ("V+", VÉRTICE, NOME),
+    ("V-", VÉRTICE) OU ("A", ORIGEM, DESTINO, PESO).
+    """
+    with open(arquivo, "r", encoding="utf-8") as f:
+        for linha in f:
+            if linha.strip():
+                yield tuple(json.loads(linha))
+
+
+class HistoricoMutacoes:
+    """
+    LOG DE ALTERAÇÕES COM DESFAZER/REFAZER, SNAPSHOTS E ALTERAÇÕES PENDENTES DE GRAVAÇÃO.
+    """
+
+    def __init__(self):
+        self._log = []  # ALTERAÇÕES, NA ORDEM EM QUE FORAM FEITAS
+        self._versoes = []  # NÚMERO DE VERSÃO (ÚNICO) CRIADO POR CADA ALTERAÇÃO DO LOG
+        self._posicoes = {0: 0}  # NÚMERO DE VERSÃO -> POSIÇÃO DO CURSOR
+        self._proxima_versao = 1
+        self.cursor = 0  # ALTERAÇÕES ANTES DO CURSOR ESTÃO APLICADAS
+        self.pendentes = []  # ALTERAÇÕES EFETIVAS AINDA NÃO GRAVADAS EM DISCO
+        self.ativo = True
+        self._reaplicando = False
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def registra(self, mutacao: tuple):
+        """
+        REGISTRA UMA ALTERAÇÃO FEITA NO GRAFO. FORA DE `desfaz`/`refaz`, DESCARTA
+        AS ALTERAÇÕES QUE PODERIAM SER REFEITAS.
+        """
+        if not self.ativo:
+            return
+        self.pendentes.append(mutacao)
+        if self._reaplicando:
+            return
+
+        cursor = self.cursor
+        if cursor < len(self._log):
+            for versao in self._versoes[cursor:]:
+                del self._posicoes[versao]
+            del self._log[cursor:]
+            del self._versoes[cursor:]
+
+        versao = self._proxima_versao
+        self._log.append(mutacao)
+        self._versoes.append(versao)
+        self.cursor = self._posicoes[versao] = cursor + 1
+        self._proxima_versao = versao + 1
+
+    @contextmanager
+    def reaplicando(self):
+        """
+        BLOCO EM QUE AS ALTERAÇÕES (DE DESFAZER/REFAZER) VÃO APENAS PARA AS PENDENTES.
+        """
+        anterior = self._reaplicando
+        self._reaplicando = True
+        try:
+            yield
+        finally:
+            self._reaplicando = anterior
+
+    @contextmanager
+    def suspenso(self):
+        """
+        BLOCO EM QUE AS ALTERAÇÕES NÃO SÃO REGISTRADAS (CARGA DE ARQUIVOS).
+        """
+        anterior = self.ativo
+        self.ativo = False
+        try:
+            yield
+        finally:
+            self.ativo = anterior
+
+    def reinicia(self):
+        """
+        DESCARTA O LOG, OS SNAPSHOTS E AS ALTERAÇÕES PENDENTES (NOVO ESTADO BASE).
+        """
+        self.__init__()
+
+    def podeDesfazer(self) -> bool:
+        return self.cursor > 0
+
+    def podeRefazer(self) -> bool:
+        return self.cursor < len(self._log)
+
+    def desfaz(self) -> tuple:
+        """
+        RECUA O CURSOR E RETORNA A ALTERAÇÃO A SER DESFEITA.
+
+        Raises:
+            ValueError: SE NÃO HÁ ALTERAÇÃO PARA DESFAZER.
+        """
+        if not self.podeDesfazer():
+            raise ValueError("NÃO HÁ ALTERAÇÕES PARA DESFAZER.")
+        self.cursor -= 1
+        return self._log[self.cursor]
+
+    def refaz(self) -> tuple:
+        """
+        AVANÇA O CURSOR E RETORNA A ALTERAÇÃO A SER REFEITA.
+
+        Raises:
+            ValueError: SE NÃO HÁ ALTERAÇÃO PARA REFAZER.
+        """
+        if not self.podeRefazer():
+            raise ValueError("NÃO HÁ ALTERAÇÕES PARA REFAZER.")
+        self.cursor += 1
+        return self._log[self.cursor - 1]
+
+    def snapshot(self) -> int:
+        """
+        RETORNA O NÚMERO DA VERSÃO ATUAL DO GRAFO, EM O(1).
+        """
+        return self._versoes[self.cursor - 1] if self.cursor else 0
+
+    def posicao(self, versao: int) -> int:
+        """
+        RETORNA A POSIÇÃO DO CURSOR CORRESPONDENTE AO SNAPSHOT.
+
+        Raises:
+            ValueError: SE A VERSÃO FOI DESCARTADA (HOUVE ALTERAÇÕES DEPOIS DE UM DESFAZER).
+        """
+        if versao not in self._posicoes:
+            raise ValueError(f"A VERSÃO {versao} NÃO ESTÁ MAIS NO HISTÓRICO.")
+        return self._posicoes[versao]
+
+    def gravaPendentes(self, arquivo: str) -> int:
+        """
+        ACRESCENTA AS ALTERAÇÕES PENDENTES AO ARQUIVO DELTA E AS MARCA COMO GRAVADAS.
+
+        Returns:
+            int: NÚMERO DE ALTERAÇÕES GRAVADAS.
+        """
+        with open(arquivo, "a", encoding="utf-8") as f:
+            f.writelines(serializa(mutacao) for mutacao in self.pendentes)
+            f.flush()
+            os.fsync(f.fileno())
+        gravadas = len(self.pendentes)
+        self.pendentes = []
+        return gravadas
@@ -0,0 +1,200 @@
+"""
+Biblioteca Conectada: Explorando Relações entre Livros
+
+Síntese do Conteúdo:
+Alocador de posições (slots) para os vértices da classe `TGrafoND`.
+Cada vértice possui um identificador externo estável (o número usado no
+arquivo e no dicionário de livros) e ocupa uma posição interna no
+armazenamento da adjacência. Vértices removidos deixam uma lápide e sua
+posição vai para uma lista de posições livres, reaproveitada na próxima
+inserção; assim, inserir e remover vértices não exige renumerar nada.
+O método `compacta` elimina as lápides quando desejado.
+
+Enquanto os vértices forem exatamente 0..N-1 (o caso de um arquivo recém
+carregado), o alocador não guarda mapa algum: identificador e posição
+coincidem. Os mapas só são criados na primeira operação que quebre essa
+sequência.
+"""
+
+
+class AlocadorVertices:
+    """
+    MAPEIA IDENTIFICADORES EXTERNOS DE VÉRTICES PARA POSIÇÕES INTERNAS (SLOTS).
+    """
+
+    def __init__(self, vertices: int = 0):
+        """
+        CRIA O ALOCADOR COM OS VÉRTICES 0..VERTICES-1 (IDENTIFICADOR = POSIÇÃO).
+
+        Args:
+            vertices (int): NÚMERO INICIAL DE VÉRTICES.
+        """
+        # NÚMERO DE VÉRTICES NO MODO SEQUENCIAL (None DEPOIS DE MATERIALIZAR OS MAPAS)
+        self._sequencial = vertices
+        # POSIÇÃO -> IDENTIFICADOR (None INDICA UMA LÁPIDE)
+        self._ids = None
+        # IDENTIFICADOR -> POSIÇÃO
+        self._slots = None
+        # PILHA DE POSIÇÕES LIVRES (LÁPIDES REAPROVEITÁVEIS)
+        self._livres = []
+        # PRÓXIMO IDENTIFICADOR ENTREGUE QUANDO NENHUM FOR INFORMADO
+        self._proximo_id = vertices
+
+    def _materializa(self):
+        """
+        SAI DO MODO SEQUENCIAL, CRIANDO OS MAPAS IDENTIFICADOR <-> POSIÇÃO.
+        """
+        if self._sequencial is not None:
+            self._ids = list(range(self._sequencial))
+            self._slots = {vertice: vertice for vertice in self._ids}
+            self._sequencial = None
+
+    def __len__(self) -> int:
+        if self._sequencial is not None:
+            return self._sequencial
+        return len(self._slots)
+
+    def __contains__(self, vertice) -> bool:
+        if self._sequencial is not None:
+            return isinstance(vertice, int) and 0 <= vertice < self._sequencial
+        return vertice in self._slots
+
+    @property
+    def capacidade(self) -> int:
+        """
+        NÚMERO DE POSIÇÕES INTERNAS (VÉRTICES ATIVOS + LÁPIDES).
+        """
+        if self._sequencial is not None:
+            return self._sequencial
+        return len(self._ids)
+
+    @property
+    def lapides(self) -> int:
+        return len(self._livres)
+
+    def aloca(self, vertice: int = None) -> tuple:
+        """
+        RESERVA UMA POSIÇÃO PARA UM NOVO VÉRTICE EM O(1) AMORTIZADO.
+
+        Args:
+            vertice (int): IDENTIFICADOR DESEJADO. SE OMITIDO, USA O PRÓXIMO LIVRE.
+
+        Returns:
+            tuple: (IDENTIFICADOR, POSIÇÃO) DO VÉRTICE ALOCADO.
+        """
+        if vertice is None:
+            vertice = self._proximo_id
+        elif vertice in self:
+            raise ValueError(f"VÉRTICE {vertice} JÁ EXISTE NO GRAFO.")
+
+        if self._sequencial is not None and vertice == self._sequencial:
+            self._sequencial += 1
+            self._proximo_id = self._sequencial
+            return vertice, vertice
+
+        self._materializa()
+        if self._livres:
+            slot = self._livres.pop()
+            self._ids[slot] = vertice
+        else:
+            slot = len(self._ids)
+            self._ids.append(vertice)
+
+        self._slots[vertice] = slot
+        self._proximo_id = max(self._proximo_id, vertice + 1)
+        return vertice, slot
+
+    def libera(self, vertice: int) -> int:
+        """
+        TRANSFORMA A POSIÇÃO DO VÉRTICE EM LÁPIDE, EM O(1).
+
+        Args:
+            vertice (int): IDENTIFICADOR DO VÉRTICE REMOVIDO.
+
+        Returns:
+            int: A POSIÇÃO LIBERADA.
+        """
+        slot = self.slot(vertice)
+        self._materializa()
+        del self._slots[vertice]
+        self._ids[slot] = None
+        self._livres.append(slot)
+        return slot
+
+    def slot(self, vertice: int) -> int:
+        """
+        RETORNA A POSIÇÃO INTERNA DE UM VÉRTICE.
+
+        Raises:
+            ValueError: SE O VÉRTICE NÃO EXISTE.
+        """
+        if self._sequencial is not None:
+            if vertice in self:
+                return vertice
+        elif vertice in self._slots:
+            return self._slots[vertice]
+        raise ValueError(f"VÉRTICE {vertice} NÃO EXISTE NO GRAFO.")
+
+    def vertice(self, slot: int):
+        """
+        RETORNA O IDENTIFICADOR DO VÉRTICE EM UMA POSIÇÃO (None SE FOR LÁPIDE).
+        """
+        if self._sequencial is not None:
+            return slot
+        return self._ids[slot]
+
+    def ids(self):
+        """
+        PERCORRE OS IDENTIFICADORES DOS VÉRTICES ATIVOS NA ORDEM DAS POSIÇÕES.
+        """
+        if self._sequencial is not None:
+            return iter(range(self._sequencial))
+        return (vertice for vertice in self._ids if vertice is not None)
+
+    def slotsAtivos(self):
+        """
+        PERCORRE OS PARES (POSIÇÃO, IDENTIFICADOR) DOS VÉRTICES ATIVOS.
+        """
+        if self._sequencial is not None:
+            return ((slot, slot) for slot in range(self._sequencial))
+        return (
+            (slot, vertice) for slot, vertice in enumerate(self._ids) if vertice is not None
+        )
+
+    def compacta(self) -> list:
+        """
+        ELIMINA AS LÁPIDES, MOVENDO OS VÉRTICES ATIVOS PARA POSIÇÕES CONTÍGUAS.
+        OS IDENTIFICADORES EXTERNOS NÃO MUDAM.
+
+        Returns:
+            list: PARA CADA POSIÇÃO ANTIGA, A NOVA POSIÇÃO (None PARA LÁPIDES).
+        """
+        if self._sequencial is not None:
+            return list(range(self._sequencial))
+
+        mapa = []
+        ids = []
+        for vertice in self._ids:
+            if vertice is None:
+                mapa.append(None)
+            else:
+                mapa.append(len(ids))
+                ids.append(vertice)
+
+        self._ids = ids
+        self._slots = {vertice: slot for slot, vertice in enumerate(ids)}
+        self._livres = []
+        return mapa
+
+    @classmethod
+    def deIds(cls, ids) -> "AlocadorVertices":
+        """
+        CRIA UM ALOCADOR CUJAS POSIÇÕES 0..N-1 CONTÊM OS IDENTIFICADORES INFORMADOS.
+
+        Args:
+            ids (sequence): IDENTIFICADOR DE CADA POSIÇÃO.
+        """
+        alocador = cls()
+        for vertice in ids:
+            alocador.aloca(vertice)
+        return alocador
@@ -1,71 +1,37 @@
-import requests
 import pandas as pd
 from loguru import logger
 
+try:
+    from app.utils.get_data.open_library import ClienteOpenLibrary, extrai_livro
+except ModuleNotFoundError:
+    from open_library import ClienteOpenLibrary, extrai_livro
 
-def get_livro(titulo):
-    titulo_formatado = titulo.replace(" ", "+")
 
-    url = f"https://openlibrary.org/search.json?title={titulo_formatado}"
+def get_livro(titulo, cliente=None):
+    cliente = cliente or ClienteOpenLibrary()
 
-    response = requests.get(url)
+    dados = cliente.busca(titulo)
 
-    if response.status_code == 200:
-        dados = response.json()
-
-        if "docs" in dados and len(dados["docs"]) > 0:
-            livro = dados["docs"][0]
-            titulo = livro.get("title", "Não disponível")
-
-            autor = ", ".join(livro.get("author_name", ["Não disponível"]))
-            logger.debug(f"AUTOR: {autor}")
-
-            ano = livro.get("first_publish_year", "Não disponível")
-            logger.debug(f"ANO: {ano}")
-
-            subject_key = ", ".join(livro.get("subject_key", ["Não disponível"]))
-            logger.debug(f"SUBJECT KEY: {subject_key}")
-
-            subject = ", ".join(livro.get("subject", ["Não disponível"]))
-            logger.debug(f"SUBJECT: {subject}")
-
-            subject_facet = ", ".join(livro.get("subject_facet", ["Não disponível"]))
-            logger.debug(f"SUBJECT FACET: {subject_facet}")
-
-            return {
-                "Título": titulo,
-                "Autor": autor,
-                "Ano de Publicação": ano,
-                "Subject": subject,
-                "Subject Key": subject_key,
-                "Subject Facet": subject_facet,
-            }
-        else:
-            return {
-                "Título": titulo,
-                "Autor": "Não encontrado",
-                "Ano de Publicação": "Não disponível",
-                "Subject": "Não disponível",
-                "Subject Key": "Não disponível",
-                "Subject Facet": "Não disponível",
-            }
+    if dados is not None:
+        return extrai_livro(titulo, dados)
     else:
-        logger.error(f"Erro na requisição: {response.status_code}")
         return None
 
 
-def processar_livros(arquivo_txt, arquivo_excel):
-    lista_livros = []
+def processar_livros(arquivo_txt, arquivo_excel, cliente=None):
+    cliente = cliente or ClienteOpenLibrary()
 
     with open(arquivo_txt, "r") as file:
-        for linha in file:
-            titulo = linha.strip()
-            if titulo:
-                logger.info(f"Buscando livro: {titulo}...")
-                dados_livro = get_livro(titulo)
-                if dados_livro:
-                    lista_livros.append(dados_livro)
-                    logger.success(f"Livro adicionado a lista: {titulo}")
+        titulos = [linha.strip() for linha in file if linha.strip()]
+
+    logger.info(f"Buscando {len(titulos)} livros com até {cliente.max_concorrencia} requisições simultâneas...")
+    respostas = cliente.busca_varios(titulos)
+
+    lista_livros = []
+    for titulo, dados in zip(titulos, respostas):
+        if dados is not None:
+            lista_livros.append(extrai_livro(titulo, dados))
+            logger.success(f"Livro adicionado a lista: {titulo}")
 
     df = pd.DataFrame(lista_livros)
 
@@ -73,6 +39,7 @@ def processar_livros(arquivo_txt, arquivo_excel):
     logger.success(f"Os dados foram salvos no arquivo {arquivo_excel}.")
 
 
-arquivo_txt = "app/data/livros.txt"
-arquivo_excel = "app/data/result_API.xlsx"
-processar_livros(arquivo_txt, arquivo_excel)
+if __name__ == "__main__":
+    arquivo_txt = "app/aux_data/livros.txt"
+    arquivo_excel = "app/aux_data/result_API.xlsx"
+    processar_livros(arquivo_txt, arquivo_excel)
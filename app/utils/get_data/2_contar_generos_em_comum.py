@@ -1,48 +1,43 @@
 import pandas as pd
 
-df = pd.read_excel("app/aux_data/result_API.xlsx")
+try:
+    from app.utils.get_data.similaridade import arestas_de_similaridade, normaliza_generos
+except ModuleNotFoundError:
+    from similaridade import arestas_de_similaridade, normaliza_generos
 
-lista_generos_aux = [generos.split(", ") for generos in df["Subject"].tolist()]
 
-lista_generos = []
-for i in lista_generos_aux:
-    lista_generos.append([genero.title() for genero in i])
-
-
-df_final = []
-
-
-def contar_generos_em_comum(lista_generos, df):
-    tamanho = len(lista_generos)
+def contar_generos_em_comum(lista_generos, titulos, arquivo_excel="app/aux_data/base_pesos.xlsx"):
+    """
+    Calcula, para cada par de livros com pelo menos um gênero em comum, o número de
+    gêneros compartilhados. Pares sem gênero em comum (peso 0) não são gerados.
+    """
     resultados = []
-
-    for i in range(tamanho):
-        titulo1 = df["Título"].iloc[i]
-        for j in range(0, tamanho):
-            if i == j:
-                continue
-            titulo2 = df["Título"].iloc[j]
-            generos_em_comum = set(lista_generos[i]) & set(lista_generos[j])
-            if not generos_em_comum:
-                generos_em_comum = ["-"]
-                peso = 0
-            else:
-                peso = len(generos_em_comum)
-            resultados.append((f"Lista {i} e Lista {j}", peso, generos_em_comum))
-            df_final.append(
-                {
-                    "Livro 1": titulo1,
-                    "Livro 2": titulo2,
-                    "Peso": peso,
-                    "Gêneros": ", ".join(generos_em_comum),
-                }
-            )
-    df = pd.DataFrame(df_final)
-    df.to_excel("app/aux_data/base_pesos.xlsx", index=False)
+    df_final = []
+
+    for i, j, peso in arestas_de_similaridade(lista_generos):
+        generos_em_comum = sorted(lista_generos[i] & lista_generos[j])
+        resultados.append((f"Lista {i} e Lista {j}", peso, generos_em_comum))
+        df_final.append(
+            {
+                "Livro 1": titulos[i],
+                "Livro 2": titulos[j],
+                "Peso": peso,
+                "Gêneros": ", ".join(generos_em_comum),
+            }
+        )
+
+    df = pd.DataFrame(df_final, columns=["Livro 1", "Livro 2", "Peso", "Gêneros"])
+    df.to_excel(arquivo_excel, index=False)
     return resultados
 
 
-resultados_comparacao = contar_generos_em_comum(lista_generos, df)
+if __name__ == "__main__":
+    df = pd.read_excel("app/aux_data/result_API.xlsx")
+
+    lista_generos = [normaliza_generos(generos) for generos in df["Subject"].tolist()]
+    titulos = df["Título"].tolist()
+
+    resultados_comparacao = contar_generos_em_comum(lista_generos, titulos)
 
-for comparacao, quantidade, generos in resultados_comparacao:
-    print(f"{comparacao}: {quantidade} gêneros em comum --> {generos}")
+    for comparacao, quantidade, generos in resultados_comparacao:
+        print(f"{comparacao}: {quantidade} gêneros em comum --> {generos}")
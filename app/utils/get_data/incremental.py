@@ -0,0 +1,133 @@
+"""
+Atualização incremental do grafo quando livros são acrescentados ou retirados de livros.txt.
+
+Em vez de executar de novo todos os scripts de get_data, compara a lista de títulos com
+os livros que já estão no grafo e aplica apenas a diferença:
+
+    - títulos novos são buscados no Open Library (os demais vêm do checkpoint/cache);
+    - os livros retirados da lista saem do grafo com `removeVertice`;
+    - cada livro novo entra com `insereVertice` e suas arestas são calculadas só contra o
+      índice invertido de gêneros dos livros existentes.
+
+O custo de acrescentar k livros é proporcional a k vezes as suas sobreposições de
+gêneros, e não ao catálogo inteiro.
+
+Uso:
+    python -m app.utils.get_data.incremental --titulos app/aux_data/livros.txt --grafo app/data/grafo.txt
+"""
+
+import argparse
+
+from loguru import logger
+
+from app.utils.classes.grafo_nd import TGrafoND
+from app.utils.classes.instrumentacao import silencioso
+from app.utils.get_data.open_library import ClienteOpenLibrary, normaliza_titulo
+from app.utils.get_data.pipeline import (
+    CHECKPOINT_METADADOS,
+    Checkpoint,
+    IndiceGeneros,
+    busca_metadados,
+    le_titulos,
+)
+from app.utils.get_data.similaridade import normaliza_generos
+
+
+def carrega_grafo(arquivo_grafo, armazenamento="esparso"):
+    """Carrega o grafo do arquivo TXT ou do formato binário."""
+    grafo = TGrafoND(armazenamento=armazenamento)
+    with open(arquivo_grafo, "rb") as f:
+        binario = f.read(4) == b"BKGR"
+    carregado = grafo.abreBinario(arquivo_grafo) if binario else grafo.leArquivo(arquivo_grafo, imprimir=False)
+    if not carregado:
+        raise ValueError(f"ERRO AO CARREGAR O GRAFO DO ARQUIVO {arquivo_grafo}.")
+    return grafo
+
+
+def atualiza_grafo(
+    arquivo_titulos,
+    arquivo_grafo,
+    cliente=None,
+    arquivo_checkpoint=CHECKPOINT_METADADOS,
+    arquivo_saida=None,
+):
+    """
+    Aplica ao grafo salvo as inclusões e remoções de livros da lista de títulos.
+
+    Returns:
+        tuple: (GRAFO ATUALIZADO, VÉRTICES INSERIDOS, VÉRTICES REMOVIDOS).
+    """
+    grafo = carrega_grafo(arquivo_grafo)
+    vertice_por_titulo = {normaliza_titulo(nome): vertice for vertice, nome in grafo.livros.items()}
+
+    # METADADOS DE TODOS OS TÍTULOS DA LISTA: OS JÁ CONHECIDOS VÊM DO CHECKPOINT,
+    # SÓ OS TÍTULOS NUNCA VISTOS GERAM REQUISIÇÕES
+    checkpoint = Checkpoint(arquivo_checkpoint) if arquivo_checkpoint else None
+    titulos = list(le_titulos(arquivo_titulos))
+    falhas = []
+    registros = list(busca_metadados(titulos, cliente or ClienteOpenLibrary(), checkpoint, sem_metadados=falhas))
+
+    indice = IndiceGeneros()
+    mantidos = set()
+    novos = []
+    for registro in registros:
+        chave = normaliza_titulo(registro["Título"])
+        vertice = vertice_por_titulo.get(chave)
+        if vertice is None:
+            novos.append(registro)
+            vertice_por_titulo[chave] = None  # EVITA INSERIR O MESMO LIVRO DUAS VEZES
+        elif vertice not in mantidos:
+            mantidos.add(vertice)
+            indice.adiciona(vertice, normaliza_generos(registro["Subject"]))
+
+    # SÓ SAEM DO GRAFO OS LIVROS QUE NÃO ESTÃO MAIS NA LISTA. O NOME DO VÉRTICE É O TÍTULO
+    # DEVOLVIDO PELO OPEN LIBRARY, QUE PODE DIFERIR DO TÍTULO DA LISTA: SE A BUSCA DE ALGUM
+    # TÍTULO FALHOU (EX.: OPEN LIBRARY FORA DO AR), NÃO HÁ COMO SABER A QUAL VÉRTICE ELE
+    # CORRESPONDE, E AS REMOÇÕES FICAM PARA A PRÓXIMA EXECUÇÃO EM VEZ DE APAGAR LIVROS
+    # QUE CONTINUAM NA LISTA
+    titulos_lista = {normaliza_titulo(titulo) for titulo in titulos}
+    removidos = [
+        vertice
+        for chave, vertice in vertice_por_titulo.items()
+        if vertice is not None and vertice not in mantidos and chave not in titulos_lista
+    ]
+    if falhas:
+        logger.warning(
+            f"{len(falhas)} TÍTULOS DA LISTA SEM METADADOS"
+            + (f"; {len(removidos)} REMOÇÕES ADIADAS PARA A PRÓXIMA EXECUÇÃO." if removidos else ".")
+        )
+        removidos = []
+
+    inseridos = []
+    with silencioso():  # SEM LOG POR VÉRTICE; O RESUMO É EXIBIDO AO FINAL
+        for vertice in removidos:
+            grafo.removeVertice(vertice)
+
+        for registro in novos:
+            generos = normaliza_generos(registro["Subject"])
+            vertice = grafo.insereVertice(registro["Título"])
+            grafo._insereArestasEmLote(
+                (vertice, vizinho, peso) for vizinho, peso in indice.similares(generos).items()
+            )
+            indice.adiciona(vertice, generos)
+            inseridos.append(vertice)
+
+    logger.success(f"GRAFO ATUALIZADO: {len(inseridos)} LIVROS INSERIDOS E {len(removidos)} REMOVIDOS.")
+
+    arquivo_saida = arquivo_saida or arquivo_grafo
+    gravado = grafo.gravarGrafo(arquivo_saida) if arquivo_saida.endswith(".txt") else grafo.gravarBinario(arquivo_saida)
+    if not gravado:
+        raise ValueError(f"ERRO AO GRAVAR O GRAFO NO ARQUIVO {arquivo_saida}.")
+
+    return grafo, inseridos, removidos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titulos", default="app/aux_data/livros.txt")
+    parser.add_argument("--grafo", default="app/data/grafo.txt")
+    parser.add_argument("--saida", default=None, help="padrão: sobrescreve o arquivo do grafo")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_METADADOS)
+    args = parser.parse_args()
+
+    atualiza_grafo(args.titulos, args.grafo, arquivo_checkpoint=args.checkpoint, arquivo_saida=args.saida)
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+URL_BASE = "https://openlibrary.org"
+DIRETORIO_CACHE = "app/aux_data/cache_open_library"
+
+# STATUS HTTP QUE INDICAM FALHA TEMPORÁRIA (VALE A PENA TENTAR DE NOVO)
+STATUS_REPETIVEIS = {429, 500, 502, 503, 504}
+
+
+def normaliza_titulo(titulo):
+    """Normaliza o título para uso como chave: sem acentos, minúsculo e com espaços simples."""
+    titulo = unicodedata.normalize("NFKD", titulo)
+    titulo = "".join(c for c in titulo if not unicodedata.combining(c))
+    return re.sub(r"\s+", " ", titulo).strip().casefold()
+
+
+def extrai_livro(titulo, dados):
+    """Monta o registro do livro a partir da resposta JSON da busca do Open Library."""
+    if "docs" in dados and len(dados["docs"]) > 0:
+        livro = dados["docs"][0]
+        titulo = livro.get("title", "Não disponível")
+
+        autor = ", ".join(livro.get("author_name", ["Não disponível"]))
+        logger.debug(f"AUTOR: {autor}")
+
+        ano = livro.get("first_publish_year", "Não disponível")
+        logger.debug(f"ANO: {ano}")
+
+        subject_key = ", ".join(livro.get("subject_key", ["Não disponível"]))
+        logger.debug(f"SUBJECT KEY: {subject_key}")
+
+        subject = ", ".join(livro.get("subject", ["Não disponível"]))
+        logger.debug(f"SUBJECT: {subject}")
+
+        subject_facet = ", ".join(livro.get("subject_facet", ["Não disponível"]))
+        logger.debug(f"SUBJECT FACET: {subject_facet}")
+
+        return {
+            "Título": titulo,
+            "Autor": autor,
+            "Ano de Publicação": ano,
+            "Subject": subject,
+            "Subject Key": subject_key,
+            "Subject Facet": subject_facet,
+        }
+    else:
+        return {
+            "Título": titulo,
+            "Autor": "Não encontrado",
+            "Ano de Publicação": "Não disponível",
+            "Subject": "Não disponível",
+            "Subject Key": "Não disponível",
+            "Subject Facet": "Não disponível",
+        }
+
+
+class LimitadorTaxa:
+    """Garante um intervalo mínimo entre requisições, compartilhado entre threads."""
+
+    def __init__(self, requisicoes_por_segundo):
+        self.intervalo = 1 / requisicoes_por_segundo if requisicoes_por_segundo else 0
+        self._proxima = 0.0
+        self._trava = threading.Lock()
+
+    def aguarda(self):
+        with self._trava:
+            agora = time.monotonic()
+            espera = self._proxima - agora
+            self._proxima = max(agora, self._proxima) + self.intervalo
+        if espera > 0:
+            time.sleep(espera)
+
+
+class CacheDisco:
+    """Cache persistente das respostas, um arquivo JSON por título normalizado."""
+
+    def __init__(self, diretorio):
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+
+    def _caminho(self, chave):
+        return self.diretorio / f"{hashlib.sha1(chave.encode('utf-8')).hexdigest()}.json"
+
+    def le(self, chave):
+        try:
+            with open(self._caminho(chave), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def grava(self, chave, dados):
+        # GRAVA EM ARQUIVO TEMPORÁRIO E RENOMEIA, PARA NUNCA DEIXAR UMA ENTRADA PELA METADE
+        caminho = self._caminho(chave)
+        temporario = caminho.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(dados, f, ensure_ascii=False)
+        os.replace(temporario, caminho)
+
+
+class ClienteOpenLibrary:
+    """
+    Cliente da busca do Open Library com sessão HTTP reaproveitada, concorrência
+    limitada, limite de requisições por segundo, novas tentativas com espera
+    exponencial e cache em disco das respostas.
+    """
+
+    def __init__(
+        self,
+        url_base=URL_BASE,
+        diretorio_cache=DIRETORIO_CACHE,
+        max_concorrencia=8,
+        requisicoes_por_segundo=5,
+        tentativas=4,
+        espera_inicial=0.5,
+        timeout=10,
+    ):
+        self.url_base = url_base.rstrip("/")
+        self.max_concorrencia = max_concorrencia
+        self.tentativas = tentativas
+        self.espera_inicial = espera_inicial
+        self.timeout = timeout
+        self.cache = CacheDisco(diretorio_cache) if diretorio_cache else None
+        self.limitador = LimitadorTaxa(requisicoes_por_segundo)
+
+        self.sessao = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=max_concorrencia)
+        self.sessao.mount("http://", adaptador)
+        self.sessao.mount("https://", adaptador)
+
+    def _requisita(self, titulo):
+        url = f"{self.url_base}/search.json"
+        for tentativa in range(self.tentativas):
+            self.limitador.aguarda()
+            try:
+                response = self.sessao.get(url, params={"title": titulo}, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as erro:
+                logger.warning(f"Falha na requisição de '{titulo}' ({erro}), tentativa {tentativa + 1}.")
+            else:
+                if response.status_code == 200:
+                    try:
+                        return response.json()
+                    except ValueError as erro:  # requests.JSONDecodeError TAMBÉM É ValueError
+                        # CORPO QUE NÃO É JSON (EX.: PÁGINA DE ERRO DE UM PROXY) É FALHA TEMPORÁRIA,
+                        # E NÃO PODE INTERROMPER O LOTE INTEIRO DE `busca_varios`
+                        logger.warning(f"Resposta não JSON para '{titulo}' ({erro}), tentativa {tentativa + 1}.")
+                elif response.status_code not in STATUS_REPETIVEIS:
+                    logger.error(f"Erro na requisição: {response.status_code}")
+                    return None
+                else:
+                    logger.warning(
+                        f"Erro temporário {response.status_code} em '{titulo}', tentativa {tentativa + 1}."
+                    )
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        time.sleep(int(retry_after))
+                        continue
+
+            time.sleep(self.espera_inicial * 2**tentativa)
+
+        logger.error(f"Desistindo de '{titulo}' após {self.tentativas} tentativas.")
+        return None
+
+    def busca(self, titulo):
+        """Retorna a resposta JSON da busca pelo título, usando o cache quando possível."""
+        chave = normaliza_titulo(titulo)
+        if self.cache is not None:
+            dados = self.cache.le(chave)
+            if dados is not None:
+                return dados
+
+        dados = self._requisita(titulo)
+        if dados is not None and self.cache is not None:
+            self.cache.grava(chave, dados)
+        return dados
+
+    def busca_varios(self, titulos):
+        """Busca vários títulos em paralelo. Retorna as respostas na mesma ordem dos títulos."""
+        with ThreadPoolExecutor(max_workers=self.max_concorrencia) as executor:
+            return list(executor.map(self.busca, titulos))
+
+    def fecha(self):
+        self.sessao.close()
@@ -0,0 +1,208 @@
+"""
+Pipeline único, em fluxo, da lista de títulos até o grafo de livros.
+
+Substitui a sequência 1_busca_livro.py -> result_API.xlsx -> 2_contar_generos_em_comum.py
+-> base_pesos.xlsx -> 3_create_grafo_txt_from_excel.py: os registros passam de um
+estágio para o outro como geradores, sem planilhas intermediárias.
+
+    títulos -> metadados (Open Library) -> gêneros -> eventos de vértices/arestas -> TGrafoND
+
+Cada estágio é uma função que recebe um iterável e devolve outro, então estágios
+podem ser trocados ou adicionados (ver `executa_pipeline`). A busca de metadados,
+a única etapa cara, grava um checkpoint binário (registros pickle acrescentados ao
+arquivo); numa nova execução os títulos já buscados são lidos do checkpoint.
+
+Uso:
+    python -m app.utils.get_data.pipeline --titulos app/aux_data/livros.txt --saida app/data/grafo.txt
+"""
+
+import argparse
+import pickle
+
+from collections import Counter, defaultdict
+from itertools import islice
+from pathlib import Path
+
+from loguru import logger
+
+from app.utils.classes.grafo_nd import TAMANHO_LOTE_ARESTAS, TGrafoND
+from app.utils.classes.instrumentacao import silencioso
+from app.utils.get_data.open_library import ClienteOpenLibrary, extrai_livro, normaliza_titulo
+from app.utils.get_data.similaridade import normaliza_generos
+
+CHECKPOINT_METADADOS = "app/aux_data/metadados.ckpt"
+TAMANHO_LOTE_BUSCA = 64
+
+
+class Checkpoint:
+    """Arquivo binário append-only de pares (chave, valor), usado para retomar estágios."""
+
+    def __init__(self, arquivo):
+        self.arquivo = Path(arquivo)
+
+    def carrega(self):
+        dados = {}
+        if not self.arquivo.exists():
+            return dados
+        with open(self.arquivo, "rb") as f:
+            while True:
+                try:
+                    chave, valor = pickle.load(f)
+                except EOFError:
+                    break
+                except pickle.UnpicklingError:
+                    # ÚLTIMO REGISTRO INCOMPLETO (EXECUÇÃO INTERROMPIDA NO MEIO DA GRAVAÇÃO)
+                    logger.warning(f"Checkpoint {self.arquivo} truncado, ignorando o final.")
+                    break
+                dados[chave] = valor
+        return dados
+
+    def registra(self, registros):
+        self.arquivo.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.arquivo, "ab") as f:
+            for chave, valor in registros:
+                pickle.dump((chave, valor), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def le_titulos(arquivo_txt):
+    """Estágio de entrada: um título por linha, ignorando linhas vazias."""
+    with open(arquivo_txt, "r") as file:
+        for linha in file:
+            titulo = linha.strip()
+            if titulo:
+                yield titulo
+
+
+def busca_metadados(titulos, cliente=None, checkpoint=None, tamanho_lote=TAMANHO_LOTE_BUSCA, sem_metadados=None):
+    """
+    Estágio de metadados: busca cada título no Open Library (em lotes paralelos) e gera
+    o registro do livro. Títulos presentes no checkpoint não são buscados de novo.
+    Títulos cuja busca falhou não geram registro; se `sem_metadados` (lista) for
+    informado, eles são acrescentados a ela.
+    """
+    cliente = cliente or ClienteOpenLibrary()
+    salvos = checkpoint.carrega() if checkpoint else {}
+    if salvos:
+        logger.info(f"Retomando a partir do checkpoint com {len(salvos)} livros.")
+
+    titulos = iter(titulos)
+    while True:
+        lote = list(islice(titulos, tamanho_lote))
+        if not lote:
+            return
+
+        pendentes = [titulo for titulo in lote if normaliza_titulo(titulo) not in salvos]
+        novos = []
+        for titulo, dados in zip(pendentes, cliente.busca_varios(pendentes)):
+            if dados is not None:
+                registro = extrai_livro(titulo, dados)
+                salvos[normaliza_titulo(titulo)] = registro
+                novos.append((normaliza_titulo(titulo), registro))
+        if checkpoint and novos:
+            checkpoint.registra(novos)
+
+        for titulo in lote:
+            registro = salvos.get(normaliza_titulo(titulo))
+            if registro is not None:
+                yield registro
+            elif sem_metadados is not None:
+                sem_metadados.append(titulo)
+
+
+def extrai_generos(registros):
+    """Estágio de gêneros: acrescenta ao registro o conjunto de gêneros normalizados."""
+    for registro in registros:
+        yield {**registro, "Gêneros": normaliza_generos(registro["Subject"])}
+
+
+class IndiceGeneros:
+    """
+    Índice invertido gênero -> livros, alimentado um livro por vez. Ao receber um livro,
+    devolve os pesos (gêneros em comum) com os livros já indexados, visitando apenas os
+    que compartilham algum gênero.
+    """
+
+    def __init__(self):
+        self.livros = defaultdict(list)
+
+    def similares(self, generos):
+        pesos = Counter()
+        for genero in generos:
+            pesos.update(self.livros.get(genero, ()))
+        return pesos
+
+    def adiciona(self, livro, generos):
+        for genero in generos:
+            self.livros[genero].append(livro)
+
+    def remove(self, livro, generos):
+        for genero in generos:
+            if livro in self.livros.get(genero, ()):
+                self.livros[genero].remove(livro)
+
+
+def gera_arestas(registros, indice=None):
+    """
+    Estágio de similaridade: para cada livro gera um evento ("vertice", n, título) e,
+    em seguida, um evento ("aresta", i, n, peso) para cada livro anterior com gêneros
+    em comum. Tudo em uma passada, sem comparar todos os pares.
+    """
+    indice = indice or IndiceGeneros()
+    for numero, registro in enumerate(registros):
+        yield ("vertice", numero, registro["Título"])
+        for anterior, peso in sorted(indice.similares(registro["Gêneros"]).items()):
+            yield ("aresta", anterior, numero, peso)
+        indice.adiciona(numero, registro["Gêneros"])
+
+
+def para_grafo(eventos, armazenamento="esparso"):
+    """Estágio de saída: aplica os eventos de vértices e arestas em um novo TGrafoND."""
+    grafo = TGrafoND(armazenamento=armazenamento)
+    numeros = {}
+    arestas = []
+    with silencioso():  # SEM LOG POR VÉRTICE INSERIDO
+        for evento in eventos:
+            if evento[0] == "vertice":
+                numeros[evento[1]] = grafo.insereVertice(evento[2])
+            else:
+                _, origem, destino, peso = evento
+                arestas.append((numeros[origem], numeros[destino], peso))
+                if len(arestas) >= TAMANHO_LOTE_ARESTAS:
+                    grafo._insereArestasEmLote(arestas)
+                    arestas = []
+        grafo._insereArestasEmLote(arestas)
+    return grafo
+
+
+def executa_pipeline(fonte, *estagios):
+    """Encadeia os estágios: cada um recebe a saída (iterável) do anterior."""
+    fluxo = fonte
+    for estagio in estagios:
+        fluxo = estagio(fluxo)
+    return fluxo
+
+
+def gera_grafo(arquivo_titulos, cliente=None, arquivo_checkpoint=CHECKPOINT_METADADOS, armazenamento="esparso"):
+    """Executa o pipeline padrão: títulos -> metadados -> gêneros -> arestas -> TGrafoND."""
+    checkpoint = Checkpoint(arquivo_checkpoint) if arquivo_checkpoint else None
+    return executa_pipeline(
+        le_titulos(arquivo_titulos),
+        lambda titulos: busca_metadados(titulos, cliente, checkpoint),
+        extrai_generos,
+        gera_arestas,
+        lambda eventos: para_grafo(eventos, armazenamento),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titulos", default="app/aux_data/livros.txt")
+    parser.add_argument("--saida", default="app/data/grafo.txt")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_METADADOS)
+    parser.add_argument("--binario", action="store_true", help="grava no formato binário")
+    args = parser.parse_args()
+
+    grafo = gera_grafo(args.titulos, arquivo_checkpoint=args.checkpoint)
+    gravado = grafo.gravarBinario(args.saida) if args.binario else grafo.gravarGrafo(args.saida)
+    if not gravado:
+        raise SystemExit(f"ERRO AO GRAVAR O GRAFO NO ARQUIVO {args.saida}.")
@@ -0,0 +1,76 @@
+from collections import Counter, defaultdict
+from itertools import combinations
+
+try:
+    from scipy import sparse
+except ImportError:  # O PRODUTO DE MATRIZES ESPARSAS É OPCIONAL
+    sparse = None
+
+# VALOR USADO PELA BUSCA QUANDO O LIVRO NÃO TEM GÊNEROS (NÃO É UM GÊNERO DE VERDADE)
+SEM_GENERO = "Não Disponível"
+
+
+def normaliza_generos(subject):
+    """Converte o texto da coluna "Subject" em um conjunto de gêneros padronizados."""
+    generos = {genero.strip().title() for genero in str(subject).split(", ")}
+    generos.discard("")
+    generos.discard(SEM_GENERO)
+    return generos
+
+
+def indice_invertido(lista_generos):
+    """Mapeia cada gênero para a lista (ordenada) dos livros que o possuem."""
+    indice = defaultdict(list)
+    for livro, generos in enumerate(lista_generos):
+        for genero in set(generos):
+            indice[genero].append(livro)
+    return indice
+
+
+def pesos_por_indice(lista_generos):
+    """
+    Conta os gêneros em comum de cada par de livros (i < j) percorrendo o índice
+    invertido. Só os pares que compartilham algum gênero são visitados, então o
+    custo é proporcional às sobreposições reais e não a n².
+    """
+    pesos = Counter()
+    for livros in indice_invertido(lista_generos).values():
+        pesos.update(combinations(livros, 2))
+    return pesos
+
+
+def pesos_por_matriz_esparsa(lista_generos):
+    """
+    Mesma contagem de `pesos_por_indice`, como o produto B·Bᵀ da matriz esparsa
+    livro x gênero (exige scipy).
+    """
+    if sparse is None:
+        raise ImportError("pesos_por_matriz_esparsa exige o pacote scipy instalado.")
+
+    colunas = {}
+    linhas, indices = [], []
+    for livro, generos in enumerate(lista_generos):
+        for genero in set(generos):
+            linhas.append(livro)
+            indices.append(colunas.setdefault(genero, len(colunas)))
+
+    matriz = sparse.csr_matrix(
+        ([1] * len(linhas), (linhas, indices)), shape=(len(lista_generos), len(colunas))
+    )
+    coocorrencias = sparse.triu(matriz @ matriz.T, k=1).tocoo()
+    return Counter(
+        {(int(i), int(j)): int(peso) for i, j, peso in zip(coocorrencias.row, coocorrencias.col, coocorrencias.data)}
+    )
+
+
+def arestas_de_similaridade(lista_generos, usar_matriz_esparsa=False):
+    """
+    Gera as arestas (i, j, peso) com peso > 0, uma vez por par (i < j), em ordem.
+    """
+    if usar_matriz_esparsa:
+        pesos = pesos_por_matriz_esparsa(lista_generos)
+    else:
+        pesos = pesos_por_indice(lista_generos)
+
+    for (i, j), peso in sorted(pesos.items()):
+        yield i, j, peso
@@ -0,0 +1,46 @@
+"""
+Testes dos armazenamentos em matriz: crescimento da capacidade ao inserir vértices.
+
+Uso:
+    python -m pytest tests
+"""
+
+import unittest
+
+from app.utils.classes.armazenamento import FATOR_CRESCIMENTO, cria_armazenamento, np
+
+
+def bytes_matriz(armazenamento) -> int:
+    if armazenamento.nome == "numpy":
+        return armazenamento._matriz.nbytes
+    return armazenamento._celulas.itemsize * len(armazenamento._celulas)
+
+
+class TestCrescimentoMatriz(unittest.TestCase):
+    def backends(self):
+        # O BACKEND NUMPY SÓ É TESTADO COM O PACOTE INSTALADO
+        return ["denso"] if np is None else ["denso", "numpy"]
+
+    def test_inserir_um_vertice_nao_quadruplica_a_matriz(self):
+        for nome in self.backends():
+            armazenamento = cria_armazenamento(nome, 1000, "uint8")
+            antes = bytes_matriz(armazenamento)
+            armazenamento.adicionaVertice()
+            self.assertLessEqual(bytes_matriz(armazenamento), antes * FATOR_CRESCIMENTO**2 + 1, nome)
+
+    def test_pesos_preservados_ao_crescer(self):
+        for nome in self.backends():
+            armazenamento = cria_armazenamento(nome, 0, "uint8")
+            for vertice in range(50):
+                armazenamento.adicionaVertice()
+                if vertice:
+                    armazenamento.definePeso(vertice - 1, vertice, vertice % 200 + 1)
+            self.assertEqual(len(armazenamento), 50)
+            self.assertEqual(
+                sorted(armazenamento.arestas()), [(v - 1, v, v % 200 + 1) for v in range(1, 50)], nome
+            )
+            self.assertEqual(armazenamento.grau(0), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Testes dos códigos de saída do modo de linha de comando: falhas ao carregar ou
+gravar o grafo resultam em uma linha JSON com "erro" e código diferente de zero.
+
+Uso:
+    python -m pytest tests
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+GRAFO_TXT = '2\n3\n0 "Dracula"\n1 "Emma"\n2 "Ulysses"\n2\n0 1 3\n1 2 5\n'
+
+
+def executa_cli(*argumentos):
+    """EXECUTA `python -m app.cli` E DEVOLVE O CÓDIGO DE SAÍDA E AS LINHAS JSON."""
+    resultado = subprocess.run(
+        [sys.executable, "-m", "app.cli", *map(str, argumentos)],
+        cwd=RAIZ,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    return resultado.returncode, [json.loads(linha) for linha in resultado.stdout.splitlines()]
+
+
+class TestCodigosDeSaida(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = Path(self.diretorio.name)
+        self.grafo = self.caminho / "grafo.txt"
+        self.grafo.write_text(GRAFO_TXT)
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_load_valido(self):
+        codigo, saida = executa_cli("load", self.grafo)
+        self.assertEqual(codigo, 0)
+        self.assertEqual(saida[0]["resultado"]["vertices"], 3)
+
+    def test_load_com_cabecalho_invalido(self):
+        invalido = self.caminho / "invalido.txt"
+        invalido.write_text("2\nmuitos\n")
+        codigo, saida = executa_cli("load", invalido)
+        self.assertEqual(codigo, 1)
+        self.assertIn("erro", saida[0])
+        self.assertNotIn("resultado", saida[0])
+
+    def test_load_de_arquivo_inexistente(self):
+        codigo, saida = executa_cli("load", self.caminho / "nao_existe.txt")
+        self.assertEqual(codigo, 1)
+        self.assertIn("erro", saida[0])
+
+    def test_load_com_peso_fora_do_tipo(self):
+        codigo, saida = executa_cli("--tipo-peso", "uint8", "load", self.grafo)
+        self.assertEqual(codigo, 0)
+        self.grafo.write_text(GRAFO_TXT.replace("1 2 5", "1 2 300"))
+        codigo, saida = executa_cli("--tipo-peso", "uint8", "load", self.grafo)
+        self.assertEqual(codigo, 1)
+        self.assertIn("300", saida[0]["erro"])
+
+    def test_convert_para_diretorio_inexistente(self):
+        for saida_convert in ("nao_existe/grafo.bkg", "nao_existe/grafo.txt"):
+            codigo, saida = executa_cli("convert", self.grafo, self.caminho / saida_convert)
+            self.assertEqual(codigo, 1)
+            self.assertIn("erro", saida[0])
+
+    def test_convert_ida_e_volta(self):
+        binario = self.caminho / "grafo.bkg"
+        codigo, _ = executa_cli("convert", self.grafo, binario)
+        self.assertEqual(codigo, 0)
+        codigo, saida = executa_cli("load", binario)
+        self.assertEqual(codigo, 0)
+        self.assertEqual(saida[0]["resultado"]["vertices"], 3)
+
+    def test_batch_com_save_invalido(self):
+        operacoes = self.caminho / "operacoes.txt"
+        operacoes.write_text(f"save {self.caminho / 'nao_existe' / 'grafo.txt'}\ncomponents\n")
+        codigo, saida = executa_cli("batch", operacoes, "--grafo", self.grafo)
+        self.assertEqual(codigo, 1)
+        self.assertIn("erro", saida[0])
+        self.assertIn("resultado", saida[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Testes do acesso concorrente à TGrafoND: a trava de leitores e escritor e uma
+rodada curta do teste de estresse (ver `app/utils/benchmarks/estresse.py`),
+com consultas e alterações simultâneas e a conferência dos índices
+incrementais contra um grafo reconstruído do zero.
+
+Uso:
+    python -m pytest tests
+"""
+
+import tempfile
+import threading
+import unittest
+
+from pathlib import Path
+
+from loguru import logger
+
+from app.utils.benchmarks.estresse import cria_grafo, rodada, verifica_indices
+from app.utils.classes.concorrencia import TravaLeituraEscrita
+from app.utils.classes.grafo_nd import TGrafoND
+from app.utils.classes.instrumentacao import define_silencioso
+
+ESPERA = 5  # SEGUNDOS; SÓ É ATINGIDA SE A TRAVA FICAR BLOQUEADA
+
+
+class TestTravaLeituraEscrita(unittest.TestCase):
+    def setUp(self):
+        self.trava = TravaLeituraEscrita()
+
+    def em_thread(self, funcao):
+        thread = threading.Thread(target=funcao, daemon=True)
+        thread.start()
+        return thread
+
+    def test_leitores_simultaneos(self):
+        # OS DOIS LEITORES SÓ PASSAM DA BARREIRA SE ESTIVEREM DENTRO DA TRAVA AO MESMO TEMPO
+        barreira = threading.Barrier(2, timeout=ESPERA)
+
+        def le():
+            with self.trava.leitura():
+                barreira.wait()
+
+        threads = [self.em_thread(le) for _ in range(2)]
+        for thread in threads:
+            thread.join(ESPERA)
+        self.assertFalse(barreira.broken)
+
+    def test_escritor_espera_os_leitores(self):
+        eventos = []
+        lendo, liberar = threading.Event(), threading.Event()
+
+        def le():
+            with self.trava.leitura():
+                lendo.set()
+                liberar.wait(ESPERA)
+                eventos.append("fim da leitura")
+
+        def escreve():
+            with self.trava.escrita():
+                eventos.append("escrita")
+
+        leitor = self.em_thread(le)
+        lendo.wait(ESPERA)
+        escritor = self.em_thread(escreve)
+        escritor.join(0.2)
+        self.assertTrue(escritor.is_alive())
+        liberar.set()
+        leitor.join(ESPERA)
+        escritor.join(ESPERA)
+        self.assertEqual(eventos, ["fim da leitura", "escrita"])
+
+    def test_novos_leitores_esperam_o_escritor_na_fila(self):
+        eventos = []
+        lendo, liberar = threading.Event(), threading.Event()
+
+        def le_primeiro():
+            with self.trava.leitura():
+                lendo.set()
+                liberar.wait(ESPERA)
+
+        def escreve():
+            with self.trava.escrita():
+                eventos.append("escrita")
+
+        def le_depois():
+            with self.trava.leitura():
+                eventos.append("leitura")
+
+        primeiro = self.em_thread(le_primeiro)
+        lendo.wait(ESPERA)
+        escritor = self.em_thread(escreve)
+        while not self.trava._escritores_esperando:
+            escritor.join(0.01)
+        segundo = self.em_thread(le_depois)
+        segundo.join(0.2)
+        self.assertTrue(segundo.is_alive())
+        liberar.set()
+        for thread in (primeiro, escritor, segundo):
+            thread.join(ESPERA)
+        self.assertEqual(eventos, ["escrita", "leitura"])
+
+    def test_reentrancia(self):
+        with self.trava.escrita():
+            with self.trava.escrita(), self.trava.leitura():
+                pass
+        with self.trava.leitura():
+            with self.trava.leitura():
+                pass
+            with self.assertRaises(RuntimeError):
+                self.trava.adquireEscrita()
+        # A TRAVA FICA LIVRE DEPOIS DAS REENTRADAS
+        self.assertEqual((self.trava._leitores, self.trava._escritor, self.trava._leituras), (0, None, {}))
+
+
+class TestGrafoConcorrente(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logger.disable("app")
+        define_silencioso(True)
+
+    @classmethod
+    def tearDownClass(cls):
+        define_silencioso(False)
+        logger.enable("app")
+
+    def test_consultas_durante_alteracoes_mantem_os_indices(self):
+        grafo = cria_grafo(500)
+        # CRIA OS ÍNDICES INCREMENTAIS ANTES DAS ALTERAÇÕES, PARA QUE SEJAM ATUALIZADOS POR ELAS
+        grafo.recomenda(0, k=5)
+        grafo.tipo_conexidade()
+        vazao, alteracoes, erros = rodada(grafo, threads=2, segundos=1.0, com_escritor=True)
+        self.assertEqual(erros, [])
+        self.assertGreater(vazao, 0)
+        self.assertGreater(alteracoes, 0)
+        self.assertEqual(verifica_indices(grafo), [])
+
+    def test_gravacoes_simultaneas_no_mesmo_arquivo(self):
+        grafo = cria_grafo(300)
+        with tempfile.TemporaryDirectory() as diretorio:
+            arquivo = str(Path(diretorio) / "grafo.txt")
+            resultados = []
+            threads = [
+                threading.Thread(target=lambda: resultados.append(grafo.gravarGrafo(arquivo))) for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(ESPERA * 6)
+            self.assertEqual(resultados, [True] * 4)
+
+            lido = TGrafoND(armazenamento="esparso")
+            self.assertTrue(lido.leArquivo(arquivo, imprimir=False))
+            self.assertEqual(sorted(lido.grafo.arestas()), sorted(grafo.grafo.arestas()))
+
+
+if __name__ == "__main__":
+    unittest.main()
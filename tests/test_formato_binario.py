@@ -0,0 +1,124 @@
+"""
+Testes da gravação do grafo (binário e TXT): o arquivo é substituído de forma
+atômica, inclusive quando é o próprio arquivo mapeado em memória por `abreBinario`.
+
+Uso:
+    python -m pytest tests
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from loguru import logger
+
+from app.utils.classes.grafo_nd import TGrafoND
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+# UMA THREAD PERCORRE A ADJACÊNCIA MAPEADA ENQUANTO A PRINCIPAL GRAVA POR CIMA DO MESMO
+# ARQUIVO. EXECUTADO EM OUTRO PROCESSO: SE O ARQUIVO FOR REESCRITO NO LUGAR, O PROCESSO
+# MORRE COM SIGBUS, O QUE DERRUBARIA O PRÓPRIO PYTEST
+CENARIO_LEITOR = """
+import random, sys, threading
+from loguru import logger
+logger.remove()
+from app.utils.classes.grafo_nd import TGrafoND
+from app.utils.classes.instrumentacao import silencioso
+
+arquivo = sys.argv[1]
+grafo = TGrafoND(armazenamento="esparso")
+aleatorio = random.Random(1)
+with silencioso():
+    for i in range(20000):
+        grafo.insereVertice(f"Livro {i}")
+    grafo._insereArestasEmLote(
+        (i, aleatorio.randrange(i), aleatorio.randint(1, 9)) for i in range(1, 20000) for _ in range(3)
+    )
+grafo.gravarBinario(arquivo)
+
+mapeado = TGrafoND()
+mapeado.abreBinario(arquivo)
+esperado = sum(peso for v in range(mapeado.vertices) for _, peso in mapeado.grafo.vizinhos(v))
+parar, somas = threading.Event(), []
+
+def le():
+    while not parar.is_set():
+        somas.append(sum(peso for v in range(mapeado.vertices) for _, peso in mapeado.grafo.vizinhos(v)))
+
+leitor = threading.Thread(target=le)
+leitor.start()
+for _ in range(5):
+    mapeado.gravarBinario(arquivo)
+parar.set()
+leitor.join()
+assert somas and all(soma == esperado for soma in somas), "LEITURA INCONSISTENTE"
+print("ok")
+"""
+
+
+def grafo_exemplo() -> TGrafoND:
+    grafo = TGrafoND(armazenamento="esparso")
+    for titulo in ("Dracula", "Emma", "Frankenstein", "Ulysses"):
+        grafo.insereVertice(titulo)
+    grafo.insereAresta(0, 1, 3)
+    grafo.insereAresta(1, 2, 300)
+    grafo.insereAresta(2, 3, 1)
+    grafo.removeVertice(3)
+    return grafo
+
+
+def arestas(grafo: TGrafoND) -> set:
+    vertice = grafo._alocador.vertice
+    return {(vertice(i), vertice(j), peso) for i, j, peso in grafo.grafo.arestas()}
+
+
+class TestGravacao(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logger.disable("app")
+
+    @classmethod
+    def tearDownClass(cls):
+        logger.enable("app")
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = Path(self.diretorio.name)
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_gravar_sobre_o_arquivo_mapeado_com_leitor_ativo(self):
+        resultado = subprocess.run(
+            [sys.executable, "-c", CENARIO_LEITOR, str(self.caminho / "grafo.bkg")],
+            cwd=RAIZ,
+            capture_output=True,
+            text=True,
+            timeout=600,
+        )
+        self.assertEqual(resultado.returncode, 0, resultado.stderr[-2000:])
+        self.assertEqual(resultado.stdout.strip(), "ok")
+
+    def test_ida_e_volta_binario_e_txt_sem_temporarios(self):
+        grafo = grafo_exemplo()
+        for nome, grava, le in (
+            ("grafo.bkg", TGrafoND.gravarBinario, TGrafoND.abreBinario),
+            ("grafo.txt", TGrafoND.gravarGrafo, lambda lido, arquivo: lido.leArquivo(arquivo, imprimir=False)),
+        ):
+            arquivo = str(self.caminho / nome)
+            grava(grafo, arquivo)
+            grava(grafo, arquivo)  # SOBRESCREVE O ARQUIVO EXISTENTE
+            lido = TGrafoND(armazenamento="esparso")
+            le(lido, arquivo)
+            self.assertEqual(arestas(lido), arestas(grafo))
+            self.assertEqual(dict(lido.livros), grafo.livros)
+        self.assertEqual(sorted(os.listdir(self.caminho)), ["grafo.bkg", "grafo.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
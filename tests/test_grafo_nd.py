@@ -0,0 +1,103 @@
+"""
+Testes do grafo (TGrafoND): leitura do arquivo TXT com tipos de peso fixos e
+resultados das consultas em cache.
+
+Uso:
+    python -m pytest tests
+"""
+
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from loguru import logger
+
+from app.utils.classes.grafo_nd import TGrafoND
+
+GRAFO_TXT = '2\n3\n0 "Dracula"\n1 "Emma"\n2 "Ulysses"\n2\n0 1 3\n1 2 300\n'
+
+
+class TestLeituraArquivo(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logger.disable("app")
+
+    @classmethod
+    def tearDownClass(cls):
+        logger.enable("app")
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.arquivo = str(Path(self.diretorio.name) / "grafo.txt")
+        Path(self.arquivo).write_text(GRAFO_TXT)
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_peso_que_cabe_no_tipo(self):
+        grafo = TGrafoND(armazenamento="denso")
+        self.assertTrue(grafo.leArquivo(self.arquivo, imprimir=False, tipo_peso="uint16"))
+        self.assertEqual(grafo.grafo.peso(1, 2), 300)
+
+    def test_peso_fora_do_tipo_descarta_o_grafo(self):
+        for armazenamento in ("denso", "esparso"):
+            grafo = TGrafoND(armazenamento=armazenamento)
+            with self.assertRaises(OverflowError):
+                grafo.leArquivo(self.arquivo, imprimir=False, tipo_peso="uint8")
+            self.assertEqual(grafo.vertices, 0)
+            self.assertEqual(grafo.livros, {})
+            self.assertEqual(list(grafo.grafo.arestas()), [])
+            self.assertEqual(grafo.componentesConectadas(), ())
+
+    def test_arquivo_inexistente(self):
+        grafo = TGrafoND()
+        self.assertFalse(grafo.leArquivo(self.arquivo + ".nao_existe", imprimir=False))
+
+
+
+class TestCacheConsultas(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logger.disable("app")
+
+    @classmethod
+    def tearDownClass(cls):
+        logger.enable("app")
+
+    def setUp(self):
+        self.grafo = TGrafoND(armazenamento="esparso")
+        for titulo in ("Dracula", "Emma", "Frankenstein", "Ulysses", "Walden"):
+            self.grafo.insereVertice(titulo)
+        self.grafo.insereAresta(0, 1, 3)
+        self.grafo.insereAresta(1, 2, 1)
+        self.grafo.insereAresta(3, 4, 2)
+
+    def test_resultados_em_cache_sao_imutaveis(self):
+        componentes = self.grafo.componentesConectadas()
+        with self.assertRaises(AttributeError):
+            componentes.clear()
+        with self.assertRaises(AttributeError):
+            componentes[0].add(4)
+        _, reduzido = self.grafo.calculaGrafoReduzido("soma")
+        with self.assertRaises(TypeError):
+            reduzido[0][1] = 7
+        _, caminho = self.grafo.menorCaminho(0, 2)
+        self.assertIsInstance(caminho, tuple)
+        self.assertIsInstance(self.grafo.recomenda(1, k=2), tuple)
+
+    def test_acerto_do_cache_devolve_o_mesmo_resultado(self):
+        primeiro = self.grafo.componentesConectadas()
+        segundo = self.grafo.componentesConectadas()
+        self.assertIs(primeiro, segundo)
+        self.assertEqual(sorted(map(sorted, segundo)), [[0, 1, 2], [3, 4]])
+        self.assertEqual(self.grafo.estatisticasCache()["acertos"], 1)
+
+        # UMA ALTERAÇÃO INVALIDA O CACHE
+        self.grafo.insereAresta(2, 3, 1)
+        self.assertEqual(sorted(map(sorted, self.grafo.componentesConectadas())), [[0, 1, 2, 3, 4]])
+        self.assertEqual(self.grafo.calculaGrafoReduzido(), (self.grafo.componentesConectadas(), ((0,),)))
+
+
+if __name__ == "__main__":
+    unittest.main()
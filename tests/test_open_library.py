@@ -0,0 +1,132 @@
+"""
+Testes do cliente do Open Library contra um servidor HTTP local (sem rede).
+
+O servidor responde conforme o título buscado, para simular falhas temporárias,
+limite de requisições (429 com Retry-After) e respostas que não são JSON.
+
+Uso:
+    python -m pytest tests
+"""
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from loguru import logger
+
+from app.utils.get_data.open_library import ClienteOpenLibrary
+
+
+class ServidorStub(BaseHTTPRequestHandler):
+    """Imita /search.json; o comportamento depende do título e do número da requisição."""
+
+    requisicoes = Counter()
+
+    def do_GET(self):
+        titulo = parse_qs(urlparse(self.path).query)["title"][0]
+        self.requisicoes[titulo] += 1
+        numero = self.requisicoes[titulo]
+
+        if titulo == "falha uma vez" and numero == 1:
+            self._responde(503, b"indisponivel")
+        elif titulo == "limite" and numero == 1:
+            self._responde(429, b"devagar", {"Retry-After": "1"})
+        elif titulo == "nao json":
+            self._responde(200, b"<html>erro do proxy</html>", {"Content-Type": "text/html"})
+        elif titulo == "inexistente":
+            self._responde(404, b"")
+        else:
+            corpo = {"docs": [{"title": titulo.title(), "subject": ["Fiction"]}]}
+            self._responde(200, json.dumps(corpo).encode(), {"Content-Type": "application/json"})
+
+    def _responde(self, status, corpo, cabecalhos=None):
+        self.send_response(status)
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestClienteOpenLibrary(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logger.disable("app")
+        cls.servidor = ThreadingHTTPServer(("127.0.0.1", 0), ServidorStub)
+        threading.Thread(target=cls.servidor.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.servidor.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.servidor.shutdown()
+        cls.servidor.server_close()
+        logger.enable("app")
+
+    def setUp(self):
+        ServidorStub.requisicoes.clear()
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.cliente = self.novo_cliente()
+
+    def tearDown(self):
+        self.cliente.fecha()
+        self.diretorio.cleanup()
+
+    def novo_cliente(self):
+        return ClienteOpenLibrary(
+            url_base=self.url,
+            diretorio_cache=self.diretorio.name,
+            requisicoes_por_segundo=0,
+            tentativas=3,
+            espera_inicial=0.01,
+        )
+
+    def test_tenta_de_novo_apos_erro_temporario(self):
+        dados = self.cliente.busca("falha uma vez")
+        self.assertEqual(dados["docs"][0]["title"], "Falha Uma Vez")
+        self.assertEqual(ServidorStub.requisicoes["falha uma vez"], 2)
+
+    def test_respeita_retry_after_do_429(self):
+        inicio = time.monotonic()
+        dados = self.cliente.busca("limite")
+        self.assertIsNotNone(dados)
+        self.assertGreaterEqual(time.monotonic() - inicio, 1.0)
+        self.assertEqual(ServidorStub.requisicoes["limite"], 2)
+
+    def test_erro_definitivo_nao_repete(self):
+        self.assertIsNone(self.cliente.busca("inexistente"))
+        self.assertEqual(ServidorStub.requisicoes["inexistente"], 1)
+
+    def test_resposta_nao_json_nao_interrompe_o_lote(self):
+        resultados = self.cliente.busca_varios(["dracula", "nao json", "emma"])
+        self.assertIsNone(resultados[1])
+        self.assertEqual(ServidorStub.requisicoes["nao json"], 3)
+        self.assertEqual([r["docs"][0]["title"] for r in (resultados[0], resultados[2])], ["Dracula", "Emma"])
+
+    def test_cache_evita_novas_requisicoes(self):
+        self.cliente.busca_varios(["dracula", "emma"])
+        outro = self.novo_cliente()
+        try:
+            # O TÍTULO É NORMALIZADO NA CHAVE DO CACHE (MAIÚSCULAS E ESPAÇOS)
+            dados = outro.busca_varios(["  DRACULA ", "emma"])
+        finally:
+            outro.fecha()
+        self.assertEqual(dados[0]["docs"][0]["title"], "Dracula")
+        self.assertEqual(ServidorStub.requisicoes, Counter({"dracula": 1, "emma": 1}))
+
+    def test_falhas_nao_vao_para_o_cache(self):
+        self.assertIsNone(self.cliente.busca("nao json"))
+        self.assertIsNone(self.cliente.busca("nao json"))
+        self.assertEqual(ServidorStub.requisicoes["nao json"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Testes do histórico de alterações da TGrafoND: desfazer/refazer, snapshots e
+o arquivo delta (gravação apenas das alterações e reaplicação na leitura).
+
+Uso:
+    python -m pytest tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from loguru import logger
+
+from app.utils.classes.grafo_nd import TGrafoND
+from app.utils.classes.versionamento import arquivo_delta
+
+
+def cria_grafo() -> TGrafoND:
+    grafo = TGrafoND(armazenamento="esparso")
+    for titulo in ("Dracula", "Emma", "Frankenstein", "Ulysses"):
+        grafo.insereVertice(titulo)
+    for origem, destino, peso in ((0, 1, 3), (1, 2, 1), (2, 3, 4)):
+        grafo.insereAresta(origem, destino, peso)
+    return grafo
+
+
+def estado(grafo: TGrafoND) -> tuple:
+    """ARESTAS (PELOS NÚMEROS DOS VÉRTICES) E LIVROS DO GRAFO."""
+    vertice = grafo._alocador.vertice
+    arestas = {(*sorted((vertice(i), vertice(j))), peso) for i, j, peso in grafo.grafo.arestas()}
+    return arestas, dict(grafo.livros)
+
+
+class TestDesfazerRefazer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logger.disable("app")
+
+    @classmethod
+    def tearDownClass(cls):
+        logger.enable("app")
+
+    def setUp(self):
+        self.grafo = cria_grafo()
+
+    def test_desfaz_e_refaz_cada_tipo_de_alteracao(self):
+        alteracoes = (
+            lambda g: g.insereVertice("Walden"),
+            lambda g: g.insereAresta(0, 3, 9),
+            lambda g: g.insereAresta(0, 1, 8),  # ALTERA O PESO DE UMA ARESTA EXISTENTE
+            lambda g: g.removeAresta(1, 2),
+            lambda g: g.removeVertice(2),  # LEVA AS ARESTAS E O TÍTULO DO VÉRTICE
+        )
+        for alteracao in alteracoes:
+            antes = estado(self.grafo)
+            alteracao(self.grafo)
+            depois = estado(self.grafo)
+            self.assertNotEqual(depois, antes)
+
+            self.assertTrue(self.grafo.desfazer())
+            self.assertEqual(estado(self.grafo), antes)
+            self.assertTrue(self.grafo.refazer())
+            self.assertEqual(estado(self.grafo), depois)
+
+    def test_desfazer_tudo_e_refazer_tudo(self):
+        inicial = estado(TGrafoND(armazenamento="esparso"))
+        final = estado(self.grafo)
+        while self.grafo.desfazer():
+            pass
+        self.assertEqual(estado(self.grafo), inicial)
+        while self.grafo.refazer():
+            pass
+        self.assertEqual(estado(self.grafo), final)
+        self.assertFalse(self.grafo.refazer())
+
+    def test_nova_alteracao_descarta_o_que_podia_ser_refeito(self):
+        self.grafo.insereAresta(0, 2, 5)
+        self.grafo.desfazer()
+        self.grafo.insereAresta(0, 3, 6)
+        self.assertFalse(self.grafo.refazer())
+        self.assertIn((0, 3, 6), estado(self.grafo)[0])
+        self.assertNotIn((0, 2, 5), estado(self.grafo)[0])
+
+    def test_snapshots(self):
+        versao = self.grafo.snapshot()
+        antes = estado(self.grafo)
+        self.grafo.removeVertice(1)
+        self.grafo.insereAresta(0, 3, 2)
+        depois, versao_depois = estado(self.grafo), self.grafo.snapshot()
+
+        self.grafo.restauraSnapshot(versao)
+        self.assertEqual(estado(self.grafo), antes)
+        self.grafo.restauraSnapshot(versao_depois)
+        self.assertEqual(estado(self.grafo), depois)
+
+        # A VERSÃO DESFEITA E SUBSTITUÍDA POR OUTRA ALTERAÇÃO É DESCARTADA
+        self.grafo.restauraSnapshot(versao)
+        self.grafo.insereVertice("Walden")
+        with self.assertRaises(ValueError):
+            self.grafo.restauraSnapshot(versao_depois)
+
+    def test_componentes_acompanham_o_desfazer(self):
+        self.grafo.removeAresta(1, 2)
+        self.assertEqual(self.grafo.tipo_conexidade(), 1)
+        self.grafo.desfazer()
+        self.assertEqual(self.grafo.tipo_conexidade(), 0)
+        self.assertEqual(len(self.grafo.componentesConectadas()), 1)
+
+
+class TestArquivoDelta(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logger.disable("app")
+
+    @classmethod
+    def tearDownClass(cls):
+        logger.enable("app")
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = Path(self.diretorio.name)
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def altera(self, grafo: TGrafoND):
+        grafo.insereVertice("Walden")
+        grafo.insereAresta(4, 0, 7)
+        grafo.removeVertice(2)
+        grafo.insereAresta(0, 1, 1)
+        grafo.insereAresta(1, 3, 5)
+        grafo.desfazer()  # O DESFAZER TAMBÉM VAI PARA O DELTA
+
+    def test_delta_reaplicado_na_leitura(self):
+        for nome, grava, le in (
+            ("grafo.txt", TGrafoND.gravarGrafo, lambda g, arquivo: g.leArquivo(arquivo, imprimir=False)),
+            ("grafo.bkg", TGrafoND.gravarBinario, TGrafoND.abreBinario),
+        ):
+            arquivo = str(self.caminho / nome)
+            grafo = cria_grafo()
+            grava(grafo, arquivo)
+            self.altera(grafo)
+            grafo.gravarDelta()
+            self.assertTrue(os.path.exists(arquivo_delta(arquivo)))
+
+            lido = TGrafoND(armazenamento="esparso")
+            self.assertTrue(le(lido, arquivo))
+            self.assertEqual(estado(lido), estado(grafo), nome)
+            self.assertFalse(lido.desfazer())  # O HISTÓRICO RECOMEÇA NA LEITURA
+
+    def test_deltas_acumulados_e_descartados_na_gravacao_completa(self):
+        arquivo = str(self.caminho / "grafo.txt")
+        grafo = cria_grafo()
+        grafo.gravarGrafo(arquivo)
+        grafo.insereAresta(0, 2, 2)
+        grafo.gravarDelta()
+        grafo.removeAresta(0, 1)
+        grafo.gravarDelta()
+        with open(arquivo_delta(arquivo)) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        lido = TGrafoND(armazenamento="esparso")
+        lido.leArquivo(arquivo, imprimir=False)
+        self.assertEqual(estado(lido), estado(grafo))
+
+        # A GRAVAÇÃO COMPLETA JÁ CONTÉM AS ALTERAÇÕES: O DELTA É REMOVIDO
+        lido.gravarGrafo(arquivo)
+        self.assertFalse(os.path.exists(arquivo_delta(arquivo)))
+        relido = TGrafoND(armazenamento="esparso")
+        relido.leArquivo(arquivo, imprimir=False)
+        self.assertEqual(estado(relido), estado(grafo))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Testes do alocador de posições dos vértices (lápides e reaproveitamento de
+posições) e da compactação do grafo (`TGrafoND.compactar`).
+
+Uso:
+    python -m pytest tests
+"""
+
+import unittest
+
+from loguru import logger
+
+from app.utils.classes.grafo_nd import TGrafoND
+from app.utils.classes.vertices import AlocadorVertices
+
+
+class TestAlocadorVertices(unittest.TestCase):
+    def test_modo_sequencial_sem_mapas(self):
+        alocador = AlocadorVertices(3)
+        self.assertEqual(alocador.aloca(), (3, 3))
+        self.assertIsNone(alocador._ids)
+        self.assertEqual(list(alocador.ids()), [0, 1, 2, 3])
+        self.assertEqual(alocador.slot(2), 2)
+
+    def test_lapide_e_reaproveitada(self):
+        alocador = AlocadorVertices(4)
+        self.assertEqual(alocador.libera(1), 1)
+        self.assertEqual((len(alocador), alocador.capacidade, alocador.lapides), (3, 4, 1))
+        self.assertNotIn(1, alocador)
+        self.assertIsNone(alocador.vertice(1))
+
+        # O NOVO VÉRTICE GANHA UM NÚMERO NOVO, MAS OCUPA A POSIÇÃO DA LÁPIDE
+        self.assertEqual(alocador.aloca(), (4, 1))
+        self.assertEqual((alocador.capacidade, alocador.lapides), (4, 0))
+        self.assertEqual(alocador.aloca(), (5, 4))
+
+    def test_identificador_repetido_ou_inexistente(self):
+        alocador = AlocadorVertices(2)
+        with self.assertRaises(ValueError):
+            alocador.aloca(1)
+        with self.assertRaises(ValueError):
+            alocador.slot(7)
+        alocador.libera(0)
+        with self.assertRaises(ValueError):
+            alocador.libera(0)
+
+    def test_compacta_mantem_os_identificadores(self):
+        alocador = AlocadorVertices(5)
+        alocador.libera(1)
+        alocador.libera(3)
+        self.assertEqual(alocador.compacta(), [0, None, 1, None, 2])
+        self.assertEqual(list(alocador.slotsAtivos()), [(0, 0), (1, 2), (2, 4)])
+        self.assertEqual((alocador.capacidade, alocador.lapides), (3, 0))
+        self.assertEqual(alocador.aloca(), (5, 3))
+
+
+class TestCompactarGrafo(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logger.disable("app")
+
+    @classmethod
+    def tearDownClass(cls):
+        logger.enable("app")
+
+    def cria_grafo(self, armazenamento: str) -> TGrafoND:
+        grafo = TGrafoND(armazenamento=armazenamento)
+        for titulo in ("Dracula", "Emma", "Frankenstein", "Ulysses", "Walden"):
+            grafo.insereVertice(titulo)
+        for origem, destino, peso in ((0, 1, 3), (1, 2, 1), (2, 3, 4), (3, 4, 2), (0, 4, 5)):
+            grafo.insereAresta(origem, destino, peso)
+        return grafo
+
+    def arestas(self, grafo: TGrafoND) -> set:
+        vertice = grafo._alocador.vertice
+        return {(*sorted((vertice(i), vertice(j))), peso) for i, j, peso in grafo.grafo.arestas()}
+
+    def test_remocao_deixa_lapide_e_insercao_a_reaproveita(self):
+        for armazenamento in ("denso", "esparso"):
+            grafo = self.cria_grafo(armazenamento)
+            grafo.removeVertice(2)
+            self.assertEqual((grafo.vertices, len(grafo.grafo), grafo._alocador.lapides), (4, 5, 1))
+            self.assertEqual(self.arestas(grafo), {(0, 1, 3), (3, 4, 2), (0, 4, 5)})
+
+            novo = grafo.insereVertice("Walden Two")
+            grafo.insereAresta(novo, 1, 7)
+            self.assertEqual(novo, 5)
+            self.assertEqual((len(grafo.grafo), grafo._alocador.lapides), (5, 0), armazenamento)
+            self.assertEqual(grafo.grafo.grau(grafo._slot(novo)), 1)
+            self.assertEqual(grafo.livros[novo], "Walden Two")
+
+    def test_compactar_elimina_lapides_sem_renumerar(self):
+        for armazenamento in ("denso", "esparso"):
+            grafo = self.cria_grafo(armazenamento)
+            grafo.recomenda(0, k=2)  # CRIA O ÍNDICE DOS VIZINHOS MAIS SIMILARES
+            grafo.removeVertice(1)
+            grafo.removeVertice(3)
+            antes = self.arestas(grafo)
+
+            grafo.compactar()
+            self.assertEqual((len(grafo.grafo), grafo._alocador.lapides), (3, 0), armazenamento)
+            self.assertEqual(self.arestas(grafo), antes)
+            self.assertEqual(grafo.livros, {0: "Dracula", 2: "Frankenstein", 4: "Walden"})
+            self.assertEqual([v for v, _ in grafo.recomenda(0, k=2)], [4])
+            self.assertEqual(grafo.tipo_conexidade(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()